@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ein Commit pro Event vs. ein Commit pro Batch
+
+Der Fake-Store berechnet pro Commit feste Kosten (wie ein Sync des
+Kalender-Daemons). Verglichen werden einzelne create_event/delete_event
+Aufrufe mit save_events/delete_events bei verschiedenen Batch-Größen.
+
+    python benchmarks/bench_batch_commits.py
+"""
+
+import time
+from datetime import datetime, timedelta
+
+from fake_eventkit import make_client
+
+EVENTS = 2000
+COMMIT_COST_US = 300.0
+
+
+def make_events():
+    now = datetime.now()
+    return [
+        {'title': f"Termin {i}", 'start_date': now + timedelta(hours=i),
+         'end_date': now + timedelta(hours=i, minutes=30), 'location': 'Raum 1'}
+        for i in range(EVENTS)
+    ]
+
+
+def new_client():
+    client = make_client()
+    client.event_store.commit_cost_us = COMMIT_COST_US
+    client.event_store.add_calendar('Ziel')
+    return client
+
+
+def bench_single(events):
+    client = new_client()
+    start = time.perf_counter()
+    for event in events:
+        client.create_event('Ziel', event['title'], event['start_date'], event['end_date'],
+                            location=event['location'])
+    create_time = time.perf_counter() - start
+    created = client.get_events('Ziel')
+
+    start = time.perf_counter()
+    for event in created:
+        client.delete_event('Ziel', event)
+    delete_time = time.perf_counter() - start
+    return create_time, delete_time, client.event_store.commits
+
+
+def bench_batched(events, batch_size):
+    client = new_client()
+    start = time.perf_counter()
+    results = client.save_events('Ziel', events, batch_size)
+    create_time = time.perf_counter() - start
+    assert all(result['success'] for result in results)
+    created = client.get_events('Ziel')
+
+    start = time.perf_counter()
+    results = client.delete_events('Ziel', created, batch_size)
+    delete_time = time.perf_counter() - start
+    assert all(result['success'] for result in results)
+    return create_time, delete_time, client.event_store.commits
+
+
+def main():
+    events = make_events()
+    print(f"{EVENTS} Events, {COMMIT_COST_US:.0f} µs pro Commit")
+    print(f"{'Modus':>14} {'Erstellen [s]':>14} {'Löschen [s]':>12} {'Commits':>8} {'Events/s':>10}")
+
+    create_time, delete_time, commits = bench_single(events)
+    print(f"{'einzeln':>14} {create_time:>14.3f} {delete_time:>12.3f} {commits:>8} {EVENTS / create_time:>10.0f}")
+
+    for batch_size in (10, 100, 500):
+        create_time, delete_time, commits = bench_batched(events, batch_size)
+        print(f"{'Batch ' + str(batch_size):>14} {create_time:>14.3f} {delete_time:>12.3f} "
+              f"{commits:>8} {EVENTS / create_time:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
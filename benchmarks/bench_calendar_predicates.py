@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Kalender-Filter im Predicate vs. Filtern in Python
+
+Vergleicht den alten Pfad (Predicate mit calendars=None, Filter über
+event.calendar().title()) mit get_events/get_events_for_calendars bei
+wachsender Anzahl fremder Kalender.
+
+    python benchmarks/bench_calendar_predicates.py
+"""
+
+import time
+from datetime import datetime, timedelta
+
+from fake_eventkit import make_client
+
+EVENTS_PER_CALENDAR = 500
+
+
+def legacy_get_events(client, calendar_name, start_date, end_date):
+    """Nachbau des bisherigen Pfads: alle Kalender laden, in Python filtern"""
+    predicate = client.event_store.predicateForEventsWithStartDate_endDate_calendars_(
+        client._datetime_to_nsdate(start_date), client._datetime_to_nsdate(end_date), None
+    )
+    result = []
+    for event in client.event_store.eventsMatchingPredicate_(predicate):
+        if event.calendar().title() == calendar_name:
+            result.append(client._convert_event(event))
+    return result
+
+
+def build_store(client, unrelated_calendars):
+    now = datetime.now().timestamp()
+    titles = ['Quelle', 'Ziel'] + [f"Abo {i}" for i in range(unrelated_calendars)]
+    for title in titles:
+        calendar = client.event_store.add_calendar(title)
+        for i in range(EVENTS_PER_CALENDAR):
+            client.event_store.add_event(calendar, f"{title} Termin {i}", now + i * 3600)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    start_date = datetime.now() - timedelta(days=365)
+    end_date = datetime.now() + timedelta(days=365)
+
+    print(f"{'fremde Kalender':>16} {'alt [s]':>10} {'neu [s]':>10} {'Faktor':>8} {'2 Kal. [s]':>11}")
+    for unrelated in (0, 5, 20, 50):
+        client = make_client()
+        build_store(client, unrelated)
+
+        legacy_time, legacy = timed(legacy_get_events, client, 'Quelle', start_date, end_date)
+        new_time, new = timed(client.get_events, 'Quelle', start_date, end_date)
+        multi_time, grouped = timed(client.get_events_for_calendars, ['Quelle', 'Ziel'], start_date, end_date)
+
+        assert len(legacy) == len(new) == len(grouped['Quelle']) == EVENTS_PER_CALENDAR
+        print(f"{unrelated:>16} {legacy_time:>10.3f} {new_time:>10.3f} "
+              f"{legacy_time / new_time:>7.1f}x {multi_time:>11.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Speicher pro Event - zwei Dictionary-Schichten vs. CalendarEvent
+
+Nachgebaut wird der frühere Ladepfad (_convert_event_to_dict plus die
+Kopie in SimpleCalendarClient.get_events, beide gleichzeitig im Speicher)
+und mit dem heutigen CalendarEvent-Pfad verglichen.
+
+    python benchmarks/bench_event_memory.py [ANZAHL]
+"""
+
+import sys
+import tracemalloc
+from datetime import datetime
+
+from fake_eventkit import make_client
+
+DEFAULT_EVENTS = 100_000
+
+
+def legacy_load(client, raw_events):
+    """Früherer Pfad: EventKit-Dict + zweites Dict mit Duplikat-Schlüsseln"""
+    first_layer = []
+    for event in raw_events:
+        first_layer.append({
+            'title': event.title() or '',
+            'start_date': client._nsdate_to_datetime(event.startDate()),
+            'end_date': client._nsdate_to_datetime(event.endDate()),
+            'description': event.notes() or '',
+            'location': event.location() or '',
+            'all_day': event.isAllDay(),
+            'recurrence': '',
+            'calendar': event.calendar().title() if event.calendar() else '',
+            'id': event.eventIdentifier() or ''
+        })
+    second_layer = []
+    for event in first_layer:
+        title = event.get('title', '')
+        second_layer.append({
+            'summary': title,
+            'title': title,
+            'start_date': event.get('start_date'),
+            'end_date': event.get('end_date'),
+            'description': event.get('description', ''),
+            'location': event.get('location', ''),
+            'allday_event': event.get('all_day', False),
+            'modified_date': event.get('start_date', datetime.now()),
+            'id': event.get('id', '')
+        })
+    return first_layer, second_layer
+
+
+def record_load(client, raw_events):
+    return [client._convert_event(event, 'Quelle') for event in raw_events]
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    result = func(*args)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_EVENTS
+    client = make_client()
+    client.event_store.accessor_cost_us = 0
+    calendar = client.event_store.add_calendar('Quelle')
+    now = datetime.now().timestamp()
+    locations = ['Raum 1', 'Raum 2', 'Online', '']
+    for i in range(count):
+        # Wenige verschiedene Titel, wie bei wiederkehrenden Terminen
+        client.event_store.add_event(calendar, f"Termin {i % 200}", now + i * 900, location=locations[i % 4])
+    raw_events = client.event_store.events
+
+    legacy_bytes, legacy = measure(legacy_load, client, raw_events)
+    del legacy
+    record_bytes, records = measure(record_load, client, raw_events)
+
+    print(f"{count} Events")
+    print(f"  zwei Dict-Schichten: {legacy_bytes / count:8.0f} Bytes/Event")
+    print(f"  CalendarEvent:       {record_bytes / count:8.0f} Bytes/Event")
+    print(f"  Ersparnis:           {100 * (1 - record_bytes / legacy_bytes):7.0f} %")
+
+
+if __name__ == '__main__':
+    main()
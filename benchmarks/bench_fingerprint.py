@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Inhalts-Fingerprints
+
+Misst die Kosten der Fingerprint-Berechnung pro Event und vergleicht
+die Änderungserkennung (Feld-für-Feld vs. Digest-Vergleich) sowie die
+Duplikatsuche im Modus STRICT vs. EXACT.
+
+    python benchmarks/bench_fingerprint.py [ANZAHL]
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from duplicate_engine import DuplicateCheckMode, group_duplicates  # noqa: E402
+from event_record import CalendarEvent  # noqa: E402
+
+DEFAULT_EVENTS = 200_000
+COMPARED_KEYS = ('title', 'start_date', 'end_date', 'location', 'all_day', 'description', 'recurrence')
+
+
+def make_events(count, start):
+    # Je drei aufeinanderfolgende Events sind inhaltsgleich
+    return [
+        CalendarEvent(id=f"EV-{i}", title=f"Termin {(i // 3) % 500}", start_ts=start + (i // 3) * 3600,
+                      end_ts=start + (i // 3) * 3600 + 1800, location='Raum 1',
+                      description='Agenda: Status, Planung, Sonstiges', calendar='Quelle')
+        for i in range(count)
+    ]
+
+
+def fields_equal(first, second):
+    """Früherer Weg: jedes Feld einzeln vergleichen"""
+    return all(first[key] == second[key] for key in COMPARED_KEYS)
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_EVENTS
+    start = datetime.now().timestamp()
+    events = make_events(count, start)
+    copies = make_events(count, start)
+    print(f"{count} Events")
+
+    elapsed, _ = timed(lambda: [event.fingerprint for event in events])
+    print(f"Fingerprint berechnen:        {elapsed:>7.3f} s  ({elapsed / count * 1e6:.2f} µs/Event)")
+    elapsed, _ = timed(lambda: [event.fingerprint for event in events])
+    print(f"Fingerprint erneut lesen:     {elapsed:>7.3f} s  ({elapsed / count * 1e6:.2f} µs/Event)")
+    for event in copies:
+        event.fingerprint
+
+    elapsed, equal = timed(lambda: sum(fields_equal(a, b) for a, b in zip(events, copies)))
+    print(f"Vergleich Feld für Feld:      {elapsed:>7.3f} s  ({equal} gleich)")
+    elapsed, equal = timed(lambda: sum(a.same_content(b) for a, b in zip(events, copies)))
+    print(f"Vergleich per Digest:         {elapsed:>7.3f} s  ({equal} gleich)")
+
+    for label, mode in (('STRICT', DuplicateCheckMode.STRICT), ('EXACT', DuplicateCheckMode.EXACT)):
+        elapsed, groups = timed(lambda: group_duplicates(events, mode))
+        print(f"Duplikatsuche {label:<6}:        {elapsed:>7.3f} s  ({len(groups)} Gruppen)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Zeit bis zu den ersten Zeilen im manuellen Tab
+
+Vergleicht das Laden als Gesamtliste (get_events, die Tabelle bleibt bis
+zum Ende leer) mit dem blockweisen Laden wie im StreamingWorker
+(iter_events, erster Block nach höchstens STREAM_INTERVAL Sekunden oder
+STREAM_CHUNK_SIZE Events).
+
+    python benchmarks/bench_first_rows.py [EVENTS]
+"""
+
+import sys
+import time
+from datetime import datetime
+
+from fake_eventkit import make_client
+from event_record import LIST_FIELDS
+from simple_calendar_client import SimpleCalendarClient, SyncMode
+
+EVENTS = 20_000
+# Wie in simple_gui
+STREAM_CHUNK_SIZE = 500
+STREAM_INTERVAL = 0.1
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else EVENTS
+    backend = make_client()
+    calendar = backend.event_store.add_calendar('Quelle')
+    now = datetime.now().timestamp()
+    step = 360 * 86400 / count
+    for i in range(count):
+        backend.event_store.add_event(calendar, f"Termin {i}", now + 3600 + i * step, location='Raum 1')
+    client = SimpleCalendarClient(backend=backend)
+
+    start = time.perf_counter()
+    events = client.get_events('Quelle', SyncMode.FUTURE, LIST_FIELDS)
+    full = time.perf_counter() - start
+
+    start = time.perf_counter()
+    first = None
+    block = []
+    last_emit = start
+    streamed = 0
+    for event in client.iter_events('Quelle', SyncMode.FUTURE, LIST_FIELDS):
+        block.append(event)
+        streamed += 1
+        if len(block) >= STREAM_CHUNK_SIZE or time.perf_counter() - last_emit >= STREAM_INTERVAL:
+            if first is None:
+                first = time.perf_counter() - start
+            block = []
+            last_emit = time.perf_counter()
+    total = time.perf_counter() - start
+
+    print(f"{len(events)} Events ({streamed} gestreamt)")
+    print(f"{'Laden':>12} {'erste Zeilen [s]':>17} {'komplett [s]':>13}")
+    print(f"{'Gesamtliste':>12} {full:>17.3f} {full:>13.3f}")
+    print(f"{'blockweise':>12} {first or total:>17.3f} {total:>13.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Bridge-Aufrufe pro Event mit und ohne Feldauswahl
+
+Zählt die Accessor-Aufrufe auf dem Fake-Store für einen vollständigen
+Ladevorgang (ALL_FIELDS) und für die Feldauswahl der Duplikatsuche
+(DEDUP_FIELDS) und misst die Ladezeit.
+
+    python benchmarks/bench_projection.py
+"""
+
+import time
+from datetime import datetime
+
+import fake_eventkit
+from fake_eventkit import make_client
+from event_record import ALL_FIELDS, DEDUP_FIELDS, LIST_FIELDS
+
+EVENTS = 20_000
+
+
+def count_calls(client, fields):
+    calls = [0]
+    original = fake_eventkit.FakeEvent._cost
+
+    def counting_cost(event):
+        calls[0] += 1
+        original(event)
+
+    fake_eventkit.FakeEvent._cost = counting_cost
+    try:
+        start = time.perf_counter()
+        events = client.get_events('Quelle', fields=fields)
+        elapsed = time.perf_counter() - start
+    finally:
+        fake_eventkit.FakeEvent._cost = original
+    return calls[0] / len(events), elapsed
+
+
+def main():
+    client = make_client()
+    calendar = client.event_store.add_calendar('Quelle')
+    now = datetime.now().timestamp()
+    for i in range(EVENTS):
+        event = client.event_store.add_event(calendar, f"Termin {i}", now + i * 900, location='Raum 1')
+        event._notes = 'Agenda ' * 200
+
+    print(f"{EVENTS} Events")
+    print(f"{'Felder':>14} {'Aufrufe/Event':>14} {'Zeit [s]':>9}")
+    for name, fields in (('ALL_FIELDS', ALL_FIELDS), ('LIST_FIELDS', LIST_FIELDS), ('DEDUP_FIELDS', DEDUP_FIELDS)):
+        calls, elapsed = count_calls(client, fields)
+        print(f"{name:>14} {calls:>14.1f} {elapsed:>9.3f}")
+
+
+if __name__ == '__main__':
+    main()
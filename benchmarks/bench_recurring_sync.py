@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Sync eines terminlastigen Kalenders mit Serien
+
+Der Quellkalender enthält SERIES wöchentliche Serien (z.B. Jour fixe,
+Standups an drei Tagen) plus einige Ausnahmen. Gemessen werden die
+gelieferten Vorkommen, die geschriebenen Events, Commits und die Größe
+des Zielkalenders (gespeicherte Events vs. sichtbare Vorkommen).
+
+    python benchmarks/bench_recurring_sync.py [SERIES]
+"""
+
+import logging
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from memory_backend import InMemoryCalendarBackend  # noqa: E402
+from simple_calendar_client import SimpleCalendarClient, SyncMode  # noqa: E402
+from sync_state import SyncStateStore  # noqa: E402
+
+SERIES = 200
+RULES = ('FREQ=WEEKLY;INTERVAL=1', 'FREQ=WEEKLY;INTERVAL=1;BYDAY=MO,WE,FR', 'FREQ=WEEKLY;INTERVAL=2')
+
+
+def make_backend(count):
+    backend = InMemoryCalendarBackend()
+    backend.add_calendar('Ziel')
+    start = (datetime.now() - timedelta(days=300)).replace(minute=0, second=0, microsecond=0)
+    series = [
+        {'title': f"Meeting {i}", 'start_date': start + timedelta(hours=i % 9, days=i % 5),
+         'end_date': start + timedelta(hours=i % 9, days=i % 5, minutes=30),
+         'location': 'Raum 1', 'recurrence_rule': RULES[i % len(RULES)]}
+        for i in range(count)
+    ]
+    ids = backend.add_events('Quelle', series)
+
+    # Jede zehnte Serie: ein Vorkommen um eine Stunde verschoben
+    for series_id in ids[::10]:
+        occurrence = backend.get_events('Quelle', datetime.now(), datetime.now() + timedelta(days=14))
+        occurrence = next(event for event in occurrence if event.id == series_id)
+        moved = occurrence.start_date + timedelta(hours=1)
+        backend.add_exception('Quelle', series_id, occurrence.start_ts,
+                              {'start_date': moved, 'end_date': moved + timedelta(minutes=30)})
+    return backend
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else SERIES
+    logging.disable(logging.WARNING)
+
+    backend = make_backend(count)
+    client = SimpleCalendarClient(backend=backend, sync_state=SyncStateStore(':memory:'))
+    occurrences = len(backend.get_events('Quelle'))
+    print(f"{count} Serien, {occurrences} Vorkommen im Sync-Zeitraum")
+
+    print(f"{'Lauf':>10} {'Zeit [s]':>10} {'geschrieben':>12} {'Commits':>8} {'gespeichert':>12} {'Vorkommen':>10}")
+    for label in ('erster', 'zweiter'):
+        commits = backend.commits
+        start = time.perf_counter()
+        written = client.sync_calendars('Quelle', 'Ziel', SyncMode.ALL)
+        elapsed = time.perf_counter() - start
+        target = backend._calendars['Ziel']
+        stored = len(target.events) + len(target.series)
+        print(f"{label:>10} {elapsed:>10.2f} {written:>12} {backend.commits - commits:>8} {stored:>12} "
+              f"{len(backend.get_events('Ziel')):>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Typische GUI-Sitzung mit und ohne Snapshot-Cache
+
+Eine Sitzung: Quellkalender im manuellen Tab laden, Zielkalender für die
+Duplikatprüfung laden, synchronisieren, Duplikate im Ziel suchen, zwei
+Duplikate löschen und (wie der Bereinigungs-Tab) erneut suchen. Jeder
+Lese-Aufruf kostet LATENCY_MS (Bridge-Aufruf, Predicate).
+
+    python benchmarks/bench_session_cache.py [EVENTS]
+"""
+
+import logging
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from duplicate_engine import group_duplicate_series, series_check_fields  # noqa: E402
+from event_record import DEDUP_FIELDS, LIST_FIELDS  # noqa: E402
+from memory_backend import InMemoryCalendarBackend  # noqa: E402
+from simple_calendar_client import SimpleCalendarClient, SyncMode, DuplicateCheckMode  # noqa: E402
+from snapshot_cache import SnapshotCache  # noqa: E402
+
+EVENTS = 20_000
+LATENCY_MS = 20.0
+
+
+def make_backend(count):
+    backend = InMemoryCalendarBackend(call_latency_ms=LATENCY_MS)
+    start = (datetime.now() - timedelta(days=360)).timestamp()
+    step = 720 * 86400 / count
+    events = [
+        {'title': f"Termin {i % 500}", 'start_date': start + i * step, 'end_date': start + i * step + 1800}
+        for i in range(count)
+    ]
+    backend.add_events('Quelle', events)
+    backend.add_events('Ziel', events[::4] + events[:20:10])
+    return backend
+
+
+def session(client):
+    mode = DuplicateCheckMode.MODERATE
+    client.get_events('Quelle', SyncMode.FUTURE, LIST_FIELDS)
+    client.get_events('Ziel', SyncMode.ALL, DEDUP_FIELDS)
+    client.sync_calendars('Quelle', 'Ziel', SyncMode.ALL, mode)
+    groups, _ = group_duplicate_series(client.iter_events('Ziel', SyncMode.ALL, series_check_fields(mode)), mode)
+    client.delete_events('Ziel', [group[-1] for _, group in groups])
+    group_duplicate_series(client.iter_events('Ziel', SyncMode.ALL, series_check_fields(mode)), mode)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else EVENTS
+    logging.disable(logging.WARNING)
+
+    print(f"{count} Quell-Events, {LATENCY_MS:.0f} ms pro Lese-Aufruf")
+    print(f"{'Cache':>8} {'Zeit [s]':>10} {'Lese-Aufrufe':>13}")
+    for label, snapshots in (('ohne', None), ('mit', SnapshotCache())):
+        backend = make_backend(count)
+        calls = [0]
+        get_events = backend.get_events
+
+        def counted(*args, **kwargs):
+            calls[0] += 1
+            return get_events(*args, **kwargs)
+
+        backend.get_events = counted
+        client = SimpleCalendarClient(backend=backend, snapshots=snapshots)
+        start = time.perf_counter()
+        session(client)
+        print(f"{label:>8} {time.perf_counter() - start:>10.2f} {calls[0]:>13}")
+
+
+if __name__ == '__main__':
+    main()
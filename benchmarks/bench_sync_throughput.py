@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Sync-Durchsatz mit dem In-Memory-Backend
+
+Läuft ohne macOS. Der Quellkalender enthält EVENTS Events über den
+Sync-Zeitraum verteilt, der Zielkalender bereits einen Teil davon.
+Gemessen wird ein vollständiger sync_calendars-Lauf (Duplikat-Index,
+gestreamtes Laden, Erstellen in Batches) und ein zweiter Lauf, bei dem
+alles bereits synchron ist - jeweils ohne und mit persistentem
+Sync-Status (SQLite in einem temporären Verzeichnis).
+
+    python benchmarks/bench_sync_throughput.py [EVENTS]
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from memory_backend import InMemoryCalendarBackend  # noqa: E402
+from simple_calendar_client import SimpleCalendarClient, SyncMode, DuplicateCheckMode  # noqa: E402
+from sync_state import SyncStateStore  # noqa: E402
+
+EVENTS = 1_000_000
+EXISTING_FRACTION = 0.25
+COMMIT_COST_MS = 0.0
+
+
+def make_backend(count):
+    backend = InMemoryCalendarBackend(commit_cost_ms=COMMIT_COST_MS)
+    # Gleichmäßig über ±360 Tage verteilt, 500 verschiedene Titel
+    start = (datetime.now() - timedelta(days=360)).timestamp()
+    step = 720 * 86400 / count
+    events = [
+        {'title': f"Termin {i % 500}", 'start_date': start + i * step, 'end_date': start + i * step + 1800,
+         'location': 'Raum 1'}
+        for i in range(count)
+    ]
+    backend.add_events('Quelle', events)
+    backend.add_events('Ziel', events[::int(1 / EXISTING_FRACTION)])
+    return backend
+
+
+def run(label, count, sync_state):
+    start = time.perf_counter()
+    backend = make_backend(count)
+    setup_time = time.perf_counter() - start
+    client = SimpleCalendarClient(backend=backend, sync_state=sync_state)
+    print(f"{label}: {count} Quell-Events, {len(backend.get_events('Ziel'))} bereits im Ziel "
+          f"(Aufbau {setup_time:.1f} s)")
+
+    print(f"{'Lauf':>10} {'Zeit [s]':>10} {'erstellt':>10} {'Commits':>8} {'Events/s':>10}")
+    for run_label in ('erster', 'zweiter'):
+        commits = backend.commits
+        start = time.perf_counter()
+        created = client.sync_calendars('Quelle', 'Ziel', SyncMode.ALL, DuplicateCheckMode.MODERATE)
+        elapsed = time.perf_counter() - start
+        print(f"{run_label:>10} {elapsed:>10.2f} {created:>10} {backend.commits - commits:>8} "
+              f"{count / elapsed:>10.0f}")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else EVENTS
+    logging.disable(logging.WARNING)
+
+    run('ohne Sync-Status', count, None)
+    with tempfile.TemporaryDirectory() as directory:
+        sync_state = SyncStateStore(os.path.join(directory, 'sync_state.db'))
+        run('mit Sync-Status', count, sync_state)
+        sync_state.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,500 @@
+#!/usr/bin/env python3
+"""
+Stand-in für EventKit/Foundation, damit Benchmarks ohne macOS laufen
+
+Der Fake-Store bildet nur die Teile der EventKit-API nach, die
+calendar_client_eventkit verwendet. Kosten für Bridge-Aufrufe und
+Commits werden per Busy-Wait simuliert, damit sich Unterschiede in der
+Anzahl der Aufrufe auch in den Laufzeiten zeigen.
+
+Serien werden wie in EventKit als ein Event gespeichert und beim Abfragen
+in Vorkommen (eigene Objekte mit gleichem eventIdentifier) aufgefächert.
+"""
+
+import os
+import sys
+import time
+import itertools
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import calendar_client_eventkit  # noqa: E402
+from recurrence import RecurrenceRule, FREQUENCIES  # noqa: E402
+
+
+def _spin(microseconds: float):
+    """Simuliert Rechenzeit ohne zu schlafen (genauer als time.sleep)"""
+    if microseconds <= 0:
+        return
+    end = time.perf_counter() + microseconds / 1_000_000
+    while time.perf_counter() < end:
+        pass
+
+
+class FakeNSDate:
+    __slots__ = ('_ts',)
+
+    def __init__(self, ts):
+        self._ts = ts
+
+    @staticmethod
+    def dateWithTimeIntervalSince1970_(ts):
+        return FakeNSDate(ts)
+
+    def timeIntervalSince1970(self):
+        return self._ts
+
+
+class FakeNotificationCenter:
+    def __init__(self):
+        self.observers = []
+
+    def addObserverForName_object_queue_usingBlock_(self, name, obj, queue, block):
+        self.observers.append((name, obj, block))
+        return block
+
+    def postNotificationName_object_(self, name, obj):
+        for observed_name, observed_obj, block in list(self.observers):
+            if observed_name == name and (observed_obj is None or observed_obj is obj):
+                block(None)
+
+
+class FakeFoundation:
+    NSDate = FakeNSDate
+    _center = FakeNotificationCenter()
+
+    class NSNotificationCenter:
+        @staticmethod
+        def defaultCenter():
+            return FakeFoundation._center
+
+
+class FakeCalendar:
+    _ids = itertools.count(1)
+
+    def __init__(self, title, writable=True):
+        self._title = title
+        self._identifier = f"CAL-{next(self._ids)}"
+        self._writable = writable
+
+    def title(self):
+        return self._title
+
+    def calendarIdentifier(self):
+        return self._identifier
+
+    def allowsContentModifications(self):
+        return self._writable
+
+
+class FakeRecurrenceDayOfWeek:
+    def __init__(self, day, week_number=0):
+        self._day = day
+        self._week_number = week_number
+
+    @staticmethod
+    def dayOfWeek_(day):
+        return FakeRecurrenceDayOfWeek(day)
+
+    def dayOfTheWeek(self):
+        return self._day
+
+    def weekNumber(self):
+        return self._week_number
+
+
+class FakeRecurrenceEnd:
+    def __init__(self, end_date=None, count=0):
+        self._end_date = end_date
+        self._count = count
+
+    @staticmethod
+    def recurrenceEndWithEndDate_(end_date):
+        return FakeRecurrenceEnd(end_date=end_date)
+
+    @staticmethod
+    def recurrenceEndWithOccurrenceCount_(count):
+        return FakeRecurrenceEnd(count=count)
+
+    def endDate(self):
+        return self._end_date
+
+    def occurrenceCount(self):
+        return self._count
+
+
+class FakeRecurrenceRule:
+    @classmethod
+    def alloc(cls):
+        return cls.__new__(cls)
+
+    def initRecurrenceWithFrequency_interval_daysOfTheWeek_daysOfTheMonth_monthsOfTheYear_weeksOfTheYear_daysOfTheYear_setPositions_end_(
+            self, frequency, interval, days, days_of_month, months, weeks, days_of_year, positions, end):
+        self._frequency = frequency
+        self._interval = interval
+        self._days = days
+        self._days_of_month = days_of_month
+        self._end = end
+        return self
+
+    @classmethod
+    def from_rule(cls, rule):
+        end = None
+        if rule.until_ts is not None:
+            end = FakeRecurrenceEnd(end_date=FakeNSDate(rule.until_ts))
+        elif rule.count is not None:
+            end = FakeRecurrenceEnd(count=rule.count)
+        days = [FakeRecurrenceDayOfWeek((weekday + 1) % 7 + 1) for weekday in rule.weekdays]
+        return cls.alloc().initRecurrenceWithFrequency_interval_daysOfTheWeek_daysOfTheMonth_monthsOfTheYear_weeksOfTheYear_daysOfTheYear_setPositions_end_(
+            FREQUENCIES.index(rule.frequency), rule.interval, days or None, None, None, None, None, None, end
+        )
+
+    def frequency(self):
+        return self._frequency
+
+    def interval(self):
+        return self._interval
+
+    def daysOfTheWeek(self):
+        return self._days
+
+    def daysOfTheMonth(self):
+        return self._days_of_month
+
+    def monthsOfTheYear(self):
+        return None
+
+    def weeksOfTheYear(self):
+        return None
+
+    def daysOfTheYear(self):
+        return None
+
+    def setPositions(self):
+        return None
+
+    def recurrenceEnd(self):
+        return self._end
+
+    def to_rule(self):
+        """Dieselbe Regel als RecurrenceRule (zum Auffächern)"""
+        end = self._end
+        return RecurrenceRule(
+            FREQUENCIES[self._frequency], self._interval,
+            tuple((day.dayOfTheWeek() - 2) % 7 for day in self._days or ()),
+            end.endDate()._ts if end is not None and end.endDate() is not None else None,
+            end.occurrenceCount() or None if end is not None else None
+        )
+
+
+class FakeEvent:
+    _ids = itertools.count(1)
+
+    def __init__(self, store=None):
+        self._store = store
+        self._title = None
+        self._start = None
+        self._end = None
+        self._notes = None
+        self._location = None
+        self._all_day = False
+        self._calendar = None
+        self._identifier = None
+        self._rules = None
+        # Serien: entfernte Vorkommen, abgelöste Ausnahmen
+        self._excluded = set()
+        self._exceptions = []
+        # Vorkommen: Serie, ursprünglicher Start, abgelöst
+        self._master = None
+        self._occurrence = None
+        self._detached = False
+
+    @classmethod
+    def eventWithEventStore_(cls, store):
+        return cls(store)
+
+    def _cost(self):
+        if self._store is not None:
+            _spin(self._store.accessor_cost_us)
+
+    def title(self):
+        self._cost()
+        return self._title
+
+    def startDate(self):
+        self._cost()
+        return self._start
+
+    def endDate(self):
+        self._cost()
+        return self._end
+
+    def notes(self):
+        self._cost()
+        return self._notes
+
+    def location(self):
+        self._cost()
+        return self._location
+
+    def isAllDay(self):
+        self._cost()
+        return self._all_day
+
+    def recurrenceRules(self):
+        self._cost()
+        return self._rules
+
+    def hasRecurrenceRules(self):
+        return bool(self._rules)
+
+    def isDetached(self):
+        self._cost()
+        return self._detached
+
+    def occurrenceDate(self):
+        self._cost()
+        return self._occurrence or self._start
+
+    def setRecurrenceRules_(self, rules):
+        self._rules = rules
+
+    def occurrence(self, start_ts):
+        """Vorkommen einer Serie als eigenes Objekt"""
+        occurrence = FakeEvent(self._store)
+        for name in ('_title', '_notes', '_location', '_all_day', '_calendar', '_identifier', '_rules'):
+            setattr(occurrence, name, getattr(self, name))
+        occurrence._start = FakeNSDate(start_ts)
+        occurrence._end = FakeNSDate(start_ts + self._end._ts - self._start._ts)
+        occurrence._occurrence = occurrence._start
+        occurrence._master = self
+        return occurrence
+
+    def occurrences_between(self, lower, upper):
+        """Vorkommen, die [lower, upper) überlappen"""
+        duration = self._end._ts - self._start._ts
+        first = datetime.fromtimestamp(self._start._ts)
+        rule = self._rules[0].to_rule()
+        found = []
+        for start in rule.between(first, datetime.fromtimestamp(lower - duration), datetime.fromtimestamp(upper)):
+            start_ts = start.timestamp()
+            if start_ts + duration > lower and int(start_ts) not in self._excluded:
+                found.append(self.occurrence(start_ts))
+        return found + [
+            exception for exception in self._exceptions
+            if exception._start._ts < upper and exception._end._ts > lower
+        ]
+
+    def calendar(self):
+        self._cost()
+        return self._calendar
+
+    def eventIdentifier(self):
+        self._cost()
+        return self._identifier
+
+    def setTitle_(self, value):
+        self._title = value
+
+    def setStartDate_(self, value):
+        self._start = value
+
+    def setEndDate_(self, value):
+        self._end = value
+
+    def setNotes_(self, value):
+        self._notes = value
+
+    def setLocation_(self, value):
+        self._location = value
+
+    def setCalendar_(self, value):
+        self._calendar = value
+
+
+class FakePredicate:
+    __slots__ = ('start', 'end', 'calendars')
+
+    def __init__(self, start, end, calendars):
+        self.start = start
+        self.end = end
+        self.calendars = calendars
+
+
+class FakeEventStore:
+    """In-Memory-EKEventStore mit konfigurierbaren Kosten"""
+
+    # Kosten in Mikrosekunden
+    accessor_cost_us = 1.0
+    fetch_cost_per_event_us = 5.0
+    commit_cost_us = 0.0
+
+    def __init__(self):
+        self.calendars = []
+        self.events = []
+        self.commits = 0
+        self.calendar_enumerations = 0
+        self.fetches = 0
+        self._by_identifier = {}
+        self._pending = []
+
+    @classmethod
+    def alloc(cls):
+        return cls.__new__(cls)
+
+    def init(self):
+        self.__init__()
+        return self
+
+    @staticmethod
+    def authorizationStatusForEntityType_(entity_type):
+        return FakeEventKit.EKAuthorizationStatusAuthorized
+
+    def add_calendar(self, title, writable=True):
+        calendar = FakeCalendar(title, writable)
+        self.calendars.append(calendar)
+        FakeFoundation._center.postNotificationName_object_(FakeEventKit.EKEventStoreChangedNotification, self)
+        return calendar
+
+    def add_event(self, calendar, title, start_ts, duration=3600, location='', rule=None):
+        """
+        Args:
+            rule: RecurrenceRule für eine Serie
+        """
+        event = FakeEvent(self)
+        if rule is not None:
+            event._rules = [FakeRecurrenceRule.from_rule(rule)]
+        event._title = title
+        event._start = FakeNSDate(start_ts)
+        event._end = FakeNSDate(start_ts + duration)
+        event._location = location
+        event._calendar = calendar
+        event._identifier = f"EV-{next(FakeEvent._ids)}"
+        self.events.append(event)
+        self._by_identifier[event._identifier] = event
+        return event
+
+    def add_exception(self, series, original_ts, title, start_ts, duration=3600):
+        """Löst ein Vorkommen einer Serie als Ausnahme ab"""
+        exception = series.occurrence(original_ts)
+        exception._title = title
+        exception._start = FakeNSDate(start_ts)
+        exception._end = FakeNSDate(start_ts + duration)
+        exception._occurrence = FakeNSDate(original_ts)
+        exception._detached = True
+        series._excluded.add(int(original_ts))
+        series._exceptions.append(exception)
+        return exception
+
+    def eventWithIdentifier_(self, identifier):
+        _spin(self.accessor_cost_us)
+        return self._by_identifier.get(identifier)
+
+    def calendarsForEntityType_(self, entity_type):
+        self.calendar_enumerations += 1
+        _spin(self.accessor_cost_us * len(self.calendars))
+        return list(self.calendars)
+
+    def predicateForEventsWithStartDate_endDate_calendars_(self, start, end, calendars):
+        return FakePredicate(start._ts, end._ts, calendars)
+
+    def eventsMatchingPredicate_(self, predicate):
+        self.fetches += 1
+        wanted = None
+        if predicate.calendars is not None:
+            wanted = {id(calendar) for calendar in predicate.calendars}
+        result = []
+        for event in self.events:
+            if wanted is not None and id(event._calendar) not in wanted:
+                continue
+            if event._rules:
+                result.extend(event.occurrences_between(predicate.start, predicate.end))
+            elif event._start._ts < predicate.end and event._end._ts > predicate.start:
+                result.append(event)
+        # Jedes gelieferte Event muss über die Bridge materialisiert werden
+        _spin(self.fetch_cost_per_event_us * len(result))
+        return result
+
+    def saveEvent_span_error_(self, event, span, error):
+        return self.saveEvent_span_commit_error_(event, span, True, error)
+
+    def removeEvent_span_error_(self, event, span, error):
+        return self.removeEvent_span_commit_error_(event, span, True, error)
+
+    def saveEvent_span_commit_error_(self, event, span, commit, error):
+        self._pending.append(('save', event, span))
+        if commit:
+            return self.commit_(error)
+        return True, None
+
+    def removeEvent_span_commit_error_(self, event, span, commit, error):
+        self._pending.append(('remove', event, span))
+        if commit:
+            return self.commit_(error)
+        return True, None
+
+    def commit_(self, error):
+        for action, event, span in self._pending:
+            master = event._master
+            if master is not None and event._detached:
+                if action == 'remove':
+                    master._exceptions.remove(event)
+                continue
+            if master is not None:
+                if action == 'remove' and span == FakeEventKit.EKSpanThisEvent:
+                    master._excluded.add(int(event._start._ts))
+                    continue
+                if action == 'save':
+                    # Änderung der ganzen Serie über ein Vorkommen
+                    for name in ('_title', '_notes', '_location', '_rules'):
+                        setattr(master, name, getattr(event, name))
+                event = master
+            if action == 'save':
+                if event._identifier is None:
+                    event._identifier = f"EV-{next(FakeEvent._ids)}"
+                    self.events.append(event)
+                    self._by_identifier[event._identifier] = event
+            elif event._identifier in self._by_identifier:
+                self.events.remove(event)
+                del self._by_identifier[event._identifier]
+        self._pending = []
+        self.commits += 1
+        _spin(self.commit_cost_us)
+        return True, None
+
+    def reset(self):
+        self._pending = []
+
+
+class FakeEventKit:
+    EKEventStore = FakeEventStore
+    EKEvent = FakeEvent
+    EKAuthorizationStatusAuthorized = 3
+    EKAuthorizationStatusDenied = 2
+    EKAuthorizationStatusRestricted = 1
+    EKEntityTypeEvent = 0
+    EKEventStoreChangedNotification = 'EKEventStoreChangedNotification'
+    EKSpanThisEvent = 0
+    EKSpanFutureEvents = 1
+    EKRecurrenceFrequencyDaily = 0
+    EKRecurrenceFrequencyWeekly = 1
+    EKRecurrenceFrequencyMonthly = 2
+    EKRecurrenceFrequencyYearly = 3
+    EKRecurrenceRule = FakeRecurrenceRule
+    EKRecurrenceDayOfWeek = FakeRecurrenceDayOfWeek
+    EKRecurrenceEnd = FakeRecurrenceEnd
+
+
+def install():
+    """Ersetzt EventKit/Foundation im Client-Modul durch die Fakes"""
+    calendar_client_eventkit.EventKit = FakeEventKit
+    calendar_client_eventkit.Foundation = FakeFoundation
+    calendar_client_eventkit.EVENTKIT_AVAILABLE = True
+    return calendar_client_eventkit
+
+
+def make_client():
+    """Erstellt einen EventKitCalendarClient auf einem frischen Fake-Store"""
+    module = install()
+    return module.EventKitCalendarClient()
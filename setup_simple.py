@@ -18,6 +18,7 @@ OPTIONS = {
         'sys',
         'traceback',
         'typing',
+        'sqlite3',
         
         # PyQt6 Core-Module  
         'PyQt6.QtWidgets',
@@ -32,7 +33,22 @@ OPTIONS = {
         # Unsere vereinfachten Module
         'src.simple_calendar_client',
         'src.calendar_client_eventkit',
+        'src.calendar_backend',
+        'src.memory_backend',
+        'src.sync_state',
+        'src.sync_engine',
         'src.duplicate_cleanup_tab',
+        'src.duplicate_engine',
+        'src.event_record',
+        'src.recurrence',
+        'src.snapshot_cache',
+        'src.cancellation',
+        'src.progress',
+        'src.status_log',
+        'src.store_executor',
+        'src.store_jobs',
+        'src.event_table_model',
+        'src.duplicate_tree_model',
     ],
     'packages': [
         'PyQt6', 
@@ -50,7 +66,6 @@ OPTIONS = {
         'setuptools',
         'pip',
         'appscript',  # Nicht mehr benötigt (nur EventKit)
-        'sqlite3',   # Nicht mehr benötigt (kein Caching)
         
         # Alte komplexe Module ausschließen
         'src.calendar_client',
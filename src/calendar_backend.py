@@ -0,0 +1,186 @@
+"""
+Backend-Schnittstelle für Kalender-Speicher
+
+SimpleCalendarClient arbeitet nur gegen diese Schnittstelle. Der
+EventKitCalendarClient ist die Implementierung für macOS, der
+InMemoryCalendarBackend (memory_backend) eine schnelle Referenz-
+Implementierung für Profiling und Lasttests ohne Mac.
+
+Jedes Backend liefert:
+- list_calendars / refresh_calendars
+- get_events für einen Zeitraum (CalendarEvent-Datensätze)
+- save_events / update_events / delete_events als Bulk-Operationen mit
+  Ergebnis pro Event
+- remove_occurrences: einzelne Vorkommen aus Serien entfernen
+- change_token: ändert sich, sobald sich der Speicher ändert
+
+Wiederkehrende Events liefert get_events als einzelne Vorkommen (mit
+Regel und Serienstart, siehe event_record). Event-Daten mit
+'recurrence_rule' werden als Serie geschrieben bzw. ganz aktualisiert;
+'whole_series' löscht beim Löschen die gesamte Serie.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+try:
+    from src.event_record import CalendarEvent, ALL_FIELDS
+except ImportError:
+    from event_record import CalendarEvent, ALL_FIELDS
+
+# Fehlertext, wenn ein Event für update/delete nicht (mehr) existiert
+EVENT_NOT_FOUND = "Event nicht gefunden"
+
+
+def default_range(start_date: Optional[datetime], end_date: Optional[datetime]) -> Tuple[datetime, datetime]:
+    """Standard-Zeitraum: letztes Jahr bis nächstes Jahr"""
+    if start_date is None:
+        start_date = datetime.now() - timedelta(days=365)
+    if end_date is None:
+        end_date = datetime.now() + timedelta(days=365)
+    return start_date, end_date
+
+
+def iter_windows(start_date: datetime, end_date: datetime, window_days: int) -> Iterator[Tuple[datetime, datetime]]:
+    """Zerlegt einen Zeitraum in aufeinanderfolgende Teilfenster"""
+    window = timedelta(days=max(1, window_days))
+    window_start = start_date
+    while window_start < end_date:
+        window_end = min(window_start + window, end_date)
+        yield window_start, window_end
+        window_start = window_end
+
+
+def starts_in_window(start_ts: float, lower: float, upper: float, first_window: bool) -> bool:
+    """
+    Gehört ein Event zu diesem Teilfenster?
+
+    Ein Event zählt nur zu dem Fenster, in dem es beginnt - Events, die
+    vor dem Zeitraum beginnen, zum ersten Fenster. Über Fenstergrenzen
+    reichende Events werden so genau einmal geliefert.
+    """
+    if start_ts >= upper:
+        return False
+    return first_window or start_ts >= lower
+
+
+class CalendarBackend(ABC):
+    """Gemeinsame Schnittstelle aller Kalender-Backends"""
+
+    DEFAULT_BATCH_SIZE = 100
+
+    batch_size = DEFAULT_BATCH_SIZE
+
+    @abstractmethod
+    def is_available(self) -> bool:
+        """Ist das Backend einsatzbereit?"""
+
+    @abstractmethod
+    def list_calendars(self) -> List[str]:
+        """Namen aller Kalender"""
+
+    @abstractmethod
+    def get_events(self, calendar_name: str, start_date: datetime = None, end_date: datetime = None,
+                   fields=ALL_FIELDS) -> List[CalendarEvent]:
+        """Events, die den Zeitraum überlappen"""
+
+    @abstractmethod
+    def save_events(self, calendar_name: str, events: List[Dict[str, Any]],
+                    batch_size: int = None) -> List[Dict[str, Any]]:
+        """
+        Erstellt mehrere Events mit einem Commit pro Batch
+
+        Returns:
+            Ergebnis pro Event: {'id', 'title', 'success', 'error', 'target_id'}
+        """
+
+    @abstractmethod
+    def update_events(self, calendar_name: str, updates: List[Tuple[str, Dict[str, Any]]],
+                      batch_size: int = None) -> List[Dict[str, Any]]:
+        """
+        Überschreibt bestehende Events (Identifier bleibt erhalten)
+
+        Args:
+            updates: (Identifier des Ziel-Events, neue Event-Daten)
+
+        Returns:
+            Ergebnis pro Eintrag: {'id', 'title', 'success', 'error', 'target_id'}
+        """
+
+    @abstractmethod
+    def delete_events(self, calendar_name: str, events: List[Dict[str, Any]],
+                      batch_size: int = None) -> List[Dict[str, Any]]:
+        """
+        Löscht mehrere Events mit einem Commit pro Batch
+
+        Returns:
+            Ergebnis pro Event: {'id', 'title', 'success', 'error'}
+        """
+
+    @abstractmethod
+    def remove_occurrences(self, calendar_name: str, occurrences: List[Tuple[str, float]],
+                           batch_size: int = None) -> List[Dict[str, Any]]:
+        """
+        Entfernt einzelne Vorkommen von Serien (die Serie selbst bleibt)
+
+        Args:
+            occurrences: (Identifier der Serie, Start des Vorkommens in Epoch-Sekunden)
+
+        Returns:
+            Ergebnis pro Vorkommen: {'id', 'title', 'success', 'error'}
+        """
+
+    @abstractmethod
+    def change_token(self) -> int:
+        """Wert, der sich bei jeder Änderung des Speichers ändert"""
+
+    def refresh_calendars(self):
+        """Verwirft gecachte Kalender-Informationen"""
+
+    def iter_events(self, calendar_name: str, start_date: datetime = None, end_date: datetime = None,
+                    fields=ALL_FIELDS, window_days: int = 30) -> Iterator[CalendarEvent]:
+        """Liefert Events fensterweise als Generator statt einer Gesamtliste"""
+        start_date, end_date = default_range(start_date, end_date)
+        for window_start, window_end in iter_windows(start_date, end_date, window_days):
+            lower = window_start.timestamp()
+            upper = window_end.timestamp()
+            first_window = window_start == start_date
+            for event in self.get_events(calendar_name, window_start, window_end, fields):
+                if starts_in_window(event.start_ts, lower, upper, first_window):
+                    yield event
+
+    def create_event(self, calendar_name: str, title: str, start_date: datetime,
+                     end_date: datetime, description: str = "", location: str = "") -> bool:
+        """Erstellt ein einzelnes Event"""
+        event_data = {
+            'title': title,
+            'start_date': start_date,
+            'end_date': end_date,
+            'description': description,
+            'location': location
+        }
+        return self.save_events(calendar_name, [event_data], 1)[0]['success']
+
+    def create_events_batch(self, calendar_name: str, events: List[Dict[str, Any]], batch_size: int = None) -> tuple:
+        """Erstellt mehrere Events mit einem Store-Commit pro Batch"""
+        if not events:
+            return 0, 0
+
+        results = self.save_events(calendar_name, events, batch_size)
+        success_count = sum(1 for result in results if result['success'])
+        return success_count, len(results) - success_count
+
+    def delete_event(self, calendar_name: str, event_data: Dict[str, Any]) -> bool:
+        """Löscht ein einzelnes Event"""
+        return self.delete_events(calendar_name, [event_data], 1)[0]['success']
+
+    @staticmethod
+    def _item_result(event_data: Dict[str, Any], success: bool, error: Optional[str] = None) -> Dict[str, Any]:
+        """Ergebnis-Eintrag für Bulk-Operationen"""
+        return {
+            'id': event_data.get('id', ''),
+            'title': event_data.get('title', '') or event_data.get('summary', ''),
+            'success': success,
+            'error': error
+        }
@@ -5,10 +5,25 @@ Verwendet PyObjC für direkten Zugriff auf das EventKit Framework
 """
 
 import logging
+import threading
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterator, Tuple, FrozenSet
 from enum import Enum
 
+try:
+    from src.event_record import (CalendarEvent, ALL_FIELDS, LAZY_FIELDS, FIELD_END, FIELD_LOCATION,
+                                  FIELD_DESCRIPTION, FIELD_ALL_DAY, FIELD_RECURRENCE, NO_RECURRENCE)
+    from src.recurrence import RecurrenceRule, parse_rule, DAILY, WEEKLY, MONTHLY, YEARLY
+except ImportError:
+    from event_record import (CalendarEvent, ALL_FIELDS, LAZY_FIELDS, FIELD_END, FIELD_LOCATION,
+                              FIELD_DESCRIPTION, FIELD_ALL_DAY, FIELD_RECURRENCE, NO_RECURRENCE)
+    from recurrence import RecurrenceRule, parse_rule, DAILY, WEEKLY, MONTHLY, YEARLY
+
+try:
+    from src.calendar_backend import CalendarBackend, EVENT_NOT_FOUND, default_range, iter_windows, starts_in_window
+except ImportError:
+    from calendar_backend import CalendarBackend, EVENT_NOT_FOUND, default_range, iter_windows, starts_in_window
+
 # Ultra-defensive EventKit-Imports für maximale App-Bundle-Kompatibilität
 EVENTKIT_AVAILABLE = False
 EventKit = None
@@ -72,6 +87,9 @@ def safe_import_eventkit():
 # Führe den sicheren Import beim Modul-Load durch
 safe_import_eventkit()
 
+# Feldauswahl → nachzuladende Felder (vermeidet ein frozenset pro Event)
+_PENDING_FIELDS_CACHE = {}
+
 class SyncMode(Enum):
     """Synchronisationsmodi für Event-Abfragen"""
     FUTURE = "future"
@@ -84,14 +102,110 @@ class EventPriority(Enum):
     NORMAL = 2  
     HIGH = 3
 
-class EventKitCalendarClient:
+class CalendarRegistry:
+    """
+    Cache für Kalender-Handles (Titel → Handle, Identifier → Handle)
+
+    Vermeidet eine vollständige Kalender-Enumeration über die PyObjC-Bridge
+    bei jedem Schreibzugriff. Der Cache wird bei Store-Änderungen oder
+    explizit über invalidate() verworfen und beim nächsten Zugriff neu
+    aufgebaut.
+
+    Gibt es mehrere Kalender mit gleichem Titel, gewinnt deterministisch
+    ein beschreibbarer Kalender vor einem schreibgeschützten, danach der
+    kleinste calendarIdentifier.
+
+    Der Cache ist ein unveränderliches Tupel (Titel, nach Titel, nach
+    Identifier), das als Ganzes ersetzt wird - ein invalidate() aus einem
+    anderen Thread (z.B. nach eigenen Commits) trifft Leser daher nie
+    zwischen zwei Zugriffen.
+    """
+
+    def __init__(self, event_store, logger: logging.Logger):
+        self._event_store = event_store
+        self._logger = logger
+        self._lock = threading.Lock()
+        self._snapshot = None
+
+    def invalidate(self):
+        """Verwirft den Cache"""
+        with self._lock:
+            self._snapshot = None
+
+    def titles(self) -> List[str]:
+        """Eindeutige Kalendertitel in Store-Reihenfolge"""
+        titles, _, _ = self._ensure_loaded()
+        return list(titles)
+
+    def by_title(self, title: str):
+        """Kalender-Handle für einen Titel (oder None)"""
+        _, by_title, _ = self._ensure_loaded()
+        return by_title.get(title)
+
+    def by_identifier(self, identifier: str):
+        """Kalender-Handle für einen calendarIdentifier (oder None)"""
+        _, _, by_identifier = self._ensure_loaded()
+        return by_identifier.get(identifier)
+
+    def _ensure_loaded(self) -> Tuple[List[str], Dict[str, Any], Dict[str, Any]]:
+        """Liefert den aktuellen Cache (baut ihn bei Bedarf neu auf)"""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        with self._lock:
+            if self._snapshot is not None:
+                return self._snapshot
+            calendars = self._event_store.calendarsForEntityType_(EventKit.EKEntityTypeEvent) or []
+            
+            candidates = {}
+            by_identifier = {}
+            titles = []
+            for calendar in calendars:
+                title = calendar.title()
+                identifier = calendar.calendarIdentifier() or ''
+                by_identifier[identifier] = calendar
+                if not title:
+                    continue
+                if title not in candidates:
+                    candidates[title] = []
+                    titles.append(title)
+                writable = bool(calendar.allowsContentModifications())
+                candidates[title].append((not writable, identifier, calendar))
+            
+            by_title = {}
+            for title, entries in candidates.items():
+                entries.sort(key=lambda entry: (entry[0], entry[1]))
+                by_title[title] = entries[0][2]
+                if len(entries) > 1:
+                    self._logger.warning(
+                        f"⚠️ {len(entries)} Kalender mit Titel '{title}' - verwende '{entries[0][1]}'"
+                    )
+            
+            self._snapshot = (titles, by_title, by_identifier)
+            return self._snapshot
+
+
+class EventKitCalendarClient(CalendarBackend):
     """
     EventKit-basierter Calendar Client für native macOS-Integration
     """
-    
-    def __init__(self):
-        """Initialisiert den EventKit Calendar Client"""
+
+    def __init__(self, batch_size: int = CalendarBackend.DEFAULT_BATCH_SIZE):
+        """
+        Initialisiert den EventKit Calendar Client
+        
+        Args:
+            batch_size: Anzahl Schreiboperationen pro Store-Commit
+        """
         self.event_store = None
+        self.calendar_registry = None
+        self.batch_size = max(1, batch_size)
+        self._store_observer = None
+        self._generation = 0
+        # eventIdentifier → Start der Serie (erstes Vorkommen)
+        self._series_starts = {}
+        # Lädt fehlende Felder der gelieferten Datensätze nach (siehe store_executor.OwnedBackend)
+        self.field_loader = self
         self.logger = logging.getLogger(__name__)
         
         # Prüfe EventKit-Verfügbarkeit bei jeder Instanziierung
@@ -123,12 +237,49 @@ class EventKitCalendarClient:
             if self.event_store is None:
                 raise Exception("Event Store konnte nicht erstellt werden")
                 
+            self.calendar_registry = CalendarRegistry(self.event_store, self.logger)
+            self._observe_store_changes()
+                
             self.logger.info("EventStore erfolgreich initialisiert")
             return True
         except Exception as e:
             self.logger.error(f"Event Store Initialisierung fehlgeschlagen: {e}")
             return False
 
+    def _observe_store_changes(self):
+        """Registriert einen Observer für EKEventStoreChangedNotification"""
+        try:
+            center = Foundation.NSNotificationCenter.defaultCenter()
+            self._store_observer = center.addObserverForName_object_queue_usingBlock_(
+                EventKit.EKEventStoreChangedNotification,
+                self.event_store,
+                None,
+                self._on_store_changed
+            )
+        except Exception as e:
+            self.logger.debug(f"Store-Änderungen können nicht beobachtet werden: {e}")
+
+    def _on_store_changed(self, notification):
+        """Wird bei Änderungen im Event Store aufgerufen"""
+        self._generation += 1
+        self._series_starts.clear()
+        if self.calendar_registry:
+            self.calendar_registry.invalidate()
+
+    def refresh_calendars(self):
+        """Verwirft gecachte Kalender-Handles, z.B. nach externen Änderungen"""
+        if self.calendar_registry:
+            self.calendar_registry.invalidate()
+
+    def change_token(self) -> int:
+        """
+        Generationszähler des Event Stores
+        
+        Steigt bei jeder EKEventStoreChangedNotification und nach jedem
+        eigenen Commit.
+        """
+        return self._generation
+
     def request_calendar_access(self) -> bool:
         """Fordert Kalender-Berechtigung aktiv an"""
         if not EVENTKIT_AVAILABLE or not self.event_store:
@@ -165,6 +316,7 @@ class EventKitCalendarClient:
                     
                     if new_status == EventKit.EKAuthorizationStatusAuthorized:
                         self.logger.info("✅ Kalender-Berechtigung erfolgreich gewährt!")
+                        self.refresh_calendars()
                         return True
                     elif new_status == EventKit.EKAuthorizationStatusDenied:
                         self.logger.error("❌ Kalender-Berechtigung wurde verweigert")
@@ -192,8 +344,7 @@ class EventKitCalendarClient:
             return []
             
         try:
-            calendars = self.event_store.calendarsForEntityType_(EventKit.EKEntityTypeEvent)
-            calendar_names = [calendar.title() for calendar in calendars if calendar.title()]
+            calendar_names = self.calendar_registry.titles()
             
             self.logger.info(f"Gefundene Kalender: {calendar_names}")
             return calendar_names
@@ -202,56 +353,148 @@ class EventKitCalendarClient:
             self.logger.error(f"Fehler beim Laden der Kalender: {e}")
             return []
 
-    def get_events(self, calendar_name: str, start_date: datetime = None, end_date: datetime = None) -> List[Dict[str, Any]]:
+    def get_events(self, calendar_name: str, start_date: datetime = None, end_date: datetime = None,
+                   fields=ALL_FIELDS) -> List[CalendarEvent]:
         """Holt Events aus dem angegebenen Kalender"""
+        grouped = self.get_events_for_calendars([calendar_name], start_date, end_date, fields)
+        return grouped.get(calendar_name, [])
+
+    def get_events_for_calendars(self, calendar_names: List[str], start_date: datetime = None,
+                                 end_date: datetime = None, fields=ALL_FIELDS) -> Dict[str, List[CalendarEvent]]:
+        """
+        Holt Events aus mehreren Kalendern, bereits nach Kalender gruppiert
+
+        Die Kalender-Handles werden einmal aufgelöst und direkt in das
+        EventKit-Predicate gegeben, damit der Store nur Events der
+        gewünschten Kalender liefert.
+
+        Args:
+            calendar_names: Namen der Kalender
+            start_date: Beginn des Zeitraums (Standard: vor einem Jahr)
+            end_date: Ende des Zeitraums (Standard: in einem Jahr)
+
+        Returns:
+            Dict mit Kalendername → Liste der Events
+        """
+        # Doppelte Namen nur einmal abfragen
+        calendar_names = list(dict.fromkeys(calendar_names))
+        grouped = {name: [] for name in calendar_names}
         if not self.is_available():
             self.logger.warning("EventKit nicht verfügbar für get_events")
-            return []
+            return grouped
             
         try:
-            # Standard-Zeitraum: letztes Jahr bis nächstes Jahr
-            if start_date is None:
-                start_date = datetime.now() - timedelta(days=365)
-            if end_date is None:
-                end_date = datetime.now() + timedelta(days=365)
+            date_range = self._predicate_date_range(start_date, end_date)
+            if date_range is None:
+                return grouped
+            start_ns, end_ns = date_range
             
-            self.logger.debug(f"Suche Events von {start_date} bis {end_date}")
+            # Kalender-Handles einmal auflösen
+            calendars = self._find_calendars(calendar_names)
             
-            # Validiere Datum-Objekte
-            if not isinstance(start_date, datetime) or not isinstance(end_date, datetime):
-                self.logger.error(f"Ungültige Datumstypen: start_date={type(start_date)}, end_date={type(end_date)}")
-                return []
+            for calendar_name in calendar_names:
+                calendar = calendars.get(calendar_name)
+                if calendar is None:
+                    self.logger.warning(f"Kalender '{calendar_name}' nicht gefunden")
+                    continue
+                
+                # Predicate nur für diesen Kalender - kein Filtern in Python nötig
+                predicate = self.event_store.predicateForEventsWithStartDate_endDate_calendars_(
+                    start_ns, end_ns, [calendar]
+                )
+                events = self.event_store.eventsMatchingPredicate_(predicate) or []
+                
+                calendar_events = grouped[calendar_name]
+                for event in events:
+                    record = self._convert_event(event, calendar_name, fields)
+                    if record is not None:
+                        calendar_events.append(record)
+                
+                self.logger.info(f"Gefundene Events: {len(calendar_events)} in '{calendar_name}'")
             
-            # Konvertiere zu NSDate
-            start_ns = self._datetime_to_nsdate(start_date)
-            end_ns = self._datetime_to_nsdate(end_date)
+            return grouped
             
-            # Prüfe ob Konvertierung erfolgreich war
-            if start_ns is None or end_ns is None:
-                self.logger.error("NSDate-Konvertierung fehlgeschlagen")
-                return []
+        except Exception as e:
+            self.logger.error(f"Fehler beim Laden der Events: {e}")
+            return grouped
+
+    def iter_events(self, calendar_name: str, start_date: datetime = None, end_date: datetime = None,
+                    fields=ALL_FIELDS, window_days: int = 30) -> Iterator[CalendarEvent]:
+        """
+        Liefert Events fensterweise als Generator statt einer Gesamtliste
+        
+        Der Zeitraum wird in Teilfenster von window_days Tagen zerlegt und
+        jedes Fenster einzeln abgefragt. Ein Event wird nur in dem Fenster
+        geliefert, in dem es beginnt (Events, die vor dem Zeitraum
+        beginnen, im ersten Fenster) - über Fenstergrenzen reichende
+        Events erscheinen dadurch genau einmal.
+        
+        Args:
+            calendar_name: Name des Kalenders
+            start_date: Beginn des Zeitraums (Standard: vor einem Jahr)
+            end_date: Ende des Zeitraums (Standard: in einem Jahr)
+            fields: Sofort zu ladende Felder (siehe event_record)
+            window_days: Größe der Teilfenster in Tagen
+        """
+        if not self.is_available():
+            self.logger.warning("EventKit nicht verfügbar für iter_events")
+            return
+        
+        start_date, end_date = default_range(start_date, end_date)
+        
+        calendar = self._find_calendar(calendar_name)
+        if calendar is None:
+            self.logger.warning(f"Kalender '{calendar_name}' nicht gefunden")
+            return
+        
+        count = 0
+        
+        for window_start, window_end in iter_windows(start_date, end_date, window_days):
+            date_range = self._predicate_date_range(window_start, window_end)
+            if date_range is None:
+                return
             
-            # Erstelle Predicate für Events
             predicate = self.event_store.predicateForEventsWithStartDate_endDate_calendars_(
-                start_ns, end_ns, None
+                date_range[0], date_range[1], [calendar]
             )
+            events = self.event_store.eventsMatchingPredicate_(predicate) or []
             
-            # Hole alle Events
-            all_events = self.event_store.eventsMatchingPredicate_(predicate)
-            
-            # Filtere nach Kalender
-            calendar_events = []
-            for event in all_events:
-                if event.calendar().title() == calendar_name:
-                    event_dict = self._convert_event_to_dict(event)
-                    calendar_events.append(event_dict)
+            lower = window_start.timestamp()
+            upper = window_end.timestamp()
+            first_window = window_start == start_date
             
-            self.logger.info(f"Gefundene Events: {len(calendar_events)} in '{calendar_name}'")
-            return calendar_events
-            
-        except Exception as e:
-            self.logger.error(f"Fehler beim Laden der Events: {e}")
-            return []
+            for event in events:
+                start_ts = self._nsdate_to_timestamp(event.startDate())
+                if not starts_in_window(start_ts, lower, upper, first_window):
+                    continue
+                record = self._convert_event(event, calendar_name, fields, start_ts)
+                if record is not None:
+                    count += 1
+                    yield record
+        
+        self.logger.info(f"Gestreamte Events: {count} in '{calendar_name}'")
+
+    def _predicate_date_range(self, start_date: Optional[datetime], end_date: Optional[datetime]):
+        """Validiert den Zeitraum und konvertiert ihn zu NSDate (None bei Fehler)"""
+        start_date, end_date = default_range(start_date, end_date)
+        
+        self.logger.debug(f"Suche Events von {start_date} bis {end_date}")
+        
+        # Validiere Datum-Objekte
+        if not isinstance(start_date, datetime) or not isinstance(end_date, datetime):
+            self.logger.error(f"Ungültige Datumstypen: start_date={type(start_date)}, end_date={type(end_date)}")
+            return None
+        
+        # Konvertiere zu NSDate
+        start_ns = self._datetime_to_nsdate(start_date)
+        end_ns = self._datetime_to_nsdate(end_date)
+        
+        # Prüfe ob Konvertierung erfolgreich war
+        if start_ns is None or end_ns is None:
+            self.logger.error("NSDate-Konvertierung fehlgeschlagen")
+            return None
+        
+        return start_ns, end_ns
 
     def create_event(self, calendar_name: str, title: str, start_date: datetime, 
                     end_date: datetime, description: str = "", location: str = "") -> bool:
@@ -286,9 +529,12 @@ class EventKitCalendarClient:
             event.setCalendar_(target_calendar)
             
             # Speichere Event
-            success = self.event_store.saveEvent_span_error_(event, 0, None)
+            success, _ = self._unpack_bridge_result(
+                self.event_store.saveEvent_span_error_(event, EventKit.EKSpanThisEvent, None)
+            )
             
             if success:
+                self._generation += 1
                 self.logger.debug(f"Event '{title}' erfolgreich erstellt")
                 return True
             else:
@@ -299,41 +545,92 @@ class EventKitCalendarClient:
             self.logger.error(f"Fehler beim Erstellen des Events: {e}")
             return False
 
-    def create_events_batch(self, calendar_name: str, events: List[Dict[str, Any]], batch_size: int = 10) -> tuple:
-        """Erstellt mehrere Events in einem Batch"""
-        if not self.is_available():
-            self.logger.warning("EventKit nicht verfügbar für create_events_batch")
-            return 0, len(events)
-            
-        if not events:
-            return 0, 0
-            
-        success_count = 0
-        error_count = 0
+    def save_events(self, calendar_name: str, events: List[Dict[str, Any]],
+                    batch_size: int = None) -> List[Dict[str, Any]]:
+        """
+        Erstellt mehrere Events im transaktionalen Batch-Modus
         
-        try:
-            # Finde den Zielkalender
-            target_calendar = self._find_calendar(calendar_name)
-            if not target_calendar:
-                self.logger.error(f"Kalender '{calendar_name}' nicht gefunden")
-                return 0, len(events)
-            
-            for event_data in events:
-                try:
-                    if self._create_single_event(target_calendar, event_data):
-                        success_count += 1
-                    else:
-                        error_count += 1
-                except Exception as e:
-                    self.logger.error(f"Fehler beim Erstellen eines Events: {e}")
-                    error_count += 1
+        Jedes Event wird ohne Commit vorgemerkt, pro Batch wird einmal
+        committet. Schlägt ein Commit fehl, werden die vorgemerkten
+        Änderungen verworfen und alle Events des Batches als fehlerhaft
+        gemeldet.
+        
+        Args:
+            calendar_name: Name des Zielkalenders
+            events: Event-Daten (title/summary, start_date, end_date, ...)
+            batch_size: Events pro Commit (Standard: self.batch_size)
             
-            self.logger.info(f"Batch-Erstellung abgeschlossen: {success_count}/{len(events)} Events erstellt")
-            return success_count, error_count
+        Returns:
+            Ergebnis pro Event: {'id', 'title', 'success', 'error', 'target_id'}
+        """
+        if not self.is_available():
+            self.logger.warning("EventKit nicht verfügbar für save_events")
+            return [self._item_result(event, False, "EventKit nicht verfügbar") for event in events]
+        
+        target_calendar = self._find_calendar(calendar_name)
+        if not target_calendar:
+            self.logger.error(f"Kalender '{calendar_name}' nicht gefunden")
+            return [self._item_result(event, False, "Kalender nicht gefunden") for event in events]
+        
+        def stage(event_data):
+            event = self._build_event(target_calendar, event_data)
+            if event is None:
+                return None, "Event konnte nicht erstellt werden"
+            success, error = self._unpack_bridge_result(
+                self.event_store.saveEvent_span_commit_error_(event, self._save_span(event_data), False, None)
+            )
+            return (event, None) if success else (None, str(error) if error else "Speichern fehlgeschlagen")
+        
+        results = self._run_batched(events, stage, batch_size, record_target_id=True)
+        
+        created = sum(1 for result in results if result['success'])
+        self.logger.info(f"Batch-Erstellung abgeschlossen: {created}/{len(events)} Events erstellt")
+        return results
+
+    def update_events(self, calendar_name: str, updates: List[Tuple[str, Dict[str, Any]]],
+                      batch_size: int = None) -> List[Dict[str, Any]]:
+        """
+        Aktualisiert bestehende Events direkt (ein Speichern statt Löschen + Neu)
+        
+        Daten mit 'recurrence_rule' ändern die gesamte Ziel-Serie.
+        
+        Args:
+            calendar_name: Name des Kalenders der Ziel-Events
+            updates: (Identifier des Ziel-Events, neue Event-Daten)
+            batch_size: Änderungen pro Commit (Standard: self.batch_size)
             
-        except Exception as e:
-            self.logger.error(f"Fehler beim Batch-Erstellen der Events: {e}")
-            return success_count, len(events)
+        Returns:
+            Ergebnis pro Eintrag: {'id', 'title', 'success', 'error', 'target_id'}
+        """
+        if not self.is_available():
+            self.logger.warning("EventKit nicht verfügbar für update_events")
+            return [self._item_result(event, False, "EventKit nicht verfügbar") for _, event in updates]
+        
+        target_calendar = self._find_calendar(calendar_name)
+        if not target_calendar:
+            self.logger.error(f"Kalender '{calendar_name}' nicht gefunden")
+            return [self._item_result(event, False, "Kalender nicht gefunden") for _, event in updates]
+        
+        calendar_id = target_calendar.calendarIdentifier()
+        
+        def stage(update):
+            target_id, event_data = update
+            event = self.event_store.eventWithIdentifier_(target_id) if target_id else None
+            if event is None or event.calendar() is None or event.calendar().calendarIdentifier() != calendar_id:
+                return None, EVENT_NOT_FOUND
+            self._apply_event_data(event, event_data, clear_missing=True)
+            # Serien ab dem ersten Vorkommen (eventWithIdentifier_) komplett ändern
+            success, error = self._unpack_bridge_result(
+                self.event_store.saveEvent_span_commit_error_(event, self._save_span(event_data), False, None)
+            )
+            return (event, None) if success else (None, str(error) if error else "Speichern fehlgeschlagen")
+        
+        results = self._run_batched(updates, stage, batch_size, record_target_id=True,
+                                    event_data_of=lambda update: update[1])
+        
+        updated = sum(1 for result in results if result['success'])
+        self.logger.info(f"Batch-Aktualisierung: {updated}/{len(updates)} Events in '{calendar_name}' aktualisiert")
+        return results
 
     def delete_event(self, calendar_name: str, event_data: Dict[str, Any]) -> bool:
         """
@@ -357,16 +654,19 @@ class EventKitCalendarClient:
                 self.logger.error(f"Kalender '{calendar_name}' nicht gefunden")
                 return False
             
-            # Suche das Event anhand der Eigenschaften
-            event_to_delete = self._find_event_by_properties(target_calendar, event_data)
+            # Suche das Event per Identifier (Fallback: Eigenschaften)
+            event_to_delete = self._resolve_event(target_calendar, event_data)
             if not event_to_delete:
                 self.logger.warning(f"Event nicht gefunden: {event_data.get('title', 'Unbekannt')}")
                 return False
             
             # Lösche das Event
-            success = self.event_store.removeEvent_span_error_(event_to_delete, 0, None)
+            success, _ = self._unpack_bridge_result(
+                self.event_store.removeEvent_span_error_(event_to_delete, EventKit.EKSpanThisEvent, None)
+            )
             
             if success:
+                self._generation += 1
                 self.logger.debug(f"Event '{event_data.get('title', 'Unbekannt')}' erfolgreich gelöscht")
                 return True
             else:
@@ -377,6 +677,193 @@ class EventKitCalendarClient:
             self.logger.error(f"Fehler beim Löschen des Events: {e}")
             return False
 
+    def delete_events(self, calendar_name: str, events: List[Dict[str, Any]],
+                      batch_size: int = None) -> List[Dict[str, Any]]:
+        """
+        Löscht mehrere Events, aufgelöst über ihren eventIdentifier
+        
+        Nur Events ohne (passenden) Identifier werden über die langsamere
+        Eigenschaftssuche gefunden. Löschungen werden wie in save_events
+        vorgemerkt und einmal pro Batch committet. Mit 'whole_series' wird
+        eine Serie ab ihrem ersten Vorkommen vollständig gelöscht.
+        
+        Args:
+            calendar_name: Name des Kalenders
+            events: Event-Daten, idealerweise mit 'id'
+            batch_size: Löschungen pro Commit (Standard: self.batch_size)
+            
+        Returns:
+            Ergebnis pro Event: {'id', 'title', 'success', 'error'}
+        """
+        if not self.is_available():
+            self.logger.warning("EventKit nicht verfügbar für delete_events")
+            return [self._item_result(event, False, "EventKit nicht verfügbar") for event in events]
+        
+        target_calendar = self._find_calendar(calendar_name)
+        if not target_calendar:
+            self.logger.error(f"Kalender '{calendar_name}' nicht gefunden")
+            return [self._item_result(event, False, "Kalender nicht gefunden") for event in events]
+        
+        def stage(event_data):
+            event = self._resolve_event(target_calendar, event_data)
+            if event is None:
+                return None, EVENT_NOT_FOUND
+            span = EventKit.EKSpanFutureEvents if event_data.get('whole_series') else EventKit.EKSpanThisEvent
+            success, error = self._unpack_bridge_result(
+                self.event_store.removeEvent_span_commit_error_(event, span, False, None)
+            )
+            return (event, None) if success else (None, str(error) if error else "Löschen fehlgeschlagen")
+        
+        results = self._run_batched(events, stage, batch_size)
+        
+        deleted = sum(1 for result in results if result['success'])
+        self.logger.info(f"Bulk-Löschung: {deleted}/{len(events)} Events aus '{calendar_name}' gelöscht")
+        return results
+
+    def remove_occurrences(self, calendar_name: str, occurrences: List[Tuple[str, float]],
+                           batch_size: int = None) -> List[Dict[str, Any]]:
+        """
+        Entfernt einzelne Vorkommen von Serien (EKSpanThisEvent)
+        
+        Das Vorkommen wird über ein Predicate um seinen Start gesucht und
+        muss zur Serie (gleicher eventIdentifier) gehören.
+        
+        Args:
+            calendar_name: Name des Kalenders
+            occurrences: (Identifier der Serie, Start des Vorkommens)
+            batch_size: Löschungen pro Commit (Standard: self.batch_size)
+            
+        Returns:
+            Ergebnis pro Vorkommen: {'id', 'title', 'success', 'error'}
+        """
+        entries = [{'id': series_id, 'start_date': datetime.fromtimestamp(start_ts)}
+                   for series_id, start_ts in occurrences]
+        if not self.is_available():
+            self.logger.warning("EventKit nicht verfügbar für remove_occurrences")
+            return [self._item_result(entry, False, "EventKit nicht verfügbar") for entry in entries]
+        
+        target_calendar = self._find_calendar(calendar_name)
+        if not target_calendar:
+            self.logger.error(f"Kalender '{calendar_name}' nicht gefunden")
+            return [self._item_result(entry, False, "Kalender nicht gefunden") for entry in entries]
+        
+        def stage(entry):
+            event = self._find_occurrence(target_calendar, entry['id'], entry['start_date'].timestamp())
+            if event is None:
+                return None, EVENT_NOT_FOUND
+            success, error = self._unpack_bridge_result(
+                self.event_store.removeEvent_span_commit_error_(event, EventKit.EKSpanThisEvent, False, None)
+            )
+            return (event, None) if success else (None, str(error) if error else "Löschen fehlgeschlagen")
+        
+        results = self._run_batched(entries, stage, batch_size)
+        
+        removed = sum(1 for result in results if result['success'])
+        self.logger.info(f"Vorkommen entfernt: {removed}/{len(entries)} in '{calendar_name}'")
+        return results
+
+    def _find_occurrence(self, calendar, series_id: str, start_ts: float):
+        """Sucht das (nicht abgelöste) Vorkommen einer Serie mit diesem Start"""
+        predicate = self.event_store.predicateForEventsWithStartDate_endDate_calendars_(
+            Foundation.NSDate.dateWithTimeIntervalSince1970_(start_ts - 1),
+            Foundation.NSDate.dateWithTimeIntervalSince1970_(start_ts + 1),
+            [calendar]
+        )
+        for event in self.event_store.eventsMatchingPredicate_(predicate) or []:
+            if event.eventIdentifier() != series_id or event.isDetached():
+                continue
+            if abs(self._nsdate_to_timestamp(event.startDate()) - start_ts) < 1:
+                return event
+        return None
+
+    def _run_batched(self, events: List[Any], stage, batch_size: Optional[int],
+                     record_target_id: bool = False, event_data_of=None) -> List[Dict[str, Any]]:
+        """
+        Führt vorgemerkte Schreiboperationen mit einem Commit pro Batch aus
+        
+        Args:
+            events: Event-Daten (oder Einträge, siehe event_data_of)
+            stage: Funktion Eintrag → (EKEvent oder None, Fehlertext)
+            batch_size: Operationen pro Commit (Standard: self.batch_size)
+            record_target_id: eventIdentifier nach dem Commit als 'target_id' speichern
+            event_data_of: Liefert die Event-Daten eines Eintrags für das Ergebnis
+        """
+        batch_size = max(1, batch_size or self.batch_size)
+        results = []
+        
+        for offset in range(0, len(events), batch_size):
+            staged = []
+            for item in events[offset:offset + batch_size]:
+                try:
+                    event, error = stage(item)
+                except Exception as e:
+                    event, error = None, str(e)
+                
+                event_data = event_data_of(item) if event_data_of else item
+                result = self._item_result(event_data, event is not None, error)
+                results.append(result)
+                if event is not None:
+                    staged.append((result, event))
+            
+            if not staged:
+                continue
+            
+            try:
+                committed, error = self._unpack_bridge_result(self.event_store.commit_(None))
+            except Exception as e:
+                committed, error = False, e
+            
+            if not committed:
+                self.logger.error(f"Commit fehlgeschlagen, verwerfe {len(staged)} Änderungen: {error}")
+                self.event_store.reset()
+                for result, _ in staged:
+                    result['success'] = False
+                    result['error'] = f"Commit fehlgeschlagen: {error}"
+                continue
+            
+            self._generation += 1
+            self._series_starts.clear()
+            if record_target_id:
+                for result, event in staged:
+                    result['target_id'] = event.eventIdentifier() or ''
+        
+        return results
+
+    def _resolve_event(self, calendar, event_data: Dict[str, Any]):
+        """
+        Findet ein Event per eventIdentifier, sonst über seine Eigenschaften
+        
+        Bei wiederkehrenden Events liefert eventWithIdentifier_ das erste
+        Vorkommen - weicht dessen Start ab, wird ebenfalls gesucht.
+        """
+        event_id = event_data.get('id')
+        if event_id:
+            event = self.event_store.eventWithIdentifier_(event_id)
+            if event is not None and self._matches_event_data(event, calendar, event_data):
+                return event
+        return self._find_event_by_properties(calendar, event_data)
+
+    def _matches_event_data(self, event, calendar, event_data: Dict[str, Any]) -> bool:
+        """Prüft, ob ein per Identifier gefundenes Event zu Kalender und Startzeit passt"""
+        event_calendar = event.calendar()
+        if event_calendar is None or event_calendar.calendarIdentifier() != calendar.calendarIdentifier():
+            return False
+        
+        start_date = event_data.get('start_date')
+        if isinstance(start_date, datetime):
+            event_start = event.startDate()
+            if event_start is None:
+                return False
+            return abs(event_start.timeIntervalSince1970() - start_date.timestamp()) < 1
+        return True
+
+    @staticmethod
+    def _unpack_bridge_result(result):
+        """PyObjC liefert bei NSError**-Methoden ein Tupel (Erfolg, Fehler)"""
+        if isinstance(result, tuple):
+            return bool(result[0]), result[1] if len(result) > 1 else None
+        return bool(result), None
+
     def _find_event_by_properties(self, calendar, event_data: Dict[str, Any]):
         """
         Findet ein Event anhand seiner Eigenschaften (Titel, Datum, etc.)
@@ -442,62 +929,131 @@ class EventKitCalendarClient:
             return None
             
         try:
-            calendars = self.event_store.calendarsForEntityType_(EventKit.EKEntityTypeEvent)
-            for calendar in calendars:
-                if calendar.title() == calendar_name:
-                    return calendar
-            return None
+            return self.calendar_registry.by_title(calendar_name)
         except Exception:
             return None
 
-    def _create_single_event(self, target_calendar, event_data: Dict[str, Any]) -> bool:
-        """Erstellt ein einzelnes Event"""
-        if not self.is_available():
-            return False
-            
-        try:
-            event = EventKit.EKEvent.eventWithEventStore_(self.event_store)
-            if not event:
-                return False
-            
-            # Setze Event-Eigenschaften
-            event.setTitle_(event_data.get('title', 'Untitled'))
-            event.setStartDate_(self._datetime_to_nsdate(event_data['start_date']))
-            event.setEndDate_(self._datetime_to_nsdate(event_data['end_date']))
-            
-            if 'description' in event_data and event_data['description']:
-                event.setNotes_(event_data['description'])
-            if 'location' in event_data and event_data['location']:
-                event.setLocation_(event_data['location'])
-                
-            event.setCalendar_(target_calendar)
-            
-            # Speichere Event
-            return self.event_store.saveEvent_span_error_(event, 0, None)
-            
-        except Exception:
-            return False
+    def _find_calendars(self, calendar_names: List[str]) -> Dict[str, Any]:
+        """Löst mehrere Kalendernamen über die Kalender-Registry auf"""
+        found = {}
+        for calendar_name in calendar_names:
+            calendar = self._find_calendar(calendar_name)
+            if calendar is not None:
+                found[calendar_name] = calendar
+        return found
+
+    def _build_event(self, target_calendar, event_data: Dict[str, Any]):
+        """Erstellt ein (noch nicht gespeichertes) EKEvent aus Event-Daten"""
+        event = EventKit.EKEvent.eventWithEventStore_(self.event_store)
+        if not event:
+            return None
+        
+        self._apply_event_data(event, event_data)
+        event.setCalendar_(target_calendar)
+        return event
+
+    @staticmethod
+    def _save_span(event_data: Dict[str, Any]):
+        """Serien werden als Ganzes gespeichert, alles andere als einzelnes Event"""
+        return EventKit.EKSpanFutureEvents if event_data.get('recurrence_rule') else EventKit.EKSpanThisEvent
 
-    def _convert_event_to_dict(self, event) -> Dict[str, Any]:
-        """Konvertiert ein EventKit-Event zu einem Dictionary"""
+    def _apply_event_data(self, event, event_data: Dict[str, Any], clear_missing: bool = False):
+        """
+        Überträgt Titel, Zeiten, Notizen, Ort und Wiederholung auf ein EKEvent
+        
+        Args:
+            clear_missing: Leere Notizen/Orte ebenfalls setzen (beim Aktualisieren)
+        """
+        event.setTitle_(event_data.get('title') or event_data.get('summary') or 'Kein Titel')
+        event.setStartDate_(self._datetime_to_nsdate(event_data['start_date']))
+        event.setEndDate_(self._datetime_to_nsdate(event_data['end_date']))
+        
+        if event_data.get('description') or clear_missing:
+            event.setNotes_(event_data.get('description') or None)
+        if event_data.get('location') or clear_missing:
+            event.setLocation_(event_data.get('location') or None)
+        
+        rule = parse_rule(event_data.get('recurrence_rule') or '')
+        if rule is not None and rule.portable:
+            event.setRecurrenceRules_([self._eventkit_rule(rule)])
+
+    def _convert_event(self, event, calendar_name: str = None, fields=ALL_FIELDS,
+                       start_ts: float = None) -> Optional[CalendarEvent]:
+        """
+        Konvertiert ein EventKit-Event in einem Durchgang zu einem CalendarEvent
+        
+        Args:
+            event: EKEvent
+            calendar_name: Bereits bekannter Kalendername (spart zwei Bridge-Aufrufe)
+            fields: Zu ladende Felder - alle übrigen werden bei Bedarf nachgeladen
+            start_ts: Bereits gelesener Start (spart einen Bridge-Aufruf)
+        """
         if not EVENTKIT_AVAILABLE:
-            return {}
+            return None
             
         try:
-            return {
-                'title': event.title() or '',
-                'start_date': self._nsdate_to_datetime(event.startDate()),
-                'end_date': self._nsdate_to_datetime(event.endDate()),
-                'description': event.notes() or '',
-                'location': event.location() or '',
-                'all_day': event.isAllDay(),
-                'recurrence': self._format_recurrence(event.recurrenceRules()),
-                'calendar': event.calendar().title() if event.calendar() else '',
-                'id': event.eventIdentifier() or ''
-            }
+            if calendar_name is None:
+                calendar = event.calendar()
+                calendar_name = calendar.title() if calendar else ''
+            
+            pending = self._pending_fields(fields)
+            recurrence = NO_RECURRENCE if FIELD_RECURRENCE in pending else self.load_event_field(event, FIELD_RECURRENCE)
+            record = CalendarEvent(
+                id=event.eventIdentifier() or '',
+                title=event.title() or '',
+                start_ts=self._nsdate_to_timestamp(event.startDate()) if start_ts is None else start_ts,
+                end_ts=0.0 if FIELD_END in pending else self.load_event_field(event, FIELD_END),
+                location='' if FIELD_LOCATION in pending else self.load_event_field(event, FIELD_LOCATION),
+                description='' if FIELD_DESCRIPTION in pending else self.load_event_field(event, FIELD_DESCRIPTION),
+                all_day=False if FIELD_ALL_DAY in pending else self.load_event_field(event, FIELD_ALL_DAY),
+                recurrence=recurrence[0],
+                calendar=calendar_name,
+                detached=recurrence[1],
+                series_start_ts=recurrence[2],
+                occurrence_ts=recurrence[3],
+                pending=pending,
+                source=event,
+                loader=self.field_loader
+            )
+            if not pending:
+                # Alle Felder liegen vor - Fingerprint gleich bei der Konvertierung
+                record.fingerprint
+            return record
         except Exception as e:
             self.logger.error(f"Fehler beim Konvertieren des Events: {e}")
-            return {}
+            return None
+
+    @staticmethod
+    def _pending_fields(fields):
+        """Nachzuladende Felder - pro Feldauswahl nur einmal berechnet"""
+        pending = _PENDING_FIELDS_CACHE.get(fields)
+        if pending is None:
+            pending = _PENDING_FIELDS_CACHE[fields] = LAZY_FIELDS - frozenset(fields)
+        return pending
+
+    def load_event_field(self, event, field: str):
+        """Liest ein einzelnes (teures) Feld eines EKEvent über die Bridge"""
+        if field == FIELD_END:
+            return self._nsdate_to_timestamp(event.endDate())
+        if field == FIELD_LOCATION:
+            return event.location() or ''
+        if field == FIELD_DESCRIPTION:
+            return event.notes() or ''
+        if field == FIELD_ALL_DAY:
+            return bool(event.isAllDay())
+        if field == FIELD_RECURRENCE:
+            return self._read_recurrence(event)
+        raise ValueError(f"Unbekanntes Feld: {field}")
+
+    def load_event_fields(self, requests: List[Tuple[Any, FrozenSet[str]]]) -> List[Dict[str, Any]]:
+        """
+        Liest die fehlenden Felder vieler EKEvents (siehe event_record.complete_events)
+
+        Args:
+            requests: (EKEvent, Felder) pro Datensatz
+        """
+        return [{field: self.load_event_field(event, field) for field in fields}
+                for event, fields in requests]
 
     def _datetime_to_nsdate(self, dt: datetime):
         """Konvertiert Python datetime zu NSDate"""
@@ -515,6 +1071,16 @@ class EventKitCalendarClient:
             self.logger.error(f"Fehler bei NSDate-Konvertierung: {e}")
             return None
 
+    def _nsdate_to_timestamp(self, nsdate) -> float:
+        """Konvertiert NSDate zu Epoch-Sekunden"""
+        if not EVENTKIT_AVAILABLE or not nsdate:
+            return datetime.now().timestamp()
+            
+        try:
+            return nsdate.timeIntervalSince1970()
+        except Exception:
+            return datetime.now().timestamp()
+
     def _nsdate_to_datetime(self, nsdate) -> datetime:
         """Konvertiert NSDate zu Python datetime"""
         if not EVENTKIT_AVAILABLE or not nsdate:
@@ -527,26 +1093,93 @@ class EventKitCalendarClient:
         except Exception:
             return datetime.now()
     
-    def _format_recurrence(self, recurrence_rules) -> str:
-        """Formatiert Wiederholungsregeln"""
+    def _read_recurrence(self, event) -> Tuple[str, bool, float, float]:
+        """
+        Liest Regel, Ausnahme-Status und Serienstart eines Vorkommens
+        
+        Returns:
+            (Regeltext, abgelöst, Serienstart, ursprünglicher Start) -
+            NO_RECURRENCE für Events ohne Wiederholung
+        """
+        rule = self._recurrence_from_eventkit(event.recurrenceRules())
+        if rule is None:
+            return NO_RECURRENCE
+        
+        occurrence_date = event.occurrenceDate()
+        occurrence_ts = self._nsdate_to_timestamp(occurrence_date) if occurrence_date else 0.0
+        return rule.to_text(), bool(event.isDetached()), self._series_start(event.eventIdentifier()), occurrence_ts
+
+    def _series_start(self, event_id: str) -> float:
+        """Start des ersten Vorkommens - ein Bridge-Aufruf pro Serie"""
+        start_ts = self._series_starts.get(event_id)
+        if start_ts is None:
+            master = self.event_store.eventWithIdentifier_(event_id) if event_id else None
+            start_ts = self._nsdate_to_timestamp(master.startDate()) if master is not None else 0.0
+            self._series_starts[event_id] = start_ts
+        return start_ts
+
+    def _recurrence_from_eventkit(self, recurrence_rules) -> Optional[RecurrenceRule]:
+        """Übersetzt EKRecurrenceRules in eine RecurrenceRule (None ohne Wiederholung)"""
         if not EVENTKIT_AVAILABLE or not recurrence_rules:
-            return ""
+            return None
             
         try:
-            # Vereinfachte Wiederholungsinfo
-            rule = recurrence_rules[0]  # Erste Regel verwenden
-            frequency = rule.frequency()
-            
-            frequency_map = {
-                EventKit.EKRecurrenceFrequencyDaily: "täglich",
-                EventKit.EKRecurrenceFrequencyWeekly: "wöchentlich", 
-                EventKit.EKRecurrenceFrequencyMonthly: "monatlich",
-                EventKit.EKRecurrenceFrequencyYearly: "jährlich"
-            }
-            
-            return frequency_map.get(frequency, "unbekannt")
-        except Exception:
-            return ""
+            rule = recurrence_rules[0]
+            frequency = {
+                EventKit.EKRecurrenceFrequencyDaily: DAILY,
+                EventKit.EKRecurrenceFrequencyWeekly: WEEKLY,
+                EventKit.EKRecurrenceFrequencyMonthly: MONTHLY,
+                EventKit.EKRecurrenceFrequencyYearly: YEARLY
+            }.get(rule.frequency())
+            if frequency is None:
+                return None
+            
+            # Nicht abgebildete Bestandteile → Serie wird einzeln übertragen
+            partial = len(recurrence_rules) > 1 or bool(
+                rule.daysOfTheMonth() or rule.monthsOfTheYear() or rule.weeksOfTheYear()
+                or rule.daysOfTheYear() or rule.setPositions()
+            )
+            weekdays = []
+            for day in rule.daysOfTheWeek() or ():
+                if day.weekNumber():
+                    partial = True
+                # EKWeekday: 1 = Sonntag ... 7 = Samstag
+                weekdays.append((day.dayOfTheWeek() - 2) % 7)
+            
+            until_ts = count = None
+            end = rule.recurrenceEnd()
+            if end is not None:
+                if end.endDate() is not None:
+                    until_ts = self._nsdate_to_timestamp(end.endDate())
+                elif end.occurrenceCount():
+                    count = int(end.occurrenceCount())
+            
+            return RecurrenceRule(frequency, rule.interval(), tuple(weekdays), until_ts, count, partial)
+        except Exception as e:
+            self.logger.debug(f"Wiederholungsregel nicht lesbar: {e}")
+            return None
+
+    def _eventkit_rule(self, rule: RecurrenceRule):
+        """Erstellt eine EKRecurrenceRule aus einer RecurrenceRule"""
+        frequency = {
+            DAILY: EventKit.EKRecurrenceFrequencyDaily,
+            WEEKLY: EventKit.EKRecurrenceFrequencyWeekly,
+            MONTHLY: EventKit.EKRecurrenceFrequencyMonthly,
+            YEARLY: EventKit.EKRecurrenceFrequencyYearly
+        }[rule.frequency]
+        days = [EventKit.EKRecurrenceDayOfWeek.dayOfWeek_((weekday + 1) % 7 + 1) for weekday in rule.weekdays]
+        
+        end = None
+        if rule.until_ts is not None:
+            end = EventKit.EKRecurrenceEnd.recurrenceEndWithEndDate_(
+                Foundation.NSDate.dateWithTimeIntervalSince1970_(rule.until_ts)
+            )
+        elif rule.count is not None:
+            end = EventKit.EKRecurrenceEnd.recurrenceEndWithOccurrenceCount_(rule.count)
+        
+        return EventKit.EKRecurrenceRule.alloc().initRecurrenceWithFrequency_interval_daysOfTheWeek_daysOfTheMonth_monthsOfTheYear_weeksOfTheYear_daysOfTheYear_setPositions_end_(
+            frequency, rule.interval, days or None, None, None, None, None, None, end
+        )
 
 
 def test_eventkit_client():
@@ -0,0 +1,59 @@
+"""
+Kooperativer Abbruch langer Vorgänge
+
+Ein CancellationToken wird vom GUI-Thread gesetzt und von Sync, Laden
+und Löschen zwischen zwei Blöcken geprüft - ein Vorgang endet damit
+spätestens nach dem laufenden Block (ein Store-Commit bzw. ein
+Ladefenster), nicht erst nach dem ganzen Job. Bereits geschriebene
+Blöcke bleiben bestehen; die Aufrufer melden das Teilergebnis.
+"""
+
+import threading
+from typing import Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class OperationCancelled(Exception):
+    """Der Vorgang wurde über sein CancellationToken abgebrochen"""
+
+
+class CancellationToken:
+    """Threadsicheres Abbruch-Flag"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """Fordert den Abbruch an (kehrt sofort zurück)"""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise OperationCancelled()
+
+
+def is_cancelled(cancel: Optional[CancellationToken]) -> bool:
+    """True, wenn ein (optionales) Token gesetzt ist"""
+    return cancel is not None and cancel.cancelled
+
+
+def cancellable(items: Iterable[T], cancel: Optional[CancellationToken]) -> Iterator[T]:
+    """
+    Reicht die Elemente durch und bricht mit OperationCancelled ab, sobald das Token gesetzt ist
+
+    Bei Generatoren, die fensterweise laden, wird so kein weiteres Fenster
+    mehr angefordert.
+    """
+    if cancel is None:
+        yield from items
+        return
+    is_set = cancel._event.is_set
+    for item in items:
+        if is_set():
+            raise OperationCancelled()
+        yield item
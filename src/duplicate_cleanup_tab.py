@@ -1,128 +1,136 @@
 import sys
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-                            QComboBox, QLabel, QTableWidget, QTableWidgetItem, 
-                            QCheckBox, QProgressBar, QTextEdit, QMessageBox,
+                            QComboBox, QLabel, QTreeView, 
+                            QProgressBar, QPlainTextEdit, QMessageBox,
                             QHeaderView, QFrame)
-from PyQt6.QtCore import QThread, pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, Qt, QModelIndex
 from PyQt6.QtGui import QFont
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable
 import logging
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
 
 # Import des vereinfachten Clients
-from simple_calendar_client import SimpleCalendarClient, DuplicateCheckMode
+from simple_calendar_client import DuplicateCheckMode
+from store_executor import StoreExecutor
+from store_jobs import StoreJob
+from cancellation import CancellationToken, OperationCancelled
+from progress import ProgressReporter, show_on_progress_bar
+from status_log import StatusLog, open_log_file
+from duplicate_engine import group_duplicate_series, series_check_fields, in_series
+from duplicate_tree_model import (DuplicateTreeModel, SELECT_NONE, SELECT_ALL, SELECT_KEEP_FIRST,
+                                  COLUMN_TITLE, COLUMN_DATE, COLUMN_TIME, COLUMN_LOCATION, COLUMN_GROUP)
 
 logger = logging.getLogger(__name__)
 
+# Bis zu so vielen Gruppen wird das Ergebnis aufgeklappt angezeigt
+AUTO_EXPAND_GROUPS = 100
+
 @dataclass
 class DuplicateGroup:
-    """Repräsentiert eine Gruppe von Duplikaten"""
+    """Repräsentiert eine Gruppe von Duplikaten (einzelne Events oder ganze Serien)"""
     events: List[Dict[str, Any]]
-    key: str
+    key: tuple
+    occurrences: List[int] = field(default_factory=list)  # Vorkommen pro Serie
     
     def __len__(self):
         return len(self.events)
+    
+    @property
+    def is_series(self) -> bool:
+        return bool(self.occurrences)
+
+def deletion_entry(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Lösch-Eintrag: Serien werden ab ihrem ersten Vorkommen ganz gelöscht"""
+    if in_series(event):
+        return {'id': event.id, 'title': event.title, 'whole_series': True}
+    return event
 
-class DuplicateSearchWorker(QThread):
+class DuplicateSearchWorker(StoreJob):
     """Worker für Duplikatsuche"""
     progress = pyqtSignal(str)
+    progress_update = pyqtSignal(object)  # ProgressUpdate
     duplicates_found = pyqtSignal(list)  # List[DuplicateGroup]
     error = pyqtSignal(str)
 
-    def __init__(self, client, calendar_name, check_mode):
-        super().__init__()
-        self.client = client
+    def __init__(self, store, calendar_name, check_mode):
+        super().__init__(store)
+        self.client = store.client
         self.calendar_name = calendar_name
         self.check_mode = check_mode
+        self.cancel = CancellationToken()
 
     def run(self):
         try:
             self.progress.emit(f"🔍 Lade Events aus '{self.calendar_name}'...")
             
-            # Events laden
-            events = self.client.get_events(self.calendar_name, 'all')
-            if not events:
+            # Events fensterweise laden und direkt gruppieren
+            loaded = [0]
+            
+            def counted(events):
+                for event in events:
+                    loaded[0] += 1
+                    if loaded[0] % 1000 == 0:
+                        self.progress.emit(f"📊 {loaded[0]} Events geladen...")
+                    yield event
+            
+            reporter = ProgressReporter(self.progress_update.emit)
+            reporter.start("Events laden und prüfen")
+            events = self.client.iter_events(self.calendar_name, 'all', series_check_fields(self.check_mode),
+                                             cancel=self.cancel, progress=reporter)
+            duplicate_groups = self._find_duplicates(counted(events))
+            reporter.finish()
+            
+            if not loaded[0]:
                 self.progress.emit("❌ Keine Events gefunden")
                 self.duplicates_found.emit([])
                 return
                 
-            self.progress.emit(f"📊 {len(events)} Events geladen, suche Duplikate...")
-            
-            # Duplikate finden
-            duplicate_groups = self._find_duplicates(events)
+            self.progress.emit(f"📊 {loaded[0]} Events geladen und geprüft")
             
             if duplicate_groups:
                 total_duplicates = sum(len(group) for group in duplicate_groups)
                 self.progress.emit(f"✅ {len(duplicate_groups)} Duplikatgruppen mit {total_duplicates} Events gefunden")
+                series_groups = sum(1 for group in duplicate_groups if group.is_series)
+                if series_groups:
+                    self.progress.emit(f"🔁 {series_groups} Gruppen bestehen aus ganzen Serien")
             else:
                 self.progress.emit("✅ Keine Duplikate gefunden")
                 
             self.duplicates_found.emit(duplicate_groups)
             
+        except OperationCancelled:
+            self.progress.emit("⏹️ Duplikatsuche abgebrochen")
         except Exception as e:
             logger.error(f"Fehler bei Duplikatsuche: {e}")
             self.error.emit(f"Fehler bei Duplikatsuche: {e}")
 
-    def _find_duplicates(self, events: List[Dict[str, Any]]) -> List[DuplicateGroup]:
-        """Findet Duplikate basierend auf dem gewählten Modus"""
-        groups = {}
-        
-        for event in events:
-            key = self._generate_key(event)
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(event)
-        
-        # Nur Gruppen mit mehr als einem Event sind Duplikate
-        duplicate_groups = []
-        for key, group_events in groups.items():
-            if len(group_events) > 1:
-                duplicate_groups.append(DuplicateGroup(group_events, key))
-        
-        return duplicate_groups
+    def _find_duplicates(self, events: Iterable[Dict[str, Any]]) -> List[DuplicateGroup]:
+        """
+        Findet Duplikate über die gemeinsame Duplikaterkennung
+        
+        Vorkommen einer Serie erscheinen nicht einzeln, sondern als eine
+        Zeile pro Serie (siehe group_duplicate_series).
+        """
+        groups, occurrences = group_duplicate_series(events, self.check_mode)
+        return [
+            DuplicateGroup(group_events, key,
+                           [occurrences[event.id] for event in group_events] if in_series(group_events[0]) else [])
+            for key, group_events in groups
+        ]
 
-    def _generate_key(self, event: Dict[str, Any]) -> str:
-        """Generiert einen Schlüssel für Duplikatsprüfung"""
-        title = event.get('title', '').strip().lower()
-        start_date = event.get('start_date', '')
-        
-        if self.check_mode == DuplicateCheckMode.LOOSE:
-            # Nur Titel + Datum
-            if isinstance(start_date, datetime):
-                date_str = start_date.strftime('%Y-%m-%d')
-            else:
-                date_str = str(start_date)[:10] if start_date else ''
-            return f"{title}|{date_str}"
-            
-        elif self.check_mode == DuplicateCheckMode.MODERATE:
-            # Titel + Datum + Zeit
-            if isinstance(start_date, datetime):
-                datetime_str = start_date.strftime('%Y-%m-%d %H:%M')
-            else:
-                datetime_str = str(start_date)[:16] if start_date else ''
-            return f"{title}|{datetime_str}"
-            
-        else:  # STRICT
-            # Titel + Datum + Zeit + Ort
-            location = event.get('location', '').strip().lower()
-            if isinstance(start_date, datetime):
-                datetime_str = start_date.strftime('%Y-%m-%d %H:%M')
-            else:
-                datetime_str = str(start_date)[:16] if start_date else ''
-            return f"{title}|{datetime_str}|{location}"
-
-class DuplicateCleanupWorker(QThread):
+class DuplicateCleanupWorker(StoreJob):
     """Worker für Duplikat-Löschung"""
     progress = pyqtSignal(str)
+    progress_update = pyqtSignal(object)  # ProgressUpdate
     cleanup_complete = pyqtSignal(int, int)  # deleted_count, error_count
     error = pyqtSignal(str)
 
-    def __init__(self, client, calendar_name, events_to_delete):
-        super().__init__()
-        self.client = client
+    def __init__(self, store, calendar_name, events_to_delete):
+        super().__init__(store)
+        self.client = store.client
         self.calendar_name = calendar_name
         self.events_to_delete = events_to_delete
+        self.cancel = CancellationToken()
 
     def run(self):
         try:
@@ -130,23 +138,31 @@ class DuplicateCleanupWorker(QThread):
             
             deleted_count = 0
             error_count = 0
+            total = len(self.events_to_delete)
+            chunk_size = self.client.batch_size
+            reporter = ProgressReporter(self.progress_update.emit)
+            reporter.start("Events löschen", total)
             
-            for i, event in enumerate(self.events_to_delete, 1):
-                try:
-                    # Event löschen
-                    success = self.client.delete_event(self.calendar_name, event)
-                    if success:
+            # Ein Store-Commit pro Block - Events werden per Identifier aufgelöst
+            for offset in range(0, total, chunk_size):
+                if self.cancel.cancelled:
+                    self.progress.emit(f"⏹️ Löschen abgebrochen nach {offset} von {total} Events")
+                    break
+                chunk = self.events_to_delete[offset:offset + chunk_size]
+                results = self.client.delete_events(self.calendar_name, chunk)
+                
+                # Eine Meldung pro Block - Fehler weiterhin einzeln
+                for i, result in enumerate(results, offset + 1):
+                    if result['success']:
                         deleted_count += 1
-                        self.progress.emit(f"✅ {i}/{len(self.events_to_delete)}: '{event.get('title', 'Unbekannt')}' gelöscht")
                     else:
                         error_count += 1
-                        self.progress.emit(f"❌ {i}/{len(self.events_to_delete)}: Fehler beim Löschen von '{event.get('title', 'Unbekannt')}'")
-                        
-                except Exception as e:
-                    error_count += 1
-                    logger.error(f"Fehler beim Löschen von Event: {e}")
-                    self.progress.emit(f"❌ {i}/{len(self.events_to_delete)}: Fehler - {e}")
+                        title = result.get('title') or 'Unbekannt'
+                        self.progress.emit(f"❌ {i}/{total}: Fehler beim Löschen von '{title}' - {result.get('error')}")
+                self.progress.emit(f"✅ {offset + len(results)}/{total}: {deleted_count} gelöscht")
+                reporter.advance(len(results))
             
+            reporter.finish(not self.cancel.cancelled)
             self.cleanup_complete.emit(deleted_count, error_count)
             
         except Exception as e:
@@ -159,9 +175,9 @@ class DuplicateCleanupTab(QWidget):
     status_message = pyqtSignal(str)
     error_message = pyqtSignal(str)
     
-    def __init__(self, calendar_client: SimpleCalendarClient):
+    def __init__(self, store: StoreExecutor):
         super().__init__()
-        self.calendar_client = calendar_client
+        self.store = store
         self.duplicate_groups = []
         self.search_worker = None
         self.cleanup_worker = None
@@ -200,7 +216,8 @@ class DuplicateCleanupTab(QWidget):
         self.check_mode_combo.addItems([
             "🔍 Locker (Titel + Datum)",
             "⚖️ Moderat (Titel + Datum + Zeit)",
-            "🎯 Strikt (Titel + Datum + Zeit + Ort)"
+            "🎯 Strikt (Titel + Datum + Zeit + Ort)",
+            "🧬 Identisch (kompletter Inhalt)"
         ])
         self.check_mode_combo.setCurrentIndex(1)  # Moderat als Standard
         self.check_mode_combo.setMinimumWidth(300)
@@ -233,23 +250,25 @@ class DuplicateCleanupTab(QWidget):
         table_label.setFont(QFont("", 12, QFont.Weight.Bold))
         layout.addWidget(table_label)
         
-        self.duplicates_table = QTableWidget()
-        self.duplicates_table.setColumnCount(6)
-        self.duplicates_table.setHorizontalHeaderLabels([
-            "Auswahl", "Titel", "Datum", "Zeit", "Ort", "Gruppe"
-        ])
-        
-        # Spaltenbreiten anpassen
-        header = self.duplicates_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Fixed)
-        
-        self.duplicates_table.setColumnWidth(0, 80)
-        self.duplicates_table.setColumnWidth(5, 80)
+        # Gruppen als Elternzeilen, Events als Kinder - Zeilen werden nachgeladen
+        self.duplicates_model = DuplicateTreeModel(self)
+        self.duplicates_table = QTreeView()
+        self.duplicates_table.setModel(self.duplicates_model)
+        self.duplicates_table.setUniformRowHeights(True)
+        
+        # Spaltenbreiten anpassen (ohne ResizeToContents - das vermisst alle Zeilen)
+        header = self.duplicates_table.header()
+        header.setStretchLastSection(False)
+        header.setSectionResizeMode(COLUMN_TITLE, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(COLUMN_DATE, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(COLUMN_TIME, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(COLUMN_LOCATION, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(COLUMN_GROUP, QHeaderView.ResizeMode.Fixed)
+        
+        self.duplicates_table.setColumnWidth(COLUMN_DATE, 110)
+        self.duplicates_table.setColumnWidth(COLUMN_TIME, 60)
+        self.duplicates_table.setColumnWidth(COLUMN_LOCATION, 150)
+        self.duplicates_table.setColumnWidth(COLUMN_GROUP, 80)
         
         layout.addWidget(self.duplicates_table)
         
@@ -272,6 +291,16 @@ class DuplicateCleanupTab(QWidget):
         self.smart_select_button.setToolTip("Wählt automatisch Duplikate aus, behält Originale")
         selection_layout.addWidget(self.smart_select_button)
         
+        self.expand_button = QPushButton('⊞ Alle aufklappen')
+        self.expand_button.clicked.connect(self.duplicates_table.expandAll)
+        self.expand_button.setEnabled(False)
+        selection_layout.addWidget(self.expand_button)
+        
+        self.collapse_button = QPushButton('⊟ Alle einklappen')
+        self.collapse_button.clicked.connect(self.duplicates_table.collapseAll)
+        self.collapse_button.setEnabled(False)
+        selection_layout.addWidget(self.collapse_button)
+        
         selection_layout.addStretch()
         layout.addLayout(selection_layout)
         
@@ -282,14 +311,22 @@ class DuplicateCleanupTab(QWidget):
         self.cleanup_button.setEnabled(False)
         self.cleanup_button.setStyleSheet("QPushButton { background-color: #f44336; color: white; font-weight: bold; padding: 8px; }")
         cleanup_layout.addWidget(self.cleanup_button)
+        
+        self.cancel_button = QPushButton('⏹️ Abbrechen')
+        self.cancel_button.clicked.connect(self.cancel_running)
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.setToolTip("Bricht Suche bzw. Löschen nach dem laufenden Block ab")
+        cleanup_layout.addWidget(self.cancel_button)
         cleanup_layout.addStretch()
         layout.addLayout(cleanup_layout)
         
         # Status-Anzeige
-        self.status_text = QTextEdit()
+        self.status_text = QPlainTextEdit()
+        self.status_text.setReadOnly(True)
         self.status_text.setMaximumHeight(100)
         self.status_text.setPlaceholderText("Status-Meldungen erscheinen hier...")
         layout.addWidget(self.status_text)
+        self.status_log = StatusLog(self.status_text, open_log_file())
         
         self.setLayout(layout)
 
@@ -311,104 +348,67 @@ class DuplicateCleanupTab(QWidget):
             check_mode = DuplicateCheckMode.LOOSE
         elif mode_index == 1:
             check_mode = DuplicateCheckMode.MODERATE
-        else:
+        elif mode_index == 2:
             check_mode = DuplicateCheckMode.STRICT
+        else:
+            check_mode = DuplicateCheckMode.EXACT
         
         # UI für Suche vorbereiten
         self.search_button.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate
-        self.duplicates_table.setRowCount(0)
+        self.duplicates_model.set_groups([])
         self.duplicate_groups = []
         
         # Worker starten
         self.search_worker = DuplicateSearchWorker(
-            self.calendar_client, calendar_name, check_mode
+            self.store, calendar_name, check_mode
         )
         self.search_worker.progress.connect(self.update_status)
+        self.search_worker.progress_update.connect(self.show_progress)
         self.search_worker.duplicates_found.connect(self.display_duplicates)
         self.search_worker.error.connect(self.handle_error)
         self.search_worker.finished.connect(self.search_finished)
         self.search_worker.start()
+        self.cancel_button.setEnabled(True)
 
     def display_duplicates(self, duplicate_groups: List[DuplicateGroup]):
-        """Zeigt gefundene Duplikate in der Tabelle an"""
+        """Zeigt gefundene Duplikate gruppiert an"""
         self.duplicate_groups = duplicate_groups
         
         if not duplicate_groups:
             self.update_status("✅ Keine Duplikate gefunden")
             return
         
-        # Tabelle füllen
-        total_events = sum(len(group) for group in duplicate_groups)
-        self.duplicates_table.setRowCount(total_events)
-        
-        row = 0
-        for group_idx, group in enumerate(duplicate_groups, 1):
-            for event_idx, event in enumerate(group.events):
-                # Checkbox
-                checkbox = QCheckBox()
-                self.duplicates_table.setCellWidget(row, 0, checkbox)
-                
-                # Event-Details
-                title = event.get('title', 'Unbekannt')
-                start_date = event.get('start_date', '')
-                
-                if isinstance(start_date, datetime):
-                    date_str = start_date.strftime('%d.%m.%Y')
-                    time_str = start_date.strftime('%H:%M')
-                else:
-                    date_str = str(start_date)[:10] if start_date else ''
-                    time_str = str(start_date)[11:16] if len(str(start_date)) > 10 else ''
-                
-                location = event.get('location', '')
-                
-                self.duplicates_table.setItem(row, 1, QTableWidgetItem(title))
-                self.duplicates_table.setItem(row, 2, QTableWidgetItem(date_str))
-                self.duplicates_table.setItem(row, 3, QTableWidgetItem(time_str))
-                self.duplicates_table.setItem(row, 4, QTableWidgetItem(location))
-                self.duplicates_table.setItem(row, 5, QTableWidgetItem(f"#{group_idx}"))
-                
-                row += 1
+        # Das Modell übernimmt die Gruppen; die Ansicht lädt sichtbare Zeilen nach
+        self.duplicates_model.set_groups(duplicate_groups)
+        total_events = self.duplicates_model.event_count()
+        if len(duplicate_groups) <= AUTO_EXPAND_GROUPS:
+            # Kleine Ergebnisse sofort vollständig laden und aufgeklappt zeigen
+            self.duplicates_model.fetchMore(QModelIndex())
+            self.duplicates_table.expandAll()
         
         # Buttons aktivieren
         self.select_all_button.setEnabled(True)
         self.select_none_button.setEnabled(True)
         self.smart_select_button.setEnabled(True)
+        self.expand_button.setEnabled(True)
+        self.collapse_button.setEnabled(True)
         self.cleanup_button.setEnabled(True)
         
         self.update_status(f"✅ {len(duplicate_groups)} Duplikatgruppen mit {total_events} Events gefunden")
 
     def select_all(self):
         """Wählt alle Duplikate aus"""
-        for row in range(self.duplicates_table.rowCount()):
-            checkbox = self.duplicates_table.cellWidget(row, 0)
-            if checkbox:
-                checkbox.setChecked(True)
+        self.duplicates_model.select(SELECT_ALL)
 
     def select_none(self):
         """Wählt alle Duplikate ab"""
-        for row in range(self.duplicates_table.rowCount()):
-            checkbox = self.duplicates_table.cellWidget(row, 0)
-            if checkbox:
-                checkbox.setChecked(False)
+        self.duplicates_model.select(SELECT_NONE)
 
     def smart_select(self):
         """Intelligente Auswahl: Behält das erste Event jeder Gruppe, markiert den Rest"""
-        self.select_none()  # Erst alle abwählen
-        
-        row = 0
-        for group in self.duplicate_groups:
-            # Erstes Event der Gruppe überspringen (Original behalten)
-            row += 1
-            
-            # Restliche Events der Gruppe auswählen (Duplikate)
-            for _ in range(len(group.events) - 1):
-                checkbox = self.duplicates_table.cellWidget(row, 0)
-                if checkbox:
-                    checkbox.setChecked(True)
-                row += 1
-        
+        self.duplicates_model.select(SELECT_KEEP_FIRST)
         self.update_status("🎯 Smart Select: Originale behalten, Duplikate ausgewählt")
 
     def cleanup_selected(self):
@@ -419,27 +419,20 @@ class DuplicateCleanupTab(QWidget):
             return
             
         # Sammle ausgewählte Events
-        selected_count = 0
-        selected_events = []
-        
-        row = 0
-        for group in self.duplicate_groups:
-            for event in group.events:
-                checkbox = self.duplicates_table.cellWidget(row, 0)
-                if checkbox and checkbox.isChecked():
-                    selected_count += 1
-                    selected_events.append(event)
-                row += 1
+        selected_events = [deletion_entry(event) for event in self.duplicates_model.checked_events()]
+        selected_count = len(selected_events)
         
         if selected_count == 0:
             self.error_message.emit("❌ Keine Events ausgewählt")
             return
         
         # Bestätigung
+        series_count = sum(1 for event in selected_events if event.get('whole_series'))
+        series_note = f" (davon {series_count} ganze Serien mit allen Vorkommen)" if series_count else ""
         reply = QMessageBox.question(
             self, 
             "Duplikate löschen",
-            f"Möchten Sie wirklich {selected_count} Events löschen?\n\n"
+            f"Möchten Sie wirklich {selected_count} Events löschen{series_note}?\n\n"
             f"⚠️ Diese Aktion kann nicht rückgängig gemacht werden!",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No
@@ -455,13 +448,15 @@ class DuplicateCleanupTab(QWidget):
         
         # Worker starten
         self.cleanup_worker = DuplicateCleanupWorker(
-            self.calendar_client, calendar_name, selected_events
+            self.store, calendar_name, selected_events
         )
         self.cleanup_worker.progress.connect(self.update_status)
+        self.cleanup_worker.progress_update.connect(self.show_progress)
         self.cleanup_worker.cleanup_complete.connect(self.cleanup_finished)
         self.cleanup_worker.error.connect(self.handle_error)
         self.cleanup_worker.finished.connect(self.cleanup_worker_finished)
         self.cleanup_worker.start()
+        self.cancel_button.setEnabled(True)
 
     def cleanup_finished(self, deleted_count: int, error_count: int):
         """Wird aufgerufen, wenn die Bereinigung abgeschlossen ist"""
@@ -479,18 +474,45 @@ class DuplicateCleanupTab(QWidget):
         """Wird aufgerufen, wenn der Cleanup-Worker beendet ist"""
         self.progress_bar.setVisible(False)
         self.cleanup_button.setEnabled(True)
+        self._update_cancel_button(self.cleanup_worker)
 
     def search_finished(self):
         """Wird aufgerufen, wenn die Suche beendet ist"""
         self.progress_bar.setVisible(False)
         self.search_button.setEnabled(True)
+        self._update_cancel_button(self.search_worker)
+
+    def cancel_running(self):
+        """Bricht laufende Suche bzw. Löschung nach dem aktuellen Block ab"""
+        for worker in (self.search_worker, self.cleanup_worker):
+            if worker is not None and worker.isRunning():
+                worker.cancel.cancel()
+        self.cancel_button.setEnabled(False)
+
+    def wait_for_workers(self):
+        """Bricht laufende Worker ab und wartet auf ihr Ende (z.B. beim Schließen)"""
+        self.cancel_running()
+        for worker in (self.search_worker, self.cleanup_worker):
+            if worker is not None:
+                worker.wait()
+
+    def _update_cancel_button(self, finished_worker):
+        """Abbrechen bleibt aktiv, solange der andere Worker noch läuft"""
+        self.cancel_button.setEnabled(any(
+            worker is not None and worker is not finished_worker and worker.isRunning()
+            and not worker.cancel.cancelled
+            for worker in (self.search_worker, self.cleanup_worker)
+        ))
+
+    def show_progress(self, update):
+        """Zeigt Phase, Stand, Durchsatz und Restzeit im Fortschrittsbalken"""
+        show_on_progress_bar(self.progress_bar, update)
+        if update.finished:
+            self.update_status(f"⏱️ {update.describe()}")
 
     def update_status(self, message: str):
         """Aktualisiert die Status-Anzeige"""
-        self.status_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
-        self.status_text.verticalScrollBar().setValue(
-            self.status_text.verticalScrollBar().maximum()
-        )
+        self.status_log.append(message)
 
     def handle_error(self, error_message: str):
         """Behandelt Fehlermeldungen"""
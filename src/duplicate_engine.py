@@ -0,0 +1,305 @@
+"""
+Gemeinsame Duplikaterkennung für Sync, manuelle Auswahl und Bereinigung
+
+Alle Pfade (SimpleCalendarClient, manueller Tab, Bereinigungs-Tab) nutzen
+dieselben Regeln:
+
+- LOOSE:    gleicher Titel, gleicher Kalendertag
+- MODERATE: gleicher Titel, Start höchstens 60 Sekunden auseinander
+- STRICT:   wie MODERATE, zusätzlich gleicher Ort
+- EXACT:    identischer Inhalt (gleicher Inhalts-Fingerprint)
+
+Für die Bereinigung zählt eine Serie als eine Einheit: ihre Vorkommen
+werden zu einem Stellvertreter zusammengefasst, Serien nur mit Serien
+gleicher Regel verglichen (siehe group_duplicate_series).
+
+Titel und Orte werden einmal normalisiert (casefold, Leerraum
+zusammengefasst), Startzeiten als Epoch-Sekunden und Tages-Ordinal
+vorberechnet. Schlüssel sind kompakte Tupel statt formatierter Strings.
+"""
+
+import logging
+from datetime import date, datetime
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+try:
+    from src.event_record import ALL_FIELDS, DEDUP_FIELDS, FIELD_RECURRENCE, CalendarEvent, event_fingerprint
+except ImportError:
+    from event_record import ALL_FIELDS, DEDUP_FIELDS, FIELD_RECURRENCE, CalendarEvent, event_fingerprint
+
+logger = logging.getLogger(__name__)
+
+TOLERANCE_SECONDS = 60
+
+
+class DuplicateCheckMode:
+    LOOSE = "loose"
+    MODERATE = "moderate"
+    STRICT = "strict"
+    EXACT = "exact"
+
+
+# Modi mit exaktem Schlüssel (ohne Zeittoleranz)
+_EXACT_KEY_MODES = (DuplicateCheckMode.LOOSE, DuplicateCheckMode.EXACT)
+
+
+def check_fields(check_mode: str):
+    """Feldauswahl, die ein Prüfmodus beim Laden braucht"""
+    if check_mode == DuplicateCheckMode.EXACT:
+        return ALL_FIELDS
+    return DEDUP_FIELDS
+
+
+def series_check_fields(check_mode: str):
+    """Feldauswahl für group_duplicate_series (zusätzlich die Wiederholung)"""
+    return check_fields(check_mode) | {FIELD_RECURRENCE}
+
+
+def in_series(event: Any) -> bool:
+    """Ist das Event ein reguläres Vorkommen einer Serie (keine abgelöste Ausnahme)?"""
+    return isinstance(event, CalendarEvent) and bool(event.recurrence) and not event.detached
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """Casefold + zusammengefasster Leerraum"""
+    if not value:
+        return ''
+    return ' '.join(value.split()).casefold()
+
+
+def _parse_start(value):
+    """Konvertiert einen Startwert zu datetime (ISO-String oder datetime)"""
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            # Fallback für andere Datumsformate
+            from dateutil import parser
+            return parser.parse(value)
+    return value
+
+
+def normalize_event(event: Dict[str, Any], check_mode: str) -> Optional[Tuple[tuple, int, int]]:
+    """
+    Normalisiert ein Event für die Duplikaterkennung
+
+    Returns:
+        (Schlüssel-Präfix, Start in Epoch-Sekunden, Tages-Ordinal) oder
+        None, wenn das Event keinen Titel oder Start hat
+    """
+    try:
+        start_ts = getattr(event, 'start_ts', None)
+        if start_ts is not None:
+            # CalendarEvent: Epoch-Sekunden liegen bereits vor
+            title = normalize_text(event.title)
+            if not title:
+                return None
+            seconds = int(start_ts)
+            day = date.fromtimestamp(start_ts).toordinal()
+        else:
+            title = normalize_text(event.get('title', '') or event.get('summary', ''))
+            start = event.get('start_date')
+            if not title or not start:
+                return None
+            start = _parse_start(start)
+            seconds = int(start.timestamp())
+            day = start.toordinal()
+
+        if check_mode == DuplicateCheckMode.EXACT:
+            prefix = (event_fingerprint(event),)
+        elif check_mode == DuplicateCheckMode.STRICT:
+            prefix = (title, normalize_text(event.get('location', '')))
+        else:
+            prefix = (title,)
+        return prefix, seconds, day
+    except Exception as e:
+        logger.warning(f"Event nicht vergleichbar: {e}")
+        return None
+
+
+def is_duplicate(event1: Dict[str, Any], event2: Dict[str, Any], check_mode: str) -> bool:
+    """Prüft zwei einzelne Events (für Massenvergleiche DuplicateIndex nutzen)"""
+    first = normalize_event(event1, check_mode)
+    second = normalize_event(event2, check_mode)
+    if first is None or second is None or first[0] != second[0]:
+        return False
+    if check_mode in _EXACT_KEY_MODES:
+        return first[2] == second[2]
+    return abs(first[1] - second[1]) <= TOLERANCE_SECONDS
+
+
+class DuplicateIndex:
+    """
+    Hash-Index über Ziel-Events
+
+    Jedes Ziel-Event wird einmal normalisiert, danach kostet die Prüfung
+    eines Events O(1). MODERATE/STRICT legen Events in Minuten-Buckets ab
+    und prüfen die Nachbar-Buckets für die 60-Sekunden-Toleranz. Zu jedem
+    Eintrag wird nur der Identifier des Ziel-Events gespeichert.
+    """
+
+    def __init__(self, target_events: Iterable[Dict[str, Any]], check_mode: str):
+        self.check_mode = check_mode
+        self._buckets = {}
+        self._count = 0
+        for event in target_events:
+            self.add(event)
+
+    def __len__(self):
+        return self._count
+
+    def add(self, event: Dict[str, Any]):
+        """Nimmt ein Event in den Index auf"""
+        normalized = normalize_event(event, self.check_mode)
+        if normalized is None:
+            return
+        prefix, seconds, day = normalized
+        self._count += 1
+
+        event_id = event.get('id') or ''
+
+        if self.check_mode in _EXACT_KEY_MODES:
+            self._buckets.setdefault(prefix + (day,), event_id)
+            return
+
+        key = prefix + (seconds // 60,)
+        if key not in self._buckets:
+            self._buckets[key] = []
+        self._buckets[key].append((seconds, event_id))
+
+    def contains(self, event: Dict[str, Any]) -> bool:
+        """Prüft, ob ein gleichwertiges Event im Index liegt"""
+        return self.match(event) is not None
+
+    def match(self, event: Dict[str, Any]) -> Optional[str]:
+        """
+        Sucht ein gleichwertiges Event im Index
+
+        Returns:
+            Identifier des gefundenen Ziel-Events ('' ohne Identifier)
+            oder None, wenn es keines gibt
+        """
+        normalized = normalize_event(event, self.check_mode)
+        if normalized is None:
+            return None
+        prefix, seconds, day = normalized
+
+        if self.check_mode in _EXACT_KEY_MODES:
+            return self._buckets.get(prefix + (day,))
+
+        bucket = seconds // 60
+        for neighbour in (bucket - 1, bucket, bucket + 1):
+            for other, event_id in self._buckets.get(prefix + (neighbour,), ()):
+                if abs(seconds - other) <= TOLERANCE_SECONDS:
+                    return event_id
+        return None
+
+
+def filter_new(source_events: Iterable[Dict[str, Any]], target_events: Iterable[Dict[str, Any]],
+               check_mode: str) -> List[Dict[str, Any]]:
+    """Liefert die Quell-Events, die noch nicht in target_events existieren"""
+    index = DuplicateIndex(target_events, check_mode)
+    return [event for event in source_events if not index.contains(event)]
+
+
+def duplicate_flags(events: Iterable[Dict[str, Any]], target_events: Iterable[Dict[str, Any]],
+                    check_mode: str) -> List[bool]:
+    """True/False pro Event, je nachdem ob es in target_events existiert"""
+    index = DuplicateIndex(target_events, check_mode)
+    return [index.contains(event) for event in events]
+
+
+def group_duplicates(events: Iterable[Dict[str, Any]], check_mode: str) -> List[Tuple[tuple, List[Dict[str, Any]]]]:
+    """
+    Gruppiert Duplikate innerhalb eines Kalenders
+
+    Bei MODERATE/STRICT ist das früheste Event einer Gruppe ihr Anker;
+    weitere Events gehören dazu, wenn sie höchstens 60 Sekunden vom
+    Anker entfernt beginnen.
+
+    Returns:
+        Liste von (Schlüssel, Events) für Gruppen mit mehr als einem Event,
+        in der Reihenfolge des jeweils ersten Events
+    """
+    normalized = []
+    for position, event in enumerate(events):
+        entry = normalize_event(event, check_mode)
+        if entry is not None:
+            normalized.append((entry[1], position, entry, event))
+
+    groups = {}
+    order = []
+
+    if check_mode in _EXACT_KEY_MODES:
+        for _, position, (prefix, _, day), event in normalized:
+            key = prefix + (day,)
+            if key not in groups:
+                groups[key] = []
+                order.append(key)
+            groups[key].append(event)
+    else:
+        anchors = {}
+        normalized.sort(key=lambda entry: (entry[0], entry[1]))
+        for seconds, _, (prefix, _, _), event in normalized:
+            bucket = seconds // 60
+            key = None
+            for neighbour in (bucket - 1, bucket):
+                for anchor_seconds, anchor_key in anchors.get(prefix + (neighbour,), ()):
+                    if seconds - anchor_seconds <= TOLERANCE_SECONDS:
+                        key = anchor_key
+                        break
+                if key is not None:
+                    break
+
+            if key is None:
+                key = prefix + (seconds,)
+                anchor_bucket = prefix + (bucket,)
+                if anchor_bucket not in anchors:
+                    anchors[anchor_bucket] = []
+                anchors[anchor_bucket].append((seconds, key))
+                groups[key] = []
+                order.append(key)
+            groups[key].append(event)
+
+    return [(key, groups[key]) for key in order if len(groups[key]) > 1]
+
+
+def group_duplicate_series(events: Iterable[Dict[str, Any]], check_mode: str) \
+        -> Tuple[List[Tuple[tuple, List[Dict[str, Any]]]], Dict[str, int]]:
+    """
+    Gruppiert Duplikate, wobei jede Serie als eine Einheit zählt
+
+    Reguläre Vorkommen werden über den Identifier ihrer Serie zu einem
+    Stellvertreter zusammengefasst (CalendarEvent.series_master). Serien
+    sind Duplikate, wenn ihre Regeln gleich sind und ihre Stellvertreter
+    nach check_mode übereinstimmen. Einzelne Events und abgelöste
+    Ausnahmen werden wie bei group_duplicates verglichen.
+
+    Returns:
+        (Gruppen wie bei group_duplicates - Serien-Gruppen zuletzt,
+         Identifier der Serie → Anzahl ihrer Vorkommen)
+    """
+    singles = []
+    masters = {}
+    occurrences = {}
+    for event in events:
+        if not in_series(event):
+            singles.append(event)
+        elif event.id in occurrences:
+            occurrences[event.id] += 1
+        else:
+            occurrences[event.id] = 1
+            masters[event.id] = event.series_master()
+
+    groups = group_duplicates(singles, check_mode)
+
+    # Regel als Teil des Schlüssels: wöchentlich und täglich sind nie Duplikate
+    by_rule = {}
+    for master in masters.values():
+        if master.recurrence not in by_rule:
+            by_rule[master.recurrence] = []
+        by_rule[master.recurrence].append(master)
+    for rule, members in by_rule.items():
+        groups.extend(((rule,) + key, group) for key, group in group_duplicates(members, check_mode))
+
+    return groups, occurrences
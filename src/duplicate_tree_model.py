@@ -0,0 +1,249 @@
+"""
+Baummodell für die Ergebnisse der Duplikatbereinigung
+
+Gruppen sind Elternzeilen, ihre Events die Kinder. Die Gruppen werden
+blockweise nachgeladen (fetchMore), sobald die Ansicht scrollt; Kinder
+werden erst beim Aufklappen gezeichnet. Die Auswahl liegt im Modell:
+ein Grundzustand für alle Events (keins, alle, alle außer dem ersten
+jeder Gruppe) plus die Events, die davon abweichen. "Alle auswählen"
+und "Smart Select" sind damit O(1), die Löschliste entsteht aus den
+Modelldaten.
+"""
+
+from datetime import datetime
+from typing import List, Dict, Any, Iterator, Tuple
+
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex, Qt
+
+from recurrence import parse_rule
+
+SELECT_NONE = 0
+SELECT_ALL = 1
+SELECT_KEEP_FIRST = 2
+
+COLUMN_TITLE, COLUMN_DATE, COLUMN_TIME, COLUMN_LOCATION, COLUMN_GROUP = range(5)
+HEADERS = ["Titel", "Datum", "Zeit", "Ort", "Gruppe"]
+
+# Gruppen pro fetchMore
+FETCH_BATCH = 500
+
+
+def event_columns(group, position: int) -> Tuple[str, str, str, str]:
+    """Titel, Datum, Zeit und Ort eines Events für die Anzeige"""
+    event = group.events[position]
+    title = event.get('title', 'Unbekannt')
+    start_date = event.get('start_date', '')
+
+    if isinstance(start_date, datetime):
+        date_str = start_date.strftime('%d.%m.%Y')
+        time_str = start_date.strftime('%H:%M')
+    else:
+        date_str = str(start_date)[:10] if start_date else ''
+        time_str = str(start_date)[11:16] if len(str(start_date)) > 10 else ''
+
+    if group.is_series:
+        # Eine Zeile pro Serie: Start der Serie, Regel und Anzahl Vorkommen
+        rule = parse_rule(event.recurrence)
+        label = rule.label() if rule else "Serie"
+        title = f"🔁 {title} ({label}, {group.occurrences[position]} Vorkommen)"
+        date_str = f"ab {date_str}"
+
+    return title, date_str, time_str, event.get('location', '')
+
+
+class _GroupNode:
+    """Verweis einer Kindzeile auf ihre Gruppe (internalPointer)"""
+
+    __slots__ = ('row', 'group')
+
+    def __init__(self, row: int, group):
+        self.row = row
+        self.group = group
+
+
+class DuplicateTreeModel(QAbstractItemModel):
+    """Duplikatgruppen mit ihren Events, checkbar auf Gruppen- und Eventebene"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._nodes = []
+        self._fetched = 0
+        self._mode = SELECT_NONE
+        self._toggled = set()  # (Gruppe, Position) abweichend vom Grundzustand
+
+    # Struktur
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column)
+        return self.createIndex(row, column, self._nodes[parent.row()])
+
+    def parent(self, child: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not child.isValid():
+            return QModelIndex()
+        node = child.internalPointer()
+        if node is None:
+            return QModelIndex()
+        return self.createIndex(node.row, 0)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return self._fetched
+        if parent.internalPointer() is None and parent.column() == 0:
+            return len(self._nodes[parent.row()].group.events)
+        return 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(HEADERS)
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if not parent.isValid():
+            return self._fetched > 0
+        return parent.internalPointer() is None and parent.column() == 0
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        return not parent.isValid() and self._fetched < len(self._nodes)
+
+    def fetchMore(self, parent: QModelIndex):
+        if parent.isValid():
+            return
+        count = min(FETCH_BATCH, len(self._nodes) - self._fetched)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._fetched, self._fetched + count - 1)
+        self._fetched += count
+        self.endInsertRows()
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return HEADERS[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.isValid() and index.column() == COLUMN_TITLE:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    # Daten
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        column = index.column()
+
+        if node is None:
+            # Gruppenzeile
+            group_row = index.row()
+            group = self._nodes[group_row].group
+            if role == Qt.ItemDataRole.CheckStateRole and column == COLUMN_TITLE:
+                return self._group_state(group_row)
+            if role != Qt.ItemDataRole.DisplayRole:
+                return None
+            if column == COLUMN_TITLE:
+                return event_columns(group, 0)[0]
+            if column == COLUMN_GROUP:
+                return f"#{group_row + 1} ({len(group.events)})"
+            return None
+
+        if role == Qt.ItemDataRole.CheckStateRole and column == COLUMN_TITLE:
+            return Qt.CheckState.Checked if self.is_checked(node.row, index.row()) else Qt.CheckState.Unchecked
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if column == COLUMN_GROUP:
+            return f"#{node.row + 1}"
+        return event_columns(node.group, index.row())[column]
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or index.column() != COLUMN_TITLE or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        node = index.internalPointer()
+
+        if node is None:
+            self.set_group_checked(index.row(), checked)
+            return True
+
+        self._set(node.row, index.row(), checked)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        group_index = self.createIndex(node.row, COLUMN_TITLE)
+        self.dataChanged.emit(group_index, group_index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+
+    def set_groups(self, groups: List[Any]):
+        """Ersetzt die Gruppen (nichts ausgewählt); Zeilen kommen per fetchMore"""
+        self.beginResetModel()
+        self._nodes = [_GroupNode(row, group) for row, group in enumerate(groups)]
+        self._fetched = 0
+        self._mode = SELECT_NONE
+        self._toggled = set()
+        self.endResetModel()
+
+    def group_count(self) -> int:
+        return len(self._nodes)
+
+    def event_count(self) -> int:
+        return sum(len(node.group.events) for node in self._nodes)
+
+    # Auswahl
+
+    def is_checked(self, group_row: int, position: int) -> bool:
+        return self._default(position) != ((group_row, position) in self._toggled)
+
+    def select(self, mode: int):
+        """Setzt den Grundzustand für alle Events (SELECT_NONE/ALL/KEEP_FIRST)"""
+        self._mode = mode
+        self._toggled = set()
+        if self._fetched:
+            # Ein Bereichssignal lässt die Ansicht ihren sichtbaren Teil neu zeichnen
+            self.dataChanged.emit(self.index(0, COLUMN_TITLE), self.index(self._fetched - 1, COLUMN_TITLE),
+                                  [Qt.ItemDataRole.CheckStateRole])
+
+    def set_group_checked(self, group_row: int, checked: bool):
+        """Wählt alle Events einer Gruppe an bzw. ab"""
+        count = len(self._nodes[group_row].group.events)
+        for position in range(count):
+            self._set(group_row, position, checked)
+        group_index = self.createIndex(group_row, COLUMN_TITLE)
+        self.dataChanged.emit(group_index, group_index, [Qt.ItemDataRole.CheckStateRole])
+        if count:
+            node = self._nodes[group_row]
+            self.dataChanged.emit(self.createIndex(0, COLUMN_TITLE, node),
+                                  self.createIndex(count - 1, COLUMN_TITLE, node),
+                                  [Qt.ItemDataRole.CheckStateRole])
+
+    def checked_events(self) -> Iterator[Dict[str, Any]]:
+        """Ausgewählte Events in Gruppen- und Zeilenreihenfolge"""
+        if self._mode == SELECT_NONE:
+            for group_row, position in sorted(self._toggled):
+                yield self._nodes[group_row].group.events[position]
+            return
+        for node in self._nodes:
+            for position, event in enumerate(node.group.events):
+                if self.is_checked(node.row, position):
+                    yield event
+
+    def _default(self, position: int) -> bool:
+        if self._mode == SELECT_ALL:
+            return True
+        if self._mode == SELECT_KEEP_FIRST:
+            return position > 0
+        return False
+
+    def _set(self, group_row: int, position: int, checked: bool):
+        if checked == self._default(position):
+            self._toggled.discard((group_row, position))
+        else:
+            self._toggled.add((group_row, position))
+
+    def _group_state(self, group_row: int) -> Qt.CheckState:
+        count = len(self._nodes[group_row].group.events)
+        checked = sum(1 for position in range(count) if self.is_checked(group_row, position))
+        if checked == 0:
+            return Qt.CheckState.Unchecked
+        if checked == count:
+            return Qt.CheckState.Checked
+        return Qt.CheckState.PartiallyChecked
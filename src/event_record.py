@@ -0,0 +1,377 @@
+"""
+Kompakter Event-Datensatz für große Kalender
+
+Ein CalendarEvent belegt nur feste __slots__ statt zweier Dictionaries
+pro Event: Start und Ende als Epoch-Sekunden, Titel/Ort/Kalender als
+internierte Strings. Für bestehenden GUI-Code bietet er eine
+Dictionary-kompatible Schnittstelle (get, [], in, keys).
+
+Über eine Feldauswahl (fields) lädt der Client nur die Attribute, die
+eine Operation braucht. Nicht geladene Attribute wie Notizen oder
+Wiederholungen werden beim ersten Zugriff nachgeladen.
+
+Vorkommen wiederkehrender Events tragen die vollständige Regel (siehe
+recurrence), den Start der Serie und - bei abgelösten Ausnahmen - das
+ursprüngliche Datum des Vorkommens.
+"""
+
+import hashlib
+import sys
+import threading
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+
+# Feldnamen für die Projektion beim Laden
+FIELD_ID = 'id'
+FIELD_TITLE = 'title'
+FIELD_START = 'start'
+FIELD_END = 'end'
+FIELD_LOCATION = 'location'
+FIELD_DESCRIPTION = 'description'
+FIELD_ALL_DAY = 'all_day'
+FIELD_RECURRENCE = 'recurrence'
+
+# Identifier, Titel und Start werden immer geladen
+CORE_FIELDS = frozenset({FIELD_ID, FIELD_TITLE, FIELD_START})
+LAZY_FIELDS = frozenset({FIELD_END, FIELD_LOCATION, FIELD_DESCRIPTION, FIELD_ALL_DAY, FIELD_RECURRENCE})
+ALL_FIELDS = CORE_FIELDS | LAZY_FIELDS
+
+# Feldauswahl pro Operation
+DEDUP_FIELDS = CORE_FIELDS | {FIELD_LOCATION}
+LIST_FIELDS = CORE_FIELDS | {FIELD_DESCRIPTION}
+# Der Sync braucht die Wiederholung für Sync-Schlüssel und Serien (siehe sync_key)
+SYNC_FIELDS = ALL_FIELDS
+
+_NO_FIELDS = frozenset()
+
+# Datensätze wandern zwischen Threads (Worker → GUI, Store-Executor) -
+# das Übernehmen nachgeladener Felder ist daher serialisiert
+_LOAD_LOCK = threading.Lock()
+
+# Wert von FIELD_RECURRENCE für Events ohne Wiederholung:
+# (Regeltext, abgelöst, Serienstart, ursprünglicher Start)
+NO_RECURRENCE = ('', False, 0.0, 0.0)
+
+
+def intern_text(value: Optional[str]) -> str:
+    """Interniert einen String (PyObjC liefert str-Unterklassen, daher str())"""
+    if not value:
+        return ''
+    return sys.intern(str(value))
+
+
+def event_timestamp(event: Any, attribute: str, key: str, default: Optional[float] = None) -> float:
+    """
+    Epoch-Sekunden aus einem CalendarEvent (attribute) oder Event-Dictionary (key)
+
+    Raises:
+        KeyError: Wenn der Wert fehlt und kein default angegeben ist
+    """
+    value = getattr(event, attribute, None)
+    if value is not None:
+        return value
+    value = event.get(key)
+    if value is None:
+        if default is None:
+            raise KeyError(key)
+        return default
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+def compute_fingerprint(title: str, start_ts: float, end_ts: float, location: str, all_day: bool,
+                        description: str, recurrence: str) -> bytes:
+    """Inhalts-Fingerprint aus einzelnen Feldern (16-Byte-Digest)"""
+    parts = (
+        ' '.join(title.split()),
+        repr(int(start_ts)),
+        repr(int(end_ts)),
+        ' '.join(location.split()),
+        '1' if all_day else '0',
+        description,
+        recurrence,
+    )
+    return hashlib.blake2b('\x1f'.join(parts).encode('utf-8'), digest_size=16).digest()
+
+
+def event_fingerprint(event: Any) -> bytes:
+    """
+    Inhalts-Fingerprint eines Events
+
+    Berücksichtigt Titel (Leerraum normalisiert), Start, Ende, Ort,
+    Ganztägig, Notizen und Wiederholung. Gleicher Inhalt ergibt immer
+    denselben Fingerprint - auch über Programmstarts hinweg.
+    """
+    if isinstance(event, CalendarEvent):
+        return event.fingerprint
+    return compute_fingerprint(
+        event.get('title') or event.get('summary') or '',
+        event_timestamp(event, 'start_ts', 'start_date', 0.0),
+        event_timestamp(event, 'end_ts', 'end_date', 0.0),
+        event.get('location') or '',
+        bool(event.get('all_day') or event.get('allday_event')),
+        event.get('description') or '',
+        event.get('recurrence') or ''
+    )
+
+
+def series_key(event: 'CalendarEvent') -> str:
+    """Schlüssel einer ganzen Serie im Sync-Status (alle Vorkommen teilen ihn)"""
+    return f"{event.id}@series"
+
+
+def series_fingerprint(event: 'CalendarEvent') -> bytes:
+    """
+    Inhalts-Fingerprint einer Serie, berechnet aus einem ihrer Vorkommen
+
+    Statt des Vorkommens zählt der Start der Serie - alle regulären
+    Vorkommen ergeben denselben Fingerprint.
+    """
+    series_start = event.series_start_ts or event.start_ts
+    return compute_fingerprint(event.title, series_start, series_start + event.end_ts - event.start_ts,
+                               event.location, event.all_day, event.description, event.recurrence)
+
+
+def sync_key(event: Any) -> str:
+    """
+    Stabiler Schlüssel eines Quell-Events für den Sync-Status
+
+    Alle Vorkommen eines wiederkehrenden Events teilen sich denselben
+    Identifier, daher wird dort der Start des Vorkommens angehängt.
+    """
+    if isinstance(event, CalendarEvent):
+        event_id, recurring = event.id, event.recurrence
+    else:
+        event_id, recurring = event.get('id') or '', event.get('recurrence')
+    if recurring:
+        return f"{event_id}@{int(event_timestamp(event, 'start_ts', 'start_date', 0.0))}"
+    return event_id
+
+
+class CalendarEvent:
+    """Ein Kalender-Event mit minimalem Speicherbedarf und Lazy Loading"""
+
+    __slots__ = ('id', 'title', 'start_ts', 'calendar', '_end_ts', '_location', '_description',
+                 '_all_day', '_recurrence', '_detached', '_series_start_ts', '_occurrence_ts',
+                 '_fingerprint', '_pending', '_source', '_loader')
+
+    # Dictionary-Schlüssel → Attribut (start/end werden als datetime geliefert)
+    _KEY_MAP = {
+        'id': 'id',
+        'title': 'title',
+        'summary': 'title',
+        'location': 'location',
+        'description': 'description',
+        'all_day': 'all_day',
+        'allday_event': 'all_day',
+        'recurrence': 'recurrence',
+        'calendar': 'calendar',
+    }
+    _DATE_KEYS = {'start_date': 'start_ts', 'end_date': 'end_ts'}
+
+    def __init__(self, id: str = '', title: str = '', start_ts: float = 0.0, end_ts: float = 0.0,
+                 location: str = '', description: str = '', all_day: bool = False,
+                 recurrence: str = '', calendar: str = '', detached: bool = False,
+                 series_start_ts: float = 0.0, occurrence_ts: float = 0.0,
+                 pending: FrozenSet[str] = _NO_FIELDS, source: Any = None, loader: Any = None):
+        """
+        Args:
+            recurrence: Regeltext der Serie (siehe recurrence.RecurrenceRule)
+            detached: Abgelöste Ausnahme einer Serie
+            series_start_ts: Start des ersten Vorkommens der Serie
+            occurrence_ts: Ursprünglicher Start dieses Vorkommens
+            pending: Noch nicht geladene Felder (Teilmenge von LAZY_FIELDS)
+            source: Quell-Objekt für das Nachladen (z.B. EKEvent)
+            loader: Objekt mit load_event_field(source, field) und
+                    load_event_fields([(source, fields), ...]) - siehe complete_events
+        """
+        self.id = id
+        self.title = intern_text(title)
+        self.start_ts = start_ts
+        self.calendar = intern_text(calendar)
+        self._end_ts = end_ts
+        self._location = intern_text(location)
+        self._description = description or ''
+        self._all_day = all_day
+        self._recurrence = recurrence
+        self._detached = detached
+        self._series_start_ts = series_start_ts
+        self._occurrence_ts = occurrence_ts
+        self._fingerprint = None
+        self._pending = pending if source is not None else _NO_FIELDS
+        self._source = source if self._pending else None
+        self._loader = loader if self._pending else None
+
+    def _load(self, field: str):
+        """
+        Lädt ein noch fehlendes Feld nach (der Wert steht vor dem neuen _pending fest)
+
+        Gelesen wird ohne Lock - der Loader kann auf einen anderen Thread
+        warten (Store-Thread); lesen zwei Threads gleichzeitig, gewinnt der erste.
+        """
+        with _LOAD_LOCK:
+            if field not in self._pending:
+                return
+            loader, source = self._loader, self._source
+        value = loader.load_event_field(source, field)
+        with _LOAD_LOCK:
+            self._apply({field: value})
+
+    def _apply(self, values: Dict[str, Any]):
+        """Übernimmt nachgeladene Felder, die noch fehlen (nur unter _LOAD_LOCK)"""
+        pending = self._pending
+        for field, value in values.items():
+            if field not in pending:
+                continue
+            if field == FIELD_END:
+                self._end_ts = value
+            elif field == FIELD_LOCATION:
+                self._location = intern_text(value)
+            elif field == FIELD_DESCRIPTION:
+                self._description = value or ''
+            elif field == FIELD_ALL_DAY:
+                self._all_day = value
+            elif field == FIELD_RECURRENCE:
+                # (Regeltext, abgelöst, Serienstart, ursprünglicher Start)
+                self._recurrence, self._detached, self._series_start_ts, self._occurrence_ts = value
+            pending = pending - {field}
+        if not pending:
+            # Alles geladen - Referenz auf das EventKit-Objekt freigeben
+            self._source = None
+            self._loader = None
+        self._pending = pending or _NO_FIELDS
+
+    def load_all(self):
+        """Lädt alle noch fehlenden Felder - danach ändert sich der Datensatz nicht mehr"""
+        complete_events((self,))
+
+    @property
+    def end_ts(self) -> float:
+        if FIELD_END in self._pending:
+            self._load(FIELD_END)
+        return self._end_ts
+
+    @property
+    def location(self) -> str:
+        if FIELD_LOCATION in self._pending:
+            self._load(FIELD_LOCATION)
+        return self._location
+
+    @property
+    def description(self) -> str:
+        if FIELD_DESCRIPTION in self._pending:
+            self._load(FIELD_DESCRIPTION)
+        return self._description
+
+    @property
+    def all_day(self) -> bool:
+        if FIELD_ALL_DAY in self._pending:
+            self._load(FIELD_ALL_DAY)
+        return self._all_day
+
+    @property
+    def recurrence(self) -> str:
+        if FIELD_RECURRENCE in self._pending:
+            self._load(FIELD_RECURRENCE)
+        return self._recurrence
+
+    @property
+    def detached(self) -> bool:
+        if FIELD_RECURRENCE in self._pending:
+            self._load(FIELD_RECURRENCE)
+        return self._detached
+
+    @property
+    def series_start_ts(self) -> float:
+        if FIELD_RECURRENCE in self._pending:
+            self._load(FIELD_RECURRENCE)
+        return self._series_start_ts
+
+    @property
+    def occurrence_ts(self) -> float:
+        """Ursprünglicher Start (bei regulären Vorkommen gleich start_ts)"""
+        if FIELD_RECURRENCE in self._pending:
+            self._load(FIELD_RECURRENCE)
+        return self._occurrence_ts or self.start_ts
+
+    @property
+    def fingerprint(self) -> bytes:
+        """Inhalts-Fingerprint (einmal berechnet, lädt fehlende Felder nach)"""
+        if self._fingerprint is None:
+            self._fingerprint = compute_fingerprint(self.title, self.start_ts, self.end_ts, self.location,
+                                                    self.all_day, self.description, self.recurrence)
+        return self._fingerprint
+
+    def series_master(self) -> 'CalendarEvent':
+        """
+        Stellvertreter der ganzen Serie eines Vorkommens
+
+        Start ist der Start der Serie - alle regulären Vorkommen ergeben
+        denselben Stellvertreter (gleicher Fingerprint wie series_fingerprint).
+        """
+        start_ts = self.series_start_ts or self.start_ts
+        return CalendarEvent(self.id, self.title, start_ts, start_ts + self.end_ts - self.start_ts,
+                             self.location, self.description, self.all_day, self.recurrence,
+                             self.calendar, series_start_ts=start_ts)
+
+    def same_content(self, other: 'CalendarEvent') -> bool:
+        """Inhaltsgleichheit über den Fingerprint statt Feld-für-Feld-Vergleich"""
+        return self.fingerprint == other.fingerprint
+
+    @property
+    def start_date(self) -> datetime:
+        return datetime.fromtimestamp(self.start_ts)
+
+    @property
+    def end_date(self) -> datetime:
+        return datetime.fromtimestamp(self.end_ts)
+
+    # Dictionary-kompatible Schnittstelle für bestehenden Code
+
+    def __getitem__(self, key: str) -> Any:
+        attribute = self._KEY_MAP.get(key)
+        if attribute is not None:
+            return getattr(self, attribute)
+        attribute = self._DATE_KEYS.get(key)
+        if attribute is not None:
+            return datetime.fromtimestamp(getattr(self, attribute))
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._KEY_MAP or key in self._DATE_KEYS
+
+    def keys(self):
+        return list(self._KEY_MAP) + list(self._DATE_KEYS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Vollständiges Dictionary (z.B. für Export/Debugging)"""
+        return {key: self[key] for key in self.keys()}
+
+    def __repr__(self):
+        return f"CalendarEvent(id={self.id!r}, title={self.title!r}, start_ts={self.start_ts!r})"
+
+
+def complete_events(events: Iterable[CalendarEvent]):
+    """
+    Lädt die fehlenden Felder vieler Datensätze auf einmal
+
+    Ein load_event_fields-Aufruf pro Loader statt eines Aufrufs pro Feld -
+    über den Store-Executor ist das ein einziger Auftrag an den Store-Thread.
+    """
+    by_loader = {}
+    with _LOAD_LOCK:
+        for event in events:
+            if event._pending:
+                by_loader.setdefault(event._loader, []).append((event, event._source, event._pending))
+    for loader, entries in by_loader.items():
+        values = loader.load_event_fields([(source, pending) for _, source, pending in entries])
+        with _LOAD_LOCK:
+            for (event, _, _), loaded in zip(entries, values):
+                event._apply(loaded)
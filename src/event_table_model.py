@@ -0,0 +1,175 @@
+"""
+Tabellenmodell für die manuelle Event-Auswahl
+
+Statt pro Event eine QCheckBox und vier QTableWidgetItems anzulegen,
+liefert das Modell Texte und Häkchen erst, wenn die Ansicht eine Zeile
+tatsächlich zeichnet - der Aufwand hängt von den sichtbaren Zeilen ab,
+nicht von der Anzahl der Events.
+
+Auswahl: ein Grundzustand (alle an/aus) plus die Menge der Zeilen, die
+davon abweichen. "Alle auswählen" setzt nur den Grundzustand und leert
+die Menge - ohne über Zeilen oder Widgets zu laufen.
+Prüfstatus: ein Byte pro Zeile. Beim Laden kommen die Events blockweise
+hinzu (append_events), die Ansicht zeigt die ersten Zeilen sofort.
+"""
+
+from typing import List, Dict, Any, Iterable, Iterator
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QColor
+
+STATUS_UNCHECKED = 0
+STATUS_NEW = 1
+STATUS_DUPLICATE = 2
+
+_STATUS_TEXT = {
+    STATUS_UNCHECKED: "❓ Ungeprüft",
+    STATUS_NEW: "✅ Neu",
+    STATUS_DUPLICATE: "⚠️ Duplikat",
+}
+_STATUS_COLOR = {
+    STATUS_UNCHECKED: QColor(Qt.GlobalColor.lightGray),
+    STATUS_NEW: QColor(Qt.GlobalColor.green),
+    STATUS_DUPLICATE: QColor(Qt.GlobalColor.yellow),
+}
+
+COLUMN_CHECK, COLUMN_TITLE, COLUMN_DATE, COLUMN_DESCRIPTION, COLUMN_STATUS = range(5)
+HEADERS = ['✓', 'Titel', 'Datum', 'Beschreibung', 'Status']
+
+DESCRIPTION_LENGTH = 50
+
+
+class EventTableModel(QAbstractTableModel):
+    """Checkbare Event-Liste mit Prüfstatus"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._events = []
+        self._checked_default = True
+        self._toggled = set()
+        self._status = bytearray()
+
+    # Qt-Schnittstelle
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._events)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return HEADERS[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == COLUMN_CHECK:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+
+        if role == Qt.ItemDataRole.CheckStateRole and column == COLUMN_CHECK:
+            return Qt.CheckState.Checked if self.is_checked(row) else Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.BackgroundRole and column == COLUMN_STATUS:
+            return _STATUS_COLOR[self._status[row]]
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        event = self._events[row]
+        if column == COLUMN_TITLE:
+            return event.get('summary', 'Kein Titel')
+        if column == COLUMN_DATE:
+            start_date = event.get('start_date')
+            return start_date.strftime('%d.%m.%Y %H:%M') if start_date else 'Unbekannt'
+        if column == COLUMN_DESCRIPTION:
+            description = event.get('description', '') or ''
+            if len(description) > DESCRIPTION_LENGTH:
+                return description[:DESCRIPTION_LENGTH] + '...'
+            return description
+        if column == COLUMN_STATUS:
+            return _STATUS_TEXT[self._status[row]]
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or index.column() != COLUMN_CHECK or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        row = index.row()
+        if checked == self._checked_default:
+            self._toggled.discard(row)
+        else:
+            self._toggled.add(row)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+
+    # Daten
+
+    def set_events(self, events: List[Dict[str, Any]], checked: bool = True):
+        """Ersetzt die Events (alle ausgewählt, Status ungeprüft)"""
+        self.beginResetModel()
+        self._events = events
+        self._checked_default = checked
+        self._toggled = set()
+        self._status = bytearray(len(events))
+        self.endResetModel()
+
+    def append_events(self, events: List[Dict[str, Any]]):
+        """Hängt Events an (z.B. einen nachgeladenen Block) - ausgewählt wie der Grundzustand, ungeprüft"""
+        if not events:
+            return
+        first = len(self._events)
+        self.beginInsertRows(QModelIndex(), first, first + len(events) - 1)
+        self._events.extend(events)
+        self._status.extend(bytes(len(events)))
+        self.endInsertRows()
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        return self._events
+
+    # Auswahl
+
+    def is_checked(self, row: int) -> bool:
+        return self._checked_default != (row in self._toggled)
+
+    def set_all_checked(self, checked: bool):
+        """Alle an- bzw. abwählen - O(1), die Ansicht zeichnet nur sichtbare Zeilen neu"""
+        self._checked_default = checked
+        self._toggled = set()
+        self._column_changed(COLUMN_CHECK, Qt.ItemDataRole.CheckStateRole)
+
+    def checked_rows(self) -> Iterator[int]:
+        """Ausgewählte Zeilen in aufsteigender Reihenfolge"""
+        if self._checked_default:
+            return (row for row in range(len(self._events)) if row not in self._toggled)
+        return iter(sorted(self._toggled))
+
+    def checked_events(self) -> List[Dict[str, Any]]:
+        return [self._events[row] for row in self.checked_rows()]
+
+    # Prüfstatus
+
+    def set_duplicate_flags(self, flags: Iterable[bool]):
+        """Übernimmt das Ergebnis der Duplikatprüfung (True = Duplikat) pro Zeile"""
+        status = bytearray(STATUS_DUPLICATE if flag else STATUS_NEW for flag in flags)
+        # Fehlende Einträge bleiben ungeprüft, überzählige werden ignoriert
+        del status[len(self._events):]
+        status.extend(bytes(len(self._events) - len(status)))
+        self._status = status
+        self._column_changed(COLUMN_STATUS, Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.BackgroundRole)
+
+    def status(self, row: int) -> int:
+        return self._status[row]
+
+    def count_status(self, status: int) -> int:
+        return self._status.count(status)
+
+    def _column_changed(self, column: int, *roles: int):
+        """Ein dataChanged-Signal für eine ganze Spalte"""
+        if self._events:
+            self.dataChanged.emit(self.index(0, column), self.index(len(self._events) - 1, column), list(roles))
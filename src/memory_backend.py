@@ -0,0 +1,372 @@
+"""
+In-Memory-Kalender-Backend
+
+Referenz-Implementierung von CalendarBackend ohne EventKit. Sie läuft
+auf jedem System und dient zum Profiling und für Lasttests der Sync-
+und Duplikat-Pfade (z.B. mit einer Million Events auf Linux).
+
+Die Kosten eines echten Stores lassen sich simulieren:
+- call_latency_ms: Wartezeit pro Lese-Aufruf (list_calendars, get_events)
+- commit_cost_ms: Wartezeit pro Commit
+
+Serien (Event-Daten mit 'recurrence_rule') werden wie in EventKit als
+ein Event gespeichert und erst beim Lesen in Vorkommen aufgefächert.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    from src.calendar_backend import CalendarBackend, EVENT_NOT_FOUND, default_range
+    from src.event_record import CalendarEvent, ALL_FIELDS, event_timestamp
+    from src.recurrence import parse_rule
+except ImportError:
+    from calendar_backend import CalendarBackend, EVENT_NOT_FOUND, default_range
+    from event_record import CalendarEvent, ALL_FIELDS, event_timestamp
+    from recurrence import parse_rule
+
+logger = logging.getLogger(__name__)
+
+
+class _MemoryCalendar:
+    """
+    Events eines Kalenders mit lazy aufgebautem, nach Start sortiertem Index
+
+    Serien liegen getrennt (series) samt entfernter Vorkommen (excluded);
+    abgelöste Ausnahmen sind normale Einträge unter 'Identifier@Start'.
+    """
+
+    __slots__ = ('name', 'events', 'series', 'excluded', 'max_duration', '_starts', '_ordered')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.events = {}
+        self.series = {}
+        self.excluded = {}
+        self.max_duration = 0.0
+        self._starts = None
+        self._ordered = None
+
+    def add(self, record: CalendarEvent, key: Optional[str] = None):
+        self.discard(key or record.id)
+        if record.recurrence and not record.detached and parse_rule(record.recurrence) is not None:
+            self.series[record.id] = record
+            return
+        self.events[key or record.id] = record
+        self.max_duration = max(self.max_duration, record.end_ts - record.start_ts)
+        self._starts = None
+
+    def contains(self, event_id: str) -> bool:
+        return event_id in self.events or event_id in self.series
+
+    def discard(self, event_id: str) -> bool:
+        """Entfernt ein Event bzw. eine Serie (ohne ihre Ausnahmen)"""
+        if self.series.pop(event_id, None) is not None:
+            return True
+        if self.events.pop(event_id, None) is None:
+            return False
+        self._starts = None
+        return True
+
+    def remove(self, event_id: str) -> bool:
+        """Entfernt ein Event bzw. eine Serie samt Ausnahmen"""
+        if event_id in self.series:
+            self.excluded.pop(event_id, None)
+            prefix = f"{event_id}@"
+            for key in [key for key in self.events if key.startswith(prefix)]:
+                del self.events[key]
+                self._starts = None
+        return self.discard(event_id)
+
+    def exclude(self, series_id: str, start_ts: float) -> bool:
+        """Entfernt ein einzelnes Vorkommen einer Serie"""
+        master = self.series.get(series_id)
+        if master is None:
+            return False
+        when = datetime.fromtimestamp(start_ts)
+        rule = parse_rule(master.recurrence)
+        excluded = self.excluded.setdefault(series_id, set())
+        if int(start_ts) in excluded or next(
+                rule.between(master.start_date, when, when + timedelta(seconds=1)), None) is None:
+            return False
+        excluded.add(int(start_ts))
+        return True
+
+    def overlapping(self, lower: float, upper: float) -> List[CalendarEvent]:
+        """Events mit start < upper und end > lower (wie EventKit-Predicates)"""
+        if self._starts is None:
+            self._ordered = sorted(self.events.values(), key=lambda record: record.start_ts)
+            self._starts = [record.start_ts for record in self._ordered]
+
+        # Frühestmöglicher Start eines überlappenden Events
+        first = bisect_left(self._starts, lower - self.max_duration)
+        last = bisect_left(self._starts, upper)
+        found = [
+            record for record in self._ordered[first:last]
+            if record.end_ts > lower or record.start_ts >= lower
+        ]
+        for master in self.series.values():
+            found.extend(self._occurrences(master, lower, upper))
+        return found
+
+    def _occurrences(self, master: CalendarEvent, lower: float, upper: float) -> List[CalendarEvent]:
+        """Fächert eine Serie für den Zeitraum in Vorkommen auf"""
+        duration = master.end_ts - master.start_ts
+        excluded = self.excluded.get(master.id, ())
+        occurrences = []
+        for start in parse_rule(master.recurrence).between(
+                master.start_date, datetime.fromtimestamp(lower - duration), datetime.fromtimestamp(upper)):
+            start_ts = start.timestamp()
+            if int(start_ts) in excluded or (start_ts + duration <= lower and start_ts < lower):
+                continue
+            occurrences.append(CalendarEvent(
+                id=master.id, title=master.title, start_ts=start_ts, end_ts=start_ts + duration,
+                location=master.location, description=master.description, all_day=master.all_day,
+                recurrence=master.recurrence, calendar=master.calendar,
+                series_start_ts=master.start_ts, occurrence_ts=start_ts
+            ))
+        return occurrences
+
+
+class InMemoryCalendarBackend(CalendarBackend):
+    """
+    Schnelles Kalender-Backend im Arbeitsspeicher
+
+    Gelieferte CalendarEvent-Datensätze sind die gespeicherten Objekte
+    selbst - sie sind vollständig geladen, fields wird ignoriert.
+    """
+
+    def __init__(self, batch_size: int = CalendarBackend.DEFAULT_BATCH_SIZE,
+                 call_latency_ms: float = 0.0, commit_cost_ms: float = 0.0):
+        """
+        Args:
+            batch_size: Schreiboperationen pro Commit
+            call_latency_ms: Simulierte Latenz pro Lese-Aufruf
+            commit_cost_ms: Simulierte Kosten pro Commit
+        """
+        self.batch_size = max(1, batch_size)
+        self.call_latency_ms = call_latency_ms
+        self.commit_cost_ms = commit_cost_ms
+        self.commits = 0
+        self._calendars = {}
+        self._generation = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _wait(milliseconds: float):
+        if milliseconds > 0:
+            time.sleep(milliseconds / 1000)
+
+    def add_calendar(self, calendar_name: str):
+        """Legt einen (leeren) Kalender an"""
+        with self._lock:
+            if calendar_name not in self._calendars:
+                self._calendars[calendar_name] = _MemoryCalendar(calendar_name)
+                self._generation += 1
+
+    def add_events(self, calendar_name: str, events: List[Dict[str, Any]]) -> List[str]:
+        """
+        Importiert Events ohne simulierte Kosten (z.B. Testdaten für Benchmarks)
+
+        Returns:
+            Die vergebenen Identifier
+        """
+        with self._lock:
+            self.add_calendar(calendar_name)
+            calendar = self._calendars[calendar_name]
+            ids = []
+            for event_data in events:
+                record = self._build_record(calendar_name, event_data)
+                calendar.add(record)
+                ids.append(record.id)
+            self._generation += 1
+            return ids
+
+    def add_exception(self, calendar_name: str, series_id: str, occurrence_ts: float,
+                      event_data: Dict[str, Any]) -> bool:
+        """
+        Ersetzt ein Vorkommen einer Serie durch eine abgelöste Ausnahme
+        (ohne simulierte Kosten, z.B. für Testdaten)
+        """
+        with self._lock:
+            calendar = self._calendars[calendar_name]
+            master = calendar.series.get(series_id)
+            if master is None or not calendar.exclude(series_id, occurrence_ts):
+                return False
+            start_ts = event_timestamp(event_data, 'start_ts', 'start_date')
+            record = CalendarEvent(
+                id=series_id,
+                title=event_data.get('title') or master.title,
+                start_ts=start_ts,
+                end_ts=event_timestamp(event_data, 'end_ts', 'end_date', start_ts),
+                location=event_data.get('location', master.location),
+                description=event_data.get('description', master.description),
+                all_day=master.all_day,
+                recurrence=master.recurrence,
+                calendar=calendar_name,
+                detached=True,
+                series_start_ts=master.start_ts,
+                occurrence_ts=occurrence_ts
+            )
+            calendar.add(record, f"{series_id}@{int(occurrence_ts)}")
+            self._generation += 1
+            return True
+
+    def is_available(self) -> bool:
+        return True
+
+    def list_calendars(self) -> List[str]:
+        self._wait(self.call_latency_ms)
+        with self._lock:
+            return list(self._calendars)
+
+    def change_token(self) -> int:
+        return self._generation
+
+    def get_events(self, calendar_name: str, start_date: datetime = None, end_date: datetime = None,
+                   fields=ALL_FIELDS) -> List[CalendarEvent]:
+        """Holt Events, die den Zeitraum überlappen"""
+        self._wait(self.call_latency_ms)
+        start_date, end_date = default_range(start_date, end_date)
+        with self._lock:
+            calendar = self._calendars.get(calendar_name)
+            if calendar is None:
+                logger.warning(f"Kalender '{calendar_name}' nicht gefunden")
+                return []
+            return calendar.overlapping(start_date.timestamp(), end_date.timestamp())
+
+    def save_events(self, calendar_name: str, events: List[Dict[str, Any]],
+                    batch_size: int = None) -> List[Dict[str, Any]]:
+        """Erstellt mehrere Events mit einem simulierten Commit pro Batch"""
+        with self._lock:
+            calendar = self._calendars.get(calendar_name)
+            if calendar is None:
+                logger.error(f"Kalender '{calendar_name}' nicht gefunden")
+                return [self._item_result(event, False, "Kalender nicht gefunden") for event in events]
+
+            def apply(event_data, result):
+                record = self._build_record(calendar_name, event_data)
+                calendar.add(record)
+                result['target_id'] = record.id
+                return None
+
+            return self._run_batched(events, apply, batch_size)
+
+    def update_events(self, calendar_name: str, updates: List[Tuple[str, Dict[str, Any]]],
+                      batch_size: int = None) -> List[Dict[str, Any]]:
+        """Ersetzt bestehende Events, der Identifier bleibt erhalten"""
+        with self._lock:
+            calendar = self._calendars.get(calendar_name)
+            if calendar is None:
+                logger.error(f"Kalender '{calendar_name}' nicht gefunden")
+                return [self._item_result(event, False, "Kalender nicht gefunden") for _, event in updates]
+
+            def apply(update, result):
+                target_id, event_data = update
+                if not calendar.contains(target_id):
+                    return EVENT_NOT_FOUND
+                calendar.add(self._build_record(calendar_name, event_data, target_id))
+                result['target_id'] = target_id
+                return None
+
+            return self._run_batched(updates, apply, batch_size, event_data_of=lambda update: update[1])
+
+    def delete_events(self, calendar_name: str, events: List[Dict[str, Any]],
+                      batch_size: int = None) -> List[Dict[str, Any]]:
+        """
+        Löscht mehrere Events über ihren Identifier
+
+        Bei Serien wird ohne 'whole_series' nur das Vorkommen am
+        angegebenen Start entfernt - abgelöste Ausnahmen werden über ihren
+        ursprünglichen Start ('Identifier@Start') gefunden.
+        """
+        with self._lock:
+            calendar = self._calendars.get(calendar_name)
+            if calendar is None:
+                logger.error(f"Kalender '{calendar_name}' nicht gefunden")
+                return [self._item_result(event, False, "Kalender nicht gefunden") for event in events]
+
+            def apply(event_data, result):
+                event_id = event_data.get('id', '')
+                single = event_id in calendar.series and not event_data.get('whole_series')
+                detached_key = f"{event_id}@{int(event_timestamp(event_data, 'occurrence_ts', 'occurrence_ts', 0.0))}"
+                if single and detached_key in calendar.events:
+                    found = calendar.discard(detached_key)
+                elif single and event_data.get('start_date'):
+                    found = calendar.exclude(event_id, event_timestamp(event_data, 'start_ts', 'start_date'))
+                else:
+                    found = calendar.remove(event_id)
+                return None if found else EVENT_NOT_FOUND
+
+            return self._run_batched(events, apply, batch_size)
+
+    def remove_occurrences(self, calendar_name: str, occurrences: List[Tuple[str, float]],
+                           batch_size: int = None) -> List[Dict[str, Any]]:
+        """Entfernt einzelne Vorkommen von Serien"""
+        entries = [{'id': series_id, 'start_ts': start_ts} for series_id, start_ts in occurrences]
+        with self._lock:
+            calendar = self._calendars.get(calendar_name)
+            if calendar is None:
+                logger.error(f"Kalender '{calendar_name}' nicht gefunden")
+                return [self._item_result(entry, False, "Kalender nicht gefunden") for entry in entries]
+
+            def apply(entry, result):
+                return None if calendar.exclude(entry['id'], entry['start_ts']) else EVENT_NOT_FOUND
+
+            return self._run_batched(entries, apply, batch_size)
+
+    def _run_batched(self, events: List[Any], apply, batch_size: Optional[int],
+                     event_data_of=None) -> List[Dict[str, Any]]:
+        """
+        Wendet Änderungen an und simuliert einen Commit pro Batch
+
+        Args:
+            apply: Funktion (Eintrag, result) → Fehlertext oder None
+            event_data_of: Liefert die Event-Daten eines Eintrags für das Ergebnis
+        """
+        batch_size = max(1, batch_size or self.batch_size)
+        results = []
+
+        for offset in range(0, len(events), batch_size):
+            changed = False
+            for item in events[offset:offset + batch_size]:
+                result = self._item_result(event_data_of(item) if event_data_of else item, True)
+                try:
+                    error = apply(item, result)
+                except Exception as e:
+                    error = f"Ungültige Event-Daten: {e}"
+                if error is None:
+                    changed = True
+                else:
+                    result['success'] = False
+                    result['error'] = error
+                results.append(result)
+
+            if changed:
+                self._wait(self.commit_cost_ms)
+                self.commits += 1
+                self._generation += 1
+
+        return results
+
+    def _build_record(self, calendar_name: str, event_data: Dict[str, Any],
+                      event_id: Optional[str] = None) -> CalendarEvent:
+        """Erstellt einen gespeicherten Datensatz aus Event-Daten"""
+        start_ts = event_timestamp(event_data, 'start_ts', 'start_date')
+        return CalendarEvent(
+            id=event_id or f"MEM-{next(self._ids)}",
+            title=event_data.get('title') or event_data.get('summary') or 'Kein Titel',
+            start_ts=start_ts,
+            end_ts=event_timestamp(event_data, 'end_ts', 'end_date', start_ts),
+            location=event_data.get('location', ''),
+            description=event_data.get('description', ''),
+            all_day=bool(event_data.get('all_day') or event_data.get('allday_event')),
+            recurrence=event_data.get('recurrence_rule') or '',
+            calendar=calendar_name
+        )
@@ -0,0 +1,134 @@
+"""
+Fortschrittsmeldungen für lange Vorgänge
+
+Sync, Laden, Erstellen und Löschen melden über einen ProgressReporter
+Phase, erledigte Einheiten, Gesamtzahl (falls bekannt), Durchsatz und
+Restzeit. Der Reporter drosselt auf wenige Meldungen pro Sekunde; der
+Callback läuft im Thread des Vorgangs (in der GUI: Signal-emit).
+
+Ist die Gesamtzahl beim Laden unbekannt (Events kommen fensterweise),
+ergibt sich der Anteil aus der Position im Zeitraum: ein Event, das nach
+der Hälfte des Zeitraums beginnt, steht für 50 % (siehe track_range).
+"""
+
+import time
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar('T')
+
+# Höchstens eine Meldung pro MIN_INTERVAL Sekunden (Anfang und Ende einer Phase immer)
+MIN_INTERVAL = 0.25
+# Auflösung eines Fortschrittsbalkens (Promille)
+BAR_STEPS = 1000
+
+
+class ProgressUpdate:
+    """Stand eines Vorgangs"""
+
+    __slots__ = ('phase', 'done', 'total', 'fraction', 'rate', 'eta', 'finished')
+
+    def __init__(self, phase: str, done: int, total: Optional[int], fraction: Optional[float],
+                 rate: float, eta: Optional[float], finished: bool = False):
+        self.phase = phase
+        self.done = done
+        self.total = total
+        # Anteil 0..1 oder None (unbestimmt)
+        self.fraction = fraction
+        # Einheiten pro Sekunde seit Beginn der Phase
+        self.rate = rate
+        # Geschätzte Restzeit in Sekunden
+        self.eta = eta
+        self.finished = finished
+
+    def describe(self) -> str:
+        """Kurztext, z.B. 'Quelle abgleichen: 1200/5000 · 850/s · noch 4 s'"""
+        count = f"{self.done}/{self.total}" if self.total is not None else f"{self.done}"
+        parts = [f"{self.phase}: {count}", f"{self.rate:.0f}/s"]
+        if self.eta is not None and not self.finished:
+            parts.append(f"noch {format_duration(self.eta)}")
+        return " · ".join(parts)
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds} s"
+    if seconds < 3600:
+        return f"{seconds // 60} min {seconds % 60:02d} s"
+    return f"{seconds // 3600} h {seconds % 3600 // 60:02d} min"
+
+
+class ProgressReporter:
+    """Zählt den Fortschritt einer Phase und meldet ihn gedrosselt an einen Callback"""
+
+    def __init__(self, callback: Callable[[ProgressUpdate], None], min_interval: float = MIN_INTERVAL):
+        self.callback = callback
+        self.min_interval = min_interval
+        self.phase = ''
+        self.done = 0
+        self.total = None
+        self.fraction = None
+        self._started = 0.0
+        self._last_emit = 0.0
+
+    def start(self, phase: str, total: Optional[int] = None):
+        """Beginnt eine neue Phase (total None: Anteil kommt über advance(fraction=...))"""
+        self.phase = phase
+        self.done = 0
+        self.total = total
+        self.fraction = 0.0 if total else None
+        self._started = time.monotonic()
+        self._emit(self._started)
+
+    def advance(self, count: int = 1, fraction: Optional[float] = None):
+        """Zählt count Einheiten weiter; fraction setzt den Anteil bei unbekannter Gesamtzahl"""
+        self.done += count
+        if self.total:
+            self.fraction = min(1.0, self.done / self.total)
+        elif fraction is not None:
+            self.fraction = min(1.0, max(self.fraction or 0.0, fraction))
+        now = time.monotonic()
+        if now - self._last_emit >= self.min_interval:
+            self._emit(now)
+
+    def finish(self, complete: bool = True):
+        """Schließt die Phase ab und meldet immer (complete=False: abgebrochen, Anteil bleibt)"""
+        if complete and (self.total is not None or self.fraction is not None):
+            self.fraction = 1.0
+        self._emit(time.monotonic(), finished=True)
+
+    def _emit(self, now: float, finished: bool = False):
+        self._last_emit = now
+        elapsed = now - self._started
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        eta = None
+        if self.fraction and elapsed > 0:
+            eta = elapsed * (1.0 - self.fraction) / self.fraction
+        self.callback(ProgressUpdate(self.phase, self.done, self.total, self.fraction, rate, eta, finished))
+
+
+def track_range(items: Iterable[T], progress: Optional[ProgressReporter], lower: float, upper: float,
+                position: Callable[[T], float] = lambda event: event.start_ts) -> Iterator[T]:
+    """
+    Meldet für jedes Element den Fortschritt im Zeitraum [lower, upper)
+
+    Für fensterweise geladene Events, deren Anzahl vorher unbekannt ist.
+    """
+    if progress is None:
+        yield from items
+        return
+    span = max(upper - lower, 1.0)
+    for item in items:
+        progress.advance(1, (position(item) - lower) / span)
+        yield item
+
+
+def show_on_progress_bar(bar, update: ProgressUpdate):
+    """Überträgt eine Meldung auf einen QProgressBar (bestimmt, sobald ein Anteil bekannt ist)"""
+    if update.fraction is None:
+        bar.setRange(0, 0)
+    else:
+        bar.setRange(0, BAR_STEPS)
+        bar.setValue(int(update.fraction * BAR_STEPS))
+    bar.setFormat(f"{update.describe()} (%p%)" if update.fraction is not None else update.describe())
+    bar.setTextVisible(True)
@@ -0,0 +1,179 @@
+"""
+Wiederholungsregeln wiederkehrender Events
+
+Eine RecurrenceRule beschreibt Frequenz, Intervall, Wochentage und Ende
+einer Serie. Sie wird als kompakter, stabiler Text gespeichert
+(angelehnt an iCalendar-RRULE), z.B.:
+
+    FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,WE;UNTIL=1767222000
+
+UNTIL ist in Epoch-Sekunden angegeben. Regeln mit Bestandteilen, die
+hier nicht abgebildet werden (z.B. "jeder zweite Dienstag im Monat"),
+tragen PARTIAL=1 - solche Serien werden beim Sync weiterhin als
+einzelne Vorkommen übertragen.
+"""
+
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Iterator, Optional, Tuple
+
+DAILY = 'DAILY'
+WEEKLY = 'WEEKLY'
+MONTHLY = 'MONTHLY'
+YEARLY = 'YEARLY'
+FREQUENCIES = (DAILY, WEEKLY, MONTHLY, YEARLY)
+
+# Index = datetime.weekday() (Montag = 0)
+WEEKDAYS = ('MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU')
+
+_LABELS = {
+    DAILY: "täglich",
+    WEEKLY: "wöchentlich",
+    MONTHLY: "monatlich",
+    YEARLY: "jährlich",
+}
+
+
+class RecurrenceRule:
+    """Eine (unveränderliche) Wiederholungsregel"""
+
+    __slots__ = ('frequency', 'interval', 'weekdays', 'until_ts', 'count', 'partial')
+
+    def __init__(self, frequency: str, interval: int = 1, weekdays: Tuple[int, ...] = (),
+                 until_ts: Optional[float] = None, count: Optional[int] = None, partial: bool = False):
+        """
+        Args:
+            frequency: DAILY, WEEKLY, MONTHLY oder YEARLY
+            interval: Jede n-te Periode
+            weekdays: Wochentage (0 = Montag) für WEEKLY
+            until_ts: Letzter möglicher Start (Epoch-Sekunden)
+            count: Anzahl der Vorkommen
+            partial: Regel enthält nicht abgebildete Bestandteile
+        """
+        if frequency not in FREQUENCIES:
+            raise ValueError(f"Unbekannte Frequenz: {frequency}")
+        self.frequency = frequency
+        self.interval = max(1, int(interval))
+        self.weekdays = tuple(sorted(set(weekdays)))
+        self.until_ts = until_ts
+        self.count = count
+        self.partial = partial
+
+    @property
+    def portable(self) -> bool:
+        """Lässt sich die Regel vollständig in einen anderen Kalender schreiben?"""
+        return not self.partial
+
+    def to_text(self) -> str:
+        parts = [f"FREQ={self.frequency}", f"INTERVAL={self.interval}"]
+        if self.weekdays:
+            parts.append("BYDAY=" + ",".join(WEEKDAYS[day] for day in self.weekdays))
+        if self.until_ts is not None:
+            parts.append(f"UNTIL={int(self.until_ts)}")
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        if self.partial:
+            parts.append("PARTIAL=1")
+        return ";".join(parts)
+
+    def label(self) -> str:
+        """Kurzbeschreibung für die Anzeige, z.B. 'alle 2 Wochen'"""
+        if self.interval == 1:
+            return _LABELS[self.frequency]
+        unit = {DAILY: "Tage", WEEKLY: "Wochen", MONTHLY: "Monate", YEARLY: "Jahre"}[self.frequency]
+        return f"alle {self.interval} {unit}"
+
+    def occurrences(self, first_start: datetime) -> Iterator[datetime]:
+        """
+        Alle Starts der Serie ab first_start (lokale Uhrzeit bleibt erhalten)
+
+        Ohne UNTIL und COUNT ist der Generator unendlich.
+        """
+        for index, start in enumerate(self._candidates(first_start)):
+            if self.count is not None and index >= self.count:
+                return
+            if self.until_ts is not None and start.timestamp() > self.until_ts:
+                return
+            yield start
+
+    def between(self, first_start: datetime, lower: datetime, upper: datetime) -> Iterator[datetime]:
+        """Starts mit lower <= Start < upper"""
+        for start in self.occurrences(first_start):
+            if start >= upper:
+                return
+            if start >= lower:
+                yield start
+
+    def _candidates(self, first_start: datetime) -> Iterator[datetime]:
+        step = 0
+        if self.frequency == DAILY:
+            while True:
+                yield first_start + timedelta(days=step * self.interval)
+                step += 1
+        elif self.frequency == WEEKLY and self.weekdays:
+            # Der Start der Serie ist immer ihr erstes Vorkommen (wie in EventKit)
+            yield first_start
+            week_start = first_start - timedelta(days=first_start.weekday())
+            while True:
+                base = week_start + timedelta(weeks=step * self.interval)
+                for weekday in self.weekdays:
+                    candidate = base + timedelta(days=weekday)
+                    if candidate > first_start:
+                        yield candidate
+                step += 1
+        elif self.frequency == WEEKLY:
+            while True:
+                yield first_start + timedelta(weeks=step * self.interval)
+                step += 1
+        else:
+            months = self.interval * (12 if self.frequency == YEARLY else 1)
+            while True:
+                # Nicht existierende Tage (31. Juni, 29. Februar) werden übersprungen
+                candidate = _add_months(first_start, step * months)
+                if candidate is not None:
+                    yield candidate
+                step += 1
+
+    def __eq__(self, other):
+        return isinstance(other, RecurrenceRule) and self.to_text() == other.to_text()
+
+    def __hash__(self):
+        return hash(self.to_text())
+
+    def __repr__(self):
+        return f"RecurrenceRule({self.to_text()!r})"
+
+
+def _add_months(value: datetime, months: int) -> Optional[datetime]:
+    month_index = value.month - 1 + months
+    try:
+        return value.replace(year=value.year + month_index // 12, month=month_index % 12 + 1)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def parse_rule(text: str) -> Optional[RecurrenceRule]:
+    """
+    Liest eine Regel aus ihrem Text
+
+    Returns:
+        RecurrenceRule oder None (leer oder nicht lesbar, z.B. alte
+        Kurzbeschreibungen wie 'wöchentlich')
+    """
+    if not text or not text.startswith('FREQ='):
+        return None
+    try:
+        values = dict(part.split('=', 1) for part in text.split(';'))
+        weekdays = tuple(WEEKDAYS.index(day) for day in values['BYDAY'].split(',')) if 'BYDAY' in values else ()
+        return RecurrenceRule(
+            values['FREQ'],
+            int(values.get('INTERVAL', 1)),
+            weekdays,
+            float(values['UNTIL']) if 'UNTIL' in values else None,
+            int(values['COUNT']) if 'COUNT' in values else None,
+            values.get('PARTIAL') == '1'
+        )
+    except (ValueError, KeyError):
+        return None
+
@@ -1,106 +1,251 @@
+import functools
 import logging
+import threading
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# EventKit-Integration
+# Backend-Schnittstelle und EventKit-Implementierung
 try:
+    from src.calendar_backend import CalendarBackend
     from src.calendar_client_eventkit import EventKitCalendarClient
-    EVENTKIT_AVAILABLE = True
-    logger.info("✅ EventKit-Integration verfügbar")
 except ImportError:
-    try:
-        from calendar_client_eventkit import EventKitCalendarClient
-        EVENTKIT_AVAILABLE = True
-        logger.info("✅ EventKit-Integration verfügbar")
-    except ImportError as e:
-        EVENTKIT_AVAILABLE = False
-        logger.error(f"❌ EventKit nicht verfügbar: {e}")
-        raise ImportError("EventKit wird für den vereinfachten Client benötigt")
+    from calendar_backend import CalendarBackend
+    from calendar_client_eventkit import EventKitCalendarClient
 
-class SyncMode:
-    ALL = "all"
-    FUTURE = "future"
+# Gemeinsame Duplikaterkennung und Event-Datensatz
+try:
+    from src.event_record import CalendarEvent, ALL_FIELDS, event_timestamp
+except ImportError:
+    from event_record import CalendarEvent, ALL_FIELDS, event_timestamp
+
+try:
+    from src.sync_state import SyncStateStore
+    from src.sync_engine import SyncMode, SyncRun, MAX_DELETE_FRACTION, DEFAULT_PAST_DAYS, DEFAULT_FUTURE_DAYS
+except ImportError:
+    from sync_state import SyncStateStore
+    from sync_engine import SyncMode, SyncRun, MAX_DELETE_FRACTION, DEFAULT_PAST_DAYS, DEFAULT_FUTURE_DAYS
+
+try:
+    from src.cancellation import CancellationToken, cancellable, is_cancelled
+except ImportError:
+    from cancellation import CancellationToken, cancellable, is_cancelled
+
+try:
+    from src.progress import ProgressReporter, track_range
+except ImportError:
+    from progress import ProgressReporter, track_range
 
-class DuplicateCheckMode:
-    LOOSE = "loose"
-    MODERATE = "moderate"
-    STRICT = "strict"
+try:
+    from src.snapshot_cache import SnapshotCache, aligned_range, overlaps, record_from_data
+except ImportError:
+    from snapshot_cache import SnapshotCache, aligned_range, overlaps, record_from_data
+
+try:
+    from src.duplicate_engine import DuplicateCheckMode, filter_new, duplicate_flags, is_duplicate
+except ImportError:
+    from duplicate_engine import DuplicateCheckMode, filter_new, duplicate_flags, is_duplicate
+
+def _serialized(method):
+    """Schreibzugriffe laufen nacheinander - ein Store-Commit gehört genau einem Aufrufer"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._write_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 class SimpleCalendarClient:
     """
-    Vereinfachter Kalender-Client nur mit EventKit
-    - Keine Batching-Komplexität
-    - Keine Cache-Komplexität  
-    - Maximale Zuverlässigkeit
-    - Gleiche Performance wie komplexe Version
+    Vereinfachter Kalender-Client
+    - Arbeitet gegen ein CalendarBackend (Standard: EventKit)
+    - Schreibt in Batches mit einem Store-Commit pro batch_size Events
+    - Optionaler Snapshot-Cache für wiederholte Abfragen derselben Zeiträume
+    - Optionaler Sync-Status für inkrementelle Syncs
+    
+    Aufrufe dürfen aus mehreren Threads kommen (z.B. aus mehreren Tabs über
+    den StoreExecutor, der alle Backend-Zugriffe in seinen Store-Thread
+    legt); Schreibzugriffe sind über einen Lock serialisiert, so dass sich
+    die Batches gleichzeitiger Jobs nicht im Store vermischen.
     """
     
-    def __init__(self):
-        """Initialisiert den vereinfachten EventKit-Client"""
-        if not EVENTKIT_AVAILABLE:
-            raise RuntimeError("EventKit ist nicht verfügbar")
-            
-        self.eventkit_client = EventKitCalendarClient()
+    def __init__(self, batch_size: int = CalendarBackend.DEFAULT_BATCH_SIZE,
+                 backend: Optional[CalendarBackend] = None, sync_state: Optional[SyncStateStore] = None,
+                 snapshots: Optional[SnapshotCache] = None):
+        """
+        Initialisiert den vereinfachten Client
+        
+        Args:
+            batch_size: Schreiboperationen pro Store-Commit
+            backend: Kalender-Backend (Standard: EventKitCalendarClient)
+            sync_state: Persistenter Sync-Status - ohne wird bei jedem Sync
+                        der Zielkalender vollständig verglichen
+            snapshots: Gemeinsamer Cache geladener Zeiträume - ohne wird
+                       jede Abfrage an das Backend gestellt
+        """
+        self.batch_size = max(1, batch_size)
+        if backend is None:
+            backend = EventKitCalendarClient(batch_size=self.batch_size)
+            if not backend.is_available():
+                raise RuntimeError("EventKit konnte nicht initialisiert werden")
+        elif not backend.is_available():
+            raise RuntimeError(f"Backend {type(backend).__name__} ist nicht verfügbar")
         
-        if not self.eventkit_client.is_available():
-            raise RuntimeError("EventKit konnte nicht initialisiert werden")
+        self.backend = backend
+        self.sync_state = sync_state
+        self.snapshots = snapshots
+        self._write_lock = threading.RLock()
             
-        logger.info("🚀 Vereinfachter EventKit-Client initialisiert")
+        logger.info(f"🚀 Vereinfachter Client initialisiert ({type(backend).__name__})")
 
-    def list_calendars(self) -> List[str]:
-        """Listet alle verfügbaren Kalender auf"""
+    def list_calendars(self, refresh: bool = False) -> List[str]:
+        """
+        Listet alle verfügbaren Kalender auf
+        
+        Args:
+            refresh: Gecachte Kalender-Handles vorher verwerfen
+        """
         try:
-            calendars = self.eventkit_client.list_calendars()
+            if refresh:
+                self.backend.refresh_calendars()
+                if self.snapshots is not None:
+                    self.snapshots.invalidate()
+            calendars = self.backend.list_calendars()
             logger.debug(f"Gefunden: {len(calendars)} Kalender")
             return calendars
         except Exception as e:
             logger.error(f"Fehler beim Laden der Kalender: {e}")
             return []
 
-    def get_events(self, calendar_name: str, sync_mode: str = SyncMode.ALL) -> List[Dict[str, Any]]:
-        """Holt Ereignisse aus einem Kalender"""
+    def get_events(self, calendar_name: str, sync_mode: str = SyncMode.ALL,
+                   fields=ALL_FIELDS) -> List[CalendarEvent]:
+        """
+        Holt Ereignisse aus einem Kalender
+        
+        Die CalendarEvent-Datensätze verhalten sich für Lesezugriffe wie
+        Dictionaries ('summary', 'title', 'start_date', ...).
+        
+        Args:
+            calendar_name: Name des Kalenders
+            sync_mode: Zeitraum (ALL oder FUTURE)
+            fields: Sofort zu ladende Felder, z.B. DEDUP_FIELDS - der Rest wird lazy geladen
+        """
         try:
-            # Berechne Zeitraum basierend auf SyncMode
-            if sync_mode == SyncMode.FUTURE:
-                start_date = datetime.now()
-                end_date = datetime.now() + timedelta(days=365)
-            else:  # SyncMode.ALL
-                start_date = datetime.now() - timedelta(days=365)
-                end_date = datetime.now() + timedelta(days=365)
+            start_date, end_date = self.sync_window(sync_mode)
             
-            # Hole Events direkt von EventKit
-            events = self.eventkit_client.get_events(calendar_name, start_date, end_date)
+            # Hole Events aus dem Snapshot-Cache bzw. direkt von EventKit
+            events = self._load_range(calendar_name, start_date, end_date, fields)
             
-            # Konvertiere zu einheitlichem Format
-            converted_events = []
-            for event in events:
-                title = event.get('title', '')
-                converted_event = {
-                    'summary': title,
-                    'title': title,  # Für Kompatibilität mit duplicate_cleanup_tab
-                    'start_date': event.get('start_date'),
-                    'end_date': event.get('end_date'),
-                    'description': event.get('description', ''),
-                    'location': event.get('location', ''),
-                    'allday_event': event.get('all_day', False),
-                    'modified_date': event.get('start_date', datetime.now())
-                }
-                converted_events.append(converted_event)
-            
-            logger.info(f"🚀 {len(converted_events)} Events geladen aus '{calendar_name}'")
-            return converted_events
+            logger.info(f"🚀 {len(events)} Events geladen aus '{calendar_name}'")
+            return events
             
         except Exception as e:
             logger.error(f"Fehler beim Laden der Events aus '{calendar_name}': {e}")
             return []
 
+    def iter_events(self, calendar_name: str, sync_mode: str = SyncMode.ALL, fields=ALL_FIELDS,
+                    window_days: int = 30,
+                    date_range: Optional[Tuple[datetime, datetime]] = None,
+                    cancel: Optional[CancellationToken] = None,
+                    progress: Optional[ProgressReporter] = None) -> Iterator[CalendarEvent]:
+        """
+        Liefert Ereignisse fensterweise, sobald jedes Teilfenster geladen ist
+        
+        Args:
+            calendar_name: Name des Kalenders
+            sync_mode: Zeitraum (ALL oder FUTURE)
+            fields: Sofort zu ladende Felder
+            window_days: Größe der Teilfenster in Tagen (z.B. 30 = ein Monat)
+            date_range: Fester Zeitraum (start, end) statt sync_mode
+            cancel: Bricht mit OperationCancelled ab, bevor ein weiteres Fenster geladen wird
+            progress: Zählt jedes Event, Anteil = Position im Zeitraum (Phase startet der Aufrufer)
+        """
+        start_date, end_date = date_range or self.sync_window(sync_mode)
+        if self.snapshots is None:
+            events = self.backend.iter_events(calendar_name, start_date, end_date, fields, window_days)
+        else:
+            events = self._iter_cached(calendar_name, start_date, end_date, fields, window_days)
+        if progress is not None:
+            events = track_range(events, progress, start_date.timestamp(), end_date.timestamp())
+        return cancellable(events, cancel) if cancel is not None else events
+
+    def _load_range(self, calendar_name: str, start_date: datetime, end_date: datetime,
+                    fields) -> List[CalendarEvent]:
+        """Events eines Zeitraums - aus einem Snapshot oder geladen und als Snapshot gemerkt"""
+        if self.snapshots is None:
+            return self.backend.get_events(calendar_name, start_date, end_date, fields)
+        
+        lower, upper = start_date.timestamp(), end_date.timestamp()
+        token = self.backend.change_token()
+        events = self.snapshots.lookup(calendar_name, lower, upper, token)
+        if events is not None:
+            logger.debug(f"♻️ {len(events)} Events aus dem Snapshot von '{calendar_name}'")
+            return events
+        
+        snapshot_lower, snapshot_upper = aligned_range(lower, upper)
+        loaded = self.backend.get_events(calendar_name, datetime.fromtimestamp(snapshot_lower),
+                                         datetime.fromtimestamp(snapshot_upper), fields)
+        self.snapshots.store(calendar_name, snapshot_lower, snapshot_upper, loaded, token)
+        return [event for event in loaded if overlaps(event, lower, upper)]
+
+    def _iter_cached(self, calendar_name: str, start_date: datetime, end_date: datetime, fields,
+                     window_days: int) -> Iterator[CalendarEvent]:
+        """
+        iter_events mit Snapshot-Cache
+        
+        Ohne passenden Snapshot wird weiter fensterweise geladen und dabei
+        gesammelt; nur vollständig gelesene Zeiträume werden gemerkt.
+        """
+        lower, upper = start_date.timestamp(), end_date.timestamp()
+        token = self.backend.change_token()
+        events = self.snapshots.lookup(calendar_name, lower, upper, token)
+        if events is not None:
+            logger.debug(f"♻️ {len(events)} Events aus dem Snapshot von '{calendar_name}'")
+            yield from events
+            return
+        
+        snapshot_lower, snapshot_upper = aligned_range(lower, upper)
+        collected = []
+        for event in self.backend.iter_events(calendar_name, datetime.fromtimestamp(snapshot_lower),
+                                              datetime.fromtimestamp(snapshot_upper), fields, window_days):
+            if collected is not None:
+                collected.append(event)
+                if len(collected) > self.snapshots.max_events:
+                    # Zu groß für den Cache - nur noch streamen
+                    collected = None
+            if overlaps(event, lower, upper):
+                yield event
+        if collected is not None:
+            self.snapshots.store(calendar_name, snapshot_lower, snapshot_upper, collected, token)
+
+    def _write_through(self, calendar_name: str, token_before: int, **changes):
+        """Überträgt eigene Schreibvorgänge in den Snapshot-Cache (siehe SnapshotCache.write_through)"""
+        if self.snapshots is not None:
+            self.snapshots.write_through(calendar_name, token_before, self.backend.change_token(), **changes)
+
+    @staticmethod
+    def sync_window(sync_mode: str, past_days: int = DEFAULT_PAST_DAYS,
+                    future_days: int = DEFAULT_FUTURE_DAYS) -> Tuple[datetime, datetime]:
+        """
+        Berechnet den Zeitraum basierend auf dem SyncMode
+        
+        Args:
+            past_days: Tage vor heute (nur SyncMode.ALL)
+            future_days: Tage nach heute
+        """
+        now = datetime.now()
+        if sync_mode == SyncMode.FUTURE:
+            return now, now + timedelta(days=future_days)
+        # SyncMode.ALL
+        return now - timedelta(days=past_days), now + timedelta(days=future_days)
+
+    @_serialized
     def create_event(self, calendar_name: str, event_data: Dict[str, Any]) -> bool:
         """Erstellt ein einzelnes Event"""
         try:
-            success = self.eventkit_client.create_event(
+            token = self.backend.change_token()
+            success = self.backend.create_event(
                 calendar_name=calendar_name,
                 title=event_data.get('summary', 'Kein Titel'),
                 start_date=event_data.get('start_date'),
@@ -108,6 +253,8 @@ class SimpleCalendarClient:
                 description=event_data.get('description', ''),
                 location=event_data.get('location', '')
             )
+            # Ohne Identifier des neuen Events nicht abbildbar
+            self._write_through(calendar_name, token, reset=True)
             
             if success:
                 logger.debug(f"✅ Event erstellt: {event_data.get('summary', 'Unbekannt')}")
@@ -120,73 +267,62 @@ class SimpleCalendarClient:
             logger.error(f"Fehler beim Erstellen des Events: {e}")
             return False
 
-    def sync_calendars(self, source_calendar: str, target_calendar: str, sync_mode: str = SyncMode.ALL, duplicate_check_mode: str = DuplicateCheckMode.MODERATE) -> int:
+    def sync_calendars(self, source_calendar: str, target_calendar: str, sync_mode: str = SyncMode.ALL, duplicate_check_mode: str = DuplicateCheckMode.MODERATE,
+                       delete_removed: bool = True, max_delete_fraction: float = MAX_DELETE_FRACTION,
+                       past_days: int = DEFAULT_PAST_DAYS, future_days: int = DEFAULT_FUTURE_DAYS,
+                       full_scan: bool = False, cancel: Optional[CancellationToken] = None,
+                       progress: Optional[ProgressReporter] = None) -> int:
         """
         Synchronisiert Ereignisse zwischen zwei Kalendern mit Duplikatsprüfung
         
-        INKREMENTELLER SYNC:
-        1. Lade Quell-Events
-        2. Lade Ziel-Events für Duplikatsprüfung
-        3. Filtere bereits existierende Events heraus
-        4. Erstelle nur neue Events
+        INKREMENTELLER SYNC (siehe sync_engine.SyncRun):
+        1. Lade die gespeicherten Zuordnungen Quelle → Ziel (falls sync_state)
+        2. Lade Quell-Events fensterweise und überspringe unveränderte
+           (Zeitraum aus past_days/future_days; mit sync_state nur ab dem
+           Cursor des letzten Laufs, außer bei full_scan)
+        3. Aktualisiere geänderte Events direkt im Zielkalender
+        4. Prüfe neue Events gegen den Zielkalender (nur deren Zeitspanne) und
+           erstelle sie blockweise
+           (wiederkehrende Events als eine Serie, Ausnahmen einzeln)
+        5. Lösche Ziel-Events, deren Quell-Event gelöscht wurde (delete_removed,
+           nur mit sync_state; abgebrochen ab max_delete_fraction)
+        
+        Mit cancel endet der Sync nach dem laufenden Block; gemeldet wird
+        das Teilergebnis. progress erhält Phase, Stand, Durchsatz und Restzeit.
+        
+        Returns:
+            Anzahl erstellter und aktualisierter Events
         """
         try:
             logger.info(f"🔄 Starte Sync mit Duplikatsprüfung: {source_calendar} → {target_calendar}")
-            logger.info(f"📋 Modus: {sync_mode}, Duplikatsprüfung: {duplicate_check_mode}")
+            logger.info(f"📋 Modus: {sync_mode} (-{past_days}/+{future_days} Tage), Duplikatsprüfung: {duplicate_check_mode}")
             
-            # 1. Lade Quell-Events
-            source_events = self.get_events(source_calendar, sync_mode)
+            stats = SyncRun(self, source_calendar, target_calendar, sync_mode, duplicate_check_mode,
+                            delete_removed, max_delete_fraction, past_days, future_days, full_scan,
+                            cancel, progress).run()
             
-            if not source_events:
+            if stats.source == 0:
                 logger.info("Keine Events zum Synchronisieren gefunden")
                 return 0
             
-            # 2. Lade existierende Events aus Zielkalender
-            logger.info("🔍 Lade existierende Events aus Zielkalender...")
-            target_events = self.get_events(target_calendar, SyncMode.ALL)
-            
-            logger.info(f"📊 {len(source_events)} Quell-Events, {len(target_events)} Ziel-Events")
-            
-            # 3. Filtere Duplikate heraus
-            new_events = self._filter_duplicates(source_events, target_events, duplicate_check_mode)
-            
-            if not new_events:
-                logger.info("✅ Sync mit Duplikatsprüfung abgeschlossen:")
-                logger.info(f"   📝 0 Events erstellt")
-                logger.info(f"   ⏭️ {len(source_events)} Duplikate übersprungen")
-                logger.info(f"   ❌ 0 Fehler")
-                return 0
-            
-            logger.info(f"📋 {len(new_events)} neue Events zu erstellen (von {len(source_events)} Quell-Events)")
-            
-            # 4. Erstelle nur neue Events
-            success_count = 0
-            error_count = 0
-            
-            for i, event in enumerate(new_events, 1):
-                try:
-                    if self.create_event(target_calendar, event):
-                        success_count += 1
-                    else:
-                        error_count += 1
-                    
-                    # Progress-Logging
-                    if len(new_events) > 10 and i % 10 == 0:
-                        logger.info(f"📊 Fortschritt: {i}/{len(new_events)} Events verarbeitet")
-                        
-                except Exception as e:
-                    error_count += 1
-                    logger.warning(f"Event {i} übersprungen: {e}")
-                    continue
-            
             # Finale Statistik
-            duplicates_skipped = len(source_events) - len(new_events)
-            logger.info(f"✅ Sync mit Duplikatsprüfung abgeschlossen:")
-            logger.info(f"   📝 {success_count} Events erstellt")
-            logger.info(f"   ⏭️ {duplicates_skipped} Duplikate übersprungen")
-            logger.info(f"   ❌ {error_count} Fehler")
-            
-            return success_count
+            logger.info(f"📊 {stats.source} Quell-Events, {stats.target} Ziel-Events geladen")
+            if stats.cancelled:
+                logger.info("⏹️ Sync abgebrochen - Teilergebnis:")
+            else:
+                logger.info(f"✅ Sync mit Duplikatsprüfung abgeschlossen:")
+            logger.info(f"   📝 {stats.created} Events erstellt")
+            logger.info(f"   ✏️ {stats.updated} Events aktualisiert")
+            logger.info(f"   🗑️ {stats.deleted} Events gelöscht")
+            if stats.deletion_aborted:
+                logger.warning("   ⚠️ Löschabgleich wegen Sicherheitsgrenze übersprungen")
+            logger.info(f"   💤 {stats.unchanged} unverändert (Sync-Status)")
+            if stats.occurrences:
+                logger.info(f"   🔁 {stats.occurrences} Vorkommen über Serien abgedeckt")
+            logger.info(f"   ⏭️ {stats.duplicates} Duplikate übersprungen")
+            logger.info(f"   ❌ {stats.errors} Fehler")
+            
+            return stats.written
             
         except Exception as e:
             logger.error(f"❌ Sync-Fehler: {e}")
@@ -207,20 +343,17 @@ class SimpleCalendarClient:
         if not target_events:
             return source_events
         
-        new_events = []
-        
-        for source_event in source_events:
-            is_duplicate = False
-            
-            for target_event in target_events:
-                if self._is_duplicate_event(source_event, target_event, check_mode):
-                    is_duplicate = True
-                    break
-            
-            if not is_duplicate:
-                new_events.append(source_event)
+        return filter_new(source_events, target_events, check_mode)
+
+    def duplicate_flags(self, events: List[Dict[str, Any]], target_events: List[Dict[str, Any]],
+                        check_mode: str = DuplicateCheckMode.MODERATE) -> List[bool]:
+        """
+        Prüft für jedes Event, ob es bereits in target_events existiert
         
-        return new_events
+        Returns:
+            Liste mit True (Duplikat) / False (neu) in der Reihenfolge von events
+        """
+        return duplicate_flags(events, target_events, check_mode)
 
     def _is_duplicate_event(self, event1: Dict[str, Any], event2: Dict[str, Any], check_mode: str) -> bool:
         """
@@ -234,104 +367,161 @@ class SimpleCalendarClient:
         Returns:
             True wenn Events als Duplikate gelten
         """
-        try:
-            # Titel vergleichen (case-insensitive)
-            title1 = (event1.get('title', '') or event1.get('summary', '')).strip().lower()
-            title2 = (event2.get('title', '') or event2.get('summary', '')).strip().lower()
-            
-            if not title1 or not title2 or title1 != title2:
-                return False
-            
-            # Datum vergleichen
-            start1 = event1.get('start_date')
-            start2 = event2.get('start_date')
-            
-            if not start1 or not start2:
-                return False
-            
-            # Konvertiere zu datetime falls nötig
-            if isinstance(start1, str):
-                try:
-                    start1 = datetime.fromisoformat(start1.replace('Z', '+00:00'))
-                except ValueError:
-                    # Fallback für andere Datumsformate
-                    from dateutil import parser
-                    start1 = parser.parse(start1)
-            if isinstance(start2, str):
-                try:
-                    start2 = datetime.fromisoformat(start2.replace('Z', '+00:00'))
-                except ValueError:
-                    # Fallback für andere Datumsformate
-                    from dateutil import parser
-                    start2 = parser.parse(start2)
-            
-            # Datum-Vergleich (nur Tag bei loose, sonst mit Zeit)
-            if check_mode == DuplicateCheckMode.LOOSE:
-                # Nur Datum vergleichen
-                if start1.date() != start2.date():
-                    return False
-            else:
-                # Datum + Zeit vergleichen (mit Toleranz von 1 Minute)
-                time_diff = abs((start1 - start2).total_seconds())
-                if time_diff > 60:  # Mehr als 1 Minute Unterschied
-                    return False
-            
-            # Bei strict mode auch Ort vergleichen
-            if check_mode == DuplicateCheckMode.STRICT:
-                location1 = (event1.get('location', '') or '').strip().lower()
-                location2 = (event2.get('location', '') or '').strip().lower()
-                
-                if location1 != location2:
-                    return False
-            
-            return True
-            
-        except Exception as e:
-            logger.warning(f"Fehler beim Duplikat-Vergleich: {e}")
-            return False
+        return is_duplicate(event1, event2, check_mode)
 
-    def create_events_simple(self, calendar_name: str, events: List[Dict[str, Any]]) -> tuple:
-        """Erstellt mehrere Events ohne Batching-Komplexität"""
+    def create_events_simple(self, calendar_name: str, events: List[Dict[str, Any]],
+                             cancel: Optional[CancellationToken] = None,
+                             progress: Optional[ProgressReporter] = None) -> tuple:
+        """
+        Erstellt mehrere Events mit einem Commit pro Batch
+        
+        Args:
+            cancel: Vor jedem Batch geprüft - bei Abbruch bleiben die
+                    bereits erstellten Events bestehen
+            progress: Fortschritt pro Batch
+        
+        Returns:
+            (erfolgreich, Fehler) - bei Abbruch nur für die erstellten Batches
+        """
         if not events:
             return 0, 0
             
-        success_count = 0
-        error_count = 0
-        
         logger.info(f"🔄 Erstelle {len(events)} Events in '{calendar_name}'")
         
-        for i, event in enumerate(events, 1):
-            try:
-                if self.create_event(calendar_name, event):
-                    success_count += 1
-                else:
-                    error_count += 1
-                    
-                # Progress bei vielen Events
-                if len(events) > 10 and i % 5 == 0:
-                    logger.debug(f"📊 {i}/{len(events)} Events verarbeitet")
-                    
-            except Exception as e:
-                error_count += 1
-                logger.warning(f"Event {i} fehlgeschlagen: {e}")
+        success_count = error_count = 0
+        if progress is not None:
+            progress.start("Events erstellen", len(events))
+        for offset in range(0, len(events), self.batch_size):
+            if is_cancelled(cancel):
+                logger.info(f"⏹️ Event-Erstellung abgebrochen nach {offset} von {len(events)} Events")
+                break
+            results = self.save_events(calendar_name, events[offset:offset + self.batch_size])
+            succeeded = sum(1 for result in results if result['success'])
+            success_count += succeeded
+            error_count += len(results) - succeeded
+            if progress is not None:
+                progress.advance(len(results))
+        if progress is not None:
+            progress.finish(not is_cancelled(cancel))
         
         logger.info(f"✅ Event-Erstellung: {success_count} erfolgreich, {error_count} Fehler")
         return success_count, error_count
 
+    @_serialized
+    def save_events(self, calendar_name: str, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Erstellt mehrere Events im Batch-Modus
+        
+        Args:
+            calendar_name: Name des Zielkalenders
+            events: Event-Daten
+            
+        Returns:
+            Ergebnis pro Event: {'id', 'title', 'success', 'error', 'target_id'}
+        """
+        token = self.backend.change_token()
+        try:
+            results = self.backend.save_events(calendar_name, events, self.batch_size)
+        except Exception as e:
+            logger.error(f"❌ Fehler beim Erstellen von Events: {e}")
+            self._write_through(calendar_name, token, reset=True)
+            return [
+                {'id': event.get('id', ''), 'title': event.get('title', ''), 'success': False, 'error': str(e)}
+                for event in events
+            ]
+        
+        added = []
+        for event_data, result in zip(events, results):
+            if not result['success']:
+                continue
+            if 'recurrence_rule' in event_data or not result.get('target_id'):
+                # Serien bzw. Events ohne Identifier nicht abbildbar
+                self._write_through(calendar_name, token, reset=True)
+                return results
+            added.append(record_from_data(result['target_id'], calendar_name, event_data))
+        self._write_through(calendar_name, token, added=added)
+        return results
+
     def get_calendar_info(self) -> Dict[str, Any]:
         """Gibt einfache Kalender-Informationen zurück"""
         calendars = self.list_calendars()
         return {
             'total_calendars': len(calendars),
             'calendar_names': calendars,
-            'eventkit_available': True,
-            'client_type': 'SimpleEventKit'
+            'eventkit_available': isinstance(self.backend, EventKitCalendarClient),
+            'client_type': type(self.backend).__name__
         }
 
     def is_available(self) -> bool:
         """Prüft ob der Client verfügbar ist"""
-        return self.eventkit_client.is_available()
+        return self.backend.is_available()
+
+    def change_token(self) -> int:
+        """Ändert sich, sobald sich der Kalender-Speicher ändert"""
+        return self.backend.change_token()
     
+    @_serialized
+    def update_events(self, calendar_name: str, updates: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Aktualisiert bestehende Events direkt (Identifier bleibt erhalten)
+        
+        Args:
+            calendar_name: Name des Kalenders der Ziel-Events
+            updates: (Identifier des Ziel-Events, neue Event-Daten)
+            
+        Returns:
+            Ergebnis pro Eintrag: {'id', 'title', 'success', 'error', 'target_id'}
+        """
+        token = self.backend.change_token()
+        try:
+            results = self.backend.update_events(calendar_name, updates, self.batch_size)
+        except Exception as e:
+            logger.error(f"❌ Fehler beim Aktualisieren von Events: {e}")
+            self._write_through(calendar_name, token, reset=True)
+            return [
+                {'id': event.get('id', ''), 'title': event.get('title', ''), 'success': False, 'error': str(e)}
+                for _, event in updates
+            ]
+        
+        updated = []
+        for (target_id, event_data), result in zip(updates, results):
+            if not result['success']:
+                continue
+            if 'recurrence_rule' in event_data:
+                self._write_through(calendar_name, token, reset=True)
+                return results
+            updated.append(record_from_data(result.get('target_id') or target_id, calendar_name, event_data))
+        self._write_through(calendar_name, token, updated=updated)
+        return results
+
+    @_serialized
+    def remove_occurrences(self, calendar_name: str, occurrences: List[Tuple[str, float]]) -> List[Dict[str, Any]]:
+        """
+        Entfernt einzelne Vorkommen von Serien
+        
+        Args:
+            calendar_name: Name des Kalenders
+            occurrences: (Identifier der Serie, Start des Vorkommens)
+            
+        Returns:
+            Ergebnis pro Vorkommen: {'id', 'title', 'success', 'error'}
+        """
+        token = self.backend.change_token()
+        try:
+            results = self.backend.remove_occurrences(calendar_name, occurrences, self.batch_size)
+        except Exception as e:
+            logger.error(f"❌ Fehler beim Entfernen von Vorkommen: {e}")
+            self._write_through(calendar_name, token, reset=True)
+            return [
+                {'id': series_id, 'title': '', 'success': False, 'error': str(e)}
+                for series_id, _ in occurrences
+            ]
+        
+        self._write_through(calendar_name, token, removed=[
+            occurrence for occurrence, result in zip(occurrences, results) if result['success']
+        ])
+        return results
+
     def delete_event(self, calendar_name: str, event_data: Dict[str, Any]) -> bool:
         """
         Löscht ein Event aus dem angegebenen Kalender
@@ -343,8 +533,46 @@ class SimpleCalendarClient:
         Returns:
             bool: True wenn erfolgreich gelöscht, False bei Fehler
         """
+        results = self.delete_events(calendar_name, [event_data])
+        return bool(results) and results[0]['success']
+
+    @_serialized
+    def delete_events(self, calendar_name: str, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Löscht mehrere Events über ihren Identifier
+        
+        Args:
+            calendar_name: Name des Kalenders
+            events: Event-Daten (mit 'id' aus get_events)
+            
+        Returns:
+            Ergebnis pro Event: {'id', 'title', 'success', 'error'}
+        """
+        token = self.backend.change_token()
         try:
-            return self.eventkit_client.delete_event(calendar_name, event_data)
+            results = self.backend.delete_events(calendar_name, events, self.batch_size)
         except Exception as e:
-            logger.error(f"❌ Fehler beim Löschen von Event: {e}")
-            return False 
\ No newline at end of file
+            logger.error(f"❌ Fehler beim Löschen von Events: {e}")
+            self._write_through(calendar_name, token, reset=True)
+            return [
+                {'id': event.get('id', ''), 'title': event.get('title', ''), 'success': False, 'error': str(e)}
+                for event in events
+            ]
+        
+        removed = []
+        for event_data, result in zip(events, results):
+            if not result['success']:
+                continue
+            event_id = event_data.get('id')
+            if not event_id:
+                # Über Eigenschaften gefunden - Identifier unbekannt
+                self._write_through(calendar_name, token, reset=True)
+                return results
+            start_date = event_data.get('start_date')
+            if event_data.get('whole_series') or start_date is None:
+                removed.append((event_id, None))
+            else:
+                removed.append((event_id, event_timestamp(event_data, 'start_ts', 'start_date')))
+        self._write_through(calendar_name, token, removed=removed)
+        return results
+
@@ -7,58 +7,102 @@ Vereinfachte GUI für Kalender-Synchronisation
 """
 
 import sys
+import time
 import logging
-from datetime import datetime
+from collections import deque
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QLabel, QComboBox, QPushButton, 
-                            QTextEdit, QProgressBar, QCheckBox, QSpinBox,
-                            QTabWidget, QTableWidget, QTableWidgetItem,
+                            QPlainTextEdit, QProgressBar, QCheckBox, QSpinBox,
+                            QTabWidget, QTableView,
                             QHeaderView, QMessageBox)
-from PyQt6.QtCore import QThread, pyqtSignal, pyqtSlot, Qt
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot, Qt
 from PyQt6.QtGui import QFont
 
 # Import des vereinfachten Clients
 from simple_calendar_client import SimpleCalendarClient, SyncMode, DuplicateCheckMode
 from duplicate_cleanup_tab import DuplicateCleanupTab
+from event_record import DEDUP_FIELDS, LIST_FIELDS
+from sync_state import SyncStateStore
+from sync_engine import DEFAULT_PAST_DAYS, DEFAULT_FUTURE_DAYS
+from snapshot_cache import SnapshotCache
+from cancellation import CancellationToken, OperationCancelled
+from progress import ProgressReporter, show_on_progress_bar
+from status_log import StatusLog, open_log_file
+from store_executor import StoreExecutor
+from store_jobs import FutureRelay, StoreJob
+from event_table_model import (EventTableModel, COLUMN_CHECK, COLUMN_TITLE, COLUMN_DATE,
+                               COLUMN_DESCRIPTION, COLUMN_STATUS, STATUS_NEW, STATUS_DUPLICATE)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class SimpleBackgroundWorker(QThread):
-    """Einfacher Background-Worker ohne Komplexität"""
-    result = pyqtSignal(object)
+# Streaming in die Event-Tabelle: Blockgröße bzw. spätestens alle STREAM_INTERVAL Sekunden
+STREAM_CHUNK_SIZE = 500
+STREAM_INTERVAL = 0.1
+# Zeitbudget pro Frame für das Einfügen in die Tabelle (GUI-Thread)
+FRAME_BUDGET_MS = 8
+
+class ProgressRelay(QObject):
+    """Leitet Fortschrittsmeldungen aus Worker-Threads in den GUI-Thread"""
+    update = pyqtSignal(object, object)  # QProgressBar, ProgressUpdate
+
+class StreamingWorker(StoreJob):
+    """
+    Worker, der die Elemente eines Iterators blockweise weitergibt, während er noch lädt
+    
+    Abbruch über das CancellationToken, das func als cancel erhält.
+    """
+    chunk = pyqtSignal(list)
     error = pyqtSignal(str)
-    finished = pyqtSignal()
 
-    def __init__(self, func, *args, **kwargs):
-        super().__init__()
+    def __init__(self, store, func, *args, **kwargs):
+        super().__init__(store)
         self.func = func
         self.args = args
         self.kwargs = kwargs
+        self.cancel = CancellationToken()
+        self.kwargs['cancel'] = self.cancel
 
     def run(self):
         try:
-            result = self.func(*self.args, **self.kwargs)
-            self.result.emit(result)
+            block = []
+            last_emit = time.monotonic()
+            for item in self.func(*self.args, **self.kwargs):
+                block.append(item)
+                # Erster Block nach kurzer Zeit, danach bei voller Blockgröße
+                if len(block) >= STREAM_CHUNK_SIZE or time.monotonic() - last_emit >= STREAM_INTERVAL:
+                    self.chunk.emit(block)
+                    block = []
+                    last_emit = time.monotonic()
+            if block:
+                self.chunk.emit(block)
+        except OperationCancelled:
+            # Bis dahin geladene Blöcke sind schon übergeben
+            pass
         except Exception as e:
             self.error.emit(str(e))
-        finally:
-            self.finished.emit()
 
-class SimpleSyncWorker(QThread):
+class SimpleSyncWorker(StoreJob):
     """Einfacher Sync-Worker ohne Timer-Komplexität"""
     progress = pyqtSignal(str)
     sync_complete = pyqtSignal(int)
     error = pyqtSignal(str)
 
-    def __init__(self, client, source_calendar, target_calendar, sync_mode, duplicate_check_mode=DuplicateCheckMode.MODERATE):
-        super().__init__()
-        self.client = client
+    def __init__(self, store, source_calendar, target_calendar, sync_mode, duplicate_check_mode=DuplicateCheckMode.MODERATE,
+                 delete_removed=True, past_days=DEFAULT_PAST_DAYS, future_days=DEFAULT_FUTURE_DAYS, full_scan=False,
+                 progress=None):
+        super().__init__(store)
+        self.client = store.client
         self.source_calendar = source_calendar
         self.target_calendar = target_calendar
         self.sync_mode = sync_mode
         self.duplicate_check_mode = duplicate_check_mode
-        self.is_running = True
+        self.delete_removed = delete_removed
+        self.past_days = past_days
+        self.future_days = future_days
+        self.full_scan = full_scan
+        self.progress_reporter = progress
+        self.cancel = CancellationToken()
 
     def run(self):
         try:
@@ -68,7 +112,13 @@ class SimpleSyncWorker(QThread):
                 self.source_calendar, 
                 self.target_calendar, 
                 self.sync_mode,
-                self.duplicate_check_mode
+                self.duplicate_check_mode,
+                delete_removed=self.delete_removed,
+                past_days=self.past_days,
+                future_days=self.future_days,
+                full_scan=self.full_scan,
+                cancel=self.cancel,
+                progress=self.progress_reporter
             )
             
             self.sync_complete.emit(count)
@@ -77,9 +127,8 @@ class SimpleSyncWorker(QThread):
             self.error.emit(str(e))
 
     def stop(self):
-        self.is_running = False
-        self.quit()
-        self.wait()
+        """Fordert den Abbruch an - der Sync endet nach dem laufenden Block"""
+        self.cancel.cancel()
 
 class SimpleCalendarGUI(QMainWindow):
     """
@@ -89,18 +138,43 @@ class SimpleCalendarGUI(QMainWindow):
     - 100% zuverlässig
     """
     
-    def __init__(self):
+    def __init__(self, backend=None):
+        """
+        Args:
+            backend: Optionales CalendarBackend (Standard: EventKit)
+        """
         super().__init__()
         
         try:
             logger.info("🚀 Initialisiere vereinfachte GUI...")
-            self.calendar_client = SimpleCalendarClient()
+            # Ein Snapshot-Cache für alle Tabs: wiederholte Abfragen derselben Kalender
+            # (Liste, Duplikatprüfung, Sync, Bereinigung) laden nicht erneut
+            self.calendar_client = SimpleCalendarClient(backend=backend, sync_state=self._open_sync_state(),
+                                                        snapshots=SnapshotCache())
+            # Alle Zugriffe auf den Kalenderspeicher laufen über diesen Executor
+            self.store = StoreExecutor(self.calendar_client)
+            self.future_relay = FutureRelay(self)
             
-            self.current_worker = None
+            # Laufender Vorgang im manuellen Tab (Laden, Prüfen oder Erstellen)
+            self.manual_task = None
+            self.load_worker = None
             self.sync_worker = None
+            # Abbruch für Laden/Erstellen im manuellen Tab
+            self._manual_cancel = None
+            
+            # Fortschritt aller Worker → Fortschrittsbalken
+            self.progress_relay = ProgressRelay(self)
+            self.progress_relay.update.connect(self._on_progress)
             self.is_syncing = False
             self.loaded_events = []
             
+            # Nachgeladene Blöcke, die noch in die Tabelle müssen
+            self._pending_chunks = deque()
+            self._stream_done = True
+            self._append_timer = QTimer(self)
+            self._append_timer.setInterval(0)
+            self._append_timer.timeout.connect(self._append_pending_events)
+            
             self.init_ui()
             
             # Kalender laden NACH der UI-Initialisierung
@@ -113,6 +187,14 @@ class SimpleCalendarGUI(QMainWindow):
             QMessageBox.critical(None, "Fehler", f"GUI konnte nicht gestartet werden:\n{e}")
             sys.exit(1)
 
+    def _open_sync_state(self):
+        """Öffnet den persistenten Sync-Status - ohne ihn läuft der Sync weiter, nur langsamer"""
+        try:
+            return SyncStateStore()
+        except Exception as e:
+            logger.warning(f"⚠️ Sync-Status nicht verfügbar: {e}")
+            return None
+
     def init_ui(self):
         """Initialisiert die einfache Benutzeroberfläche"""
         self.setWindowTitle('📅 Kalender Sync')
@@ -147,7 +229,7 @@ class SimpleCalendarGUI(QMainWindow):
         self.setup_manual_tab()
         
         # Tab 3: Duplikatbereinigung - NEU!
-        self.cleanup_tab = DuplicateCleanupTab(self.calendar_client)
+        self.cleanup_tab = DuplicateCleanupTab(self.store)
         self.cleanup_tab.status_message.connect(self.log_status)
         self.cleanup_tab.error_message.connect(self.log_error)
         self.tab_widget.addTab(self.cleanup_tab, "🧹 Duplikatbereinigung")
@@ -156,15 +238,21 @@ class SimpleCalendarGUI(QMainWindow):
         status_layout = QVBoxLayout()
         status_layout.addWidget(QLabel("📊 Status:"))
         
-        self.status_text = QTextEdit()
+        self.status_text = QPlainTextEdit()
         self.status_text.setReadOnly(True)
         self.status_text.setMaximumHeight(120)
         self.status_text.setFont(QFont("Monaco", 10))
         status_layout.addWidget(self.status_text)
+        # Meldungen gebündelt anzeigen, vollständig ins Protokoll
+        self.status_log = StatusLog(self.status_text, open_log_file())
         
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setVisible(False)
-        status_layout.addWidget(self.progress_bar)
+        # Sync und manueller Tab können gleichzeitig laufen - je ein Balken
+        self.sync_progress_bar = QProgressBar()
+        self.sync_progress_bar.setVisible(False)
+        status_layout.addWidget(self.sync_progress_bar)
+        self.manual_progress_bar = QProgressBar()
+        self.manual_progress_bar.setVisible(False)
+        status_layout.addWidget(self.manual_progress_bar)
         
         layout.addLayout(status_layout)
         
@@ -208,8 +296,37 @@ class SimpleCalendarGUI(QMainWindow):
         self.mode_all.toggled.connect(lambda checked: self.mode_future.setChecked(not checked) if checked else None)
         self.mode_future.toggled.connect(lambda checked: self.mode_all.setChecked(not checked) if checked else None)
         
+        # Horizonte des Sync-Zeitraums
+        self.past_days_spin = QSpinBox()
+        self.past_days_spin.setRange(0, 3650)
+        self.past_days_spin.setValue(DEFAULT_PAST_DAYS)
+        self.past_days_spin.setSuffix(' Tage')
+        mode_layout.addWidget(QLabel('⏪ Zurück:'))
+        mode_layout.addWidget(self.past_days_spin)
+        
+        self.future_days_spin = QSpinBox()
+        self.future_days_spin.setRange(1, 3650)
+        self.future_days_spin.setValue(DEFAULT_FUTURE_DAYS)
+        self.future_days_spin.setSuffix(' Tage')
+        mode_layout.addWidget(QLabel('⏩ Voraus:'))
+        mode_layout.addWidget(self.future_days_spin)
+        mode_layout.addStretch()
+        
+        self.mode_all.toggled.connect(self.past_days_spin.setEnabled)
+        
         layout.addLayout(mode_layout)
         
+        self.full_scan_check = QCheckBox('🔎 Vollständiger Abgleich (nicht nur seit dem letzten Sync)')
+        self.full_scan_check.setToolTip('Ohne diese Option wird die Vergangenheit nur ab dem letzten '
+                                        'erfolgreichen Sync (minus einem Tag) geprüft.')
+        layout.addWidget(self.full_scan_check)
+        
+        self.delete_removed_check = QCheckBox('🗑️ In der Quelle gelöschte Events auch im Ziel löschen')
+        self.delete_removed_check.setChecked(True)
+        self.delete_removed_check.setToolTip('Nur Events, die zuvor synchronisiert wurden. '
+                                             'Fehlt mehr als die Hälfte, wird nichts gelöscht.')
+        layout.addWidget(self.delete_removed_check)
+        
         # Buttons
         button_layout = QHBoxLayout()
         
@@ -259,19 +376,30 @@ class SimpleCalendarGUI(QMainWindow):
         self.deselect_all_button = QPushButton('❌ Alle abwählen')
         self.deselect_all_button.clicked.connect(self.deselect_all_events)
         load_layout.addWidget(self.deselect_all_button)
+        
+        self.manual_cancel_button = QPushButton('⏹️ Abbrechen')
+        self.manual_cancel_button.clicked.connect(self.cancel_manual_operation)
+        self.manual_cancel_button.setEnabled(False)
+        load_layout.addWidget(self.manual_cancel_button)
         layout.addLayout(load_layout)
         
-        # Event-Tabelle
-        self.events_table = QTableWidget()
-        self.events_table.setColumnCount(5)
-        self.events_table.setHorizontalHeaderLabels(['✓', 'Titel', 'Datum', 'Beschreibung', 'Status'])
+        # Event-Tabelle (Modell/View: gezeichnet werden nur sichtbare Zeilen)
+        self.events_model = EventTableModel(self)
+        self.events_table = QTableView()
+        self.events_table.setModel(self.events_model)
         
+        # Feste Breiten/Höhen statt ResizeToContents - das würde alle Zeilen vermessen
         header = self.events_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(COLUMN_CHECK, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(COLUMN_TITLE, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(COLUMN_DATE, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(COLUMN_DESCRIPTION, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(COLUMN_STATUS, QHeaderView.ResizeMode.Fixed)
+        self.events_table.setColumnWidth(COLUMN_CHECK, 30)
+        self.events_table.setColumnWidth(COLUMN_DATE, 130)
+        self.events_table.setColumnWidth(COLUMN_STATUS, 110)
+        self.events_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.events_table.verticalHeader().setVisible(False)
         
         layout.addWidget(self.events_table)
         
@@ -283,33 +411,18 @@ class SimpleCalendarGUI(QMainWindow):
 
     def refresh_calendars_initial(self):
         """Lädt Kalender beim Start ohne UI-Manipulation"""
-        if self.current_worker and self.current_worker.isRunning():
-            return
-            
         self.log_status("📋 Lade Kalender...")
-        
-        self.current_worker = SimpleBackgroundWorker(self.calendar_client.list_calendars)
-        self.current_worker.result.connect(self._on_calendars_loaded)
-        self.current_worker.error.connect(self.log_error)
-        self.current_worker.finished.connect(lambda: None)  # Keine Button-Updates beim Start
-        self.current_worker.start()
+        self.future_relay.watch(self.store.calendars(), self._on_calendars_loaded, self.log_error)
 
     def refresh_calendars_threaded(self):
         """Lädt Kalender im Hintergrund (für Button-Klick)"""
-        if self.current_worker and self.current_worker.isRunning():
-            return
-            
         self.refresh_button.setEnabled(False)
         self.log_status("📋 Lade Kalender...")
-        
-        self.current_worker = SimpleBackgroundWorker(self.calendar_client.list_calendars)
-        self.current_worker.result.connect(self._on_calendars_loaded)
-        self.current_worker.error.connect(self.log_error)
-        self.current_worker.finished.connect(lambda: self.refresh_button.setEnabled(True))
-        self.current_worker.start()
+        self.future_relay.watch(self.store.calendars(refresh=True), self._on_calendars_loaded, self.log_error)
 
     def _on_calendars_loaded(self, calendars):
         """Verarbeitet geladene Kalender"""
+        self.refresh_button.setEnabled(True)
         try:
             # Aktualisiere alle Dropdowns
             for combo in [self.source_combo, self.target_combo, 
@@ -347,32 +460,47 @@ class SimpleCalendarGUI(QMainWindow):
         
         self.is_syncing = True
         self.sync_button.setText('⏹️ Stoppen')
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)
-        
-        self.sync_worker = SimpleSyncWorker(self.calendar_client, source, target, sync_mode)
+        self.sync_progress_bar.setVisible(True)
+        self.sync_progress_bar.setRange(0, 0)
+        
+        self.sync_worker = SimpleSyncWorker(self.store, source, target, sync_mode,
+                                            delete_removed=self.delete_removed_check.isChecked(),
+                                            past_days=self.past_days_spin.value(),
+                                            future_days=self.future_days_spin.value(),
+                                            full_scan=self.full_scan_check.isChecked(),
+                                            progress=self._progress_reporter(self.sync_progress_bar))
         self.sync_worker.progress.connect(self.log_status)
         self.sync_worker.sync_complete.connect(self._on_sync_complete)
         self.sync_worker.error.connect(self.log_error)
+        self.sync_worker.finished.connect(self._on_sync_finished)
         self.sync_worker.start()
         
         self.log_status(f"🚀 Sync gestartet: {source} → {target}")
 
     def stop_sync(self):
-        """Stoppt die Synchronisation"""
-        if self.sync_worker:
-            self.sync_worker.stop()
-            self.sync_worker = None
+        """Stoppt die Synchronisation nach dem laufenden Block (ohne die GUI zu blockieren)"""
+        if not self.sync_worker or self.sync_worker.cancel.cancelled:
+            return
         
-        self.is_syncing = False
-        self.sync_button.setText('🚀 Synchronisation starten')
-        self.progress_bar.setVisible(False)
-        self.log_status("⏹️ Synchronisation gestoppt")
+        self.sync_worker.stop()
+        self.sync_button.setText('⏳ Wird gestoppt...')
+        self.sync_button.setEnabled(False)
+        self.log_status("⏹️ Synchronisation wird nach dem laufenden Block gestoppt...")
 
     def _on_sync_complete(self, count):
         """Verarbeitet Sync-Abschluss"""
-        self.stop_sync()
-        self.log_status(f"✅ Synchronisation abgeschlossen: {count} Ereignisse übertragen")
+        if self.sync_worker and self.sync_worker.cancel.cancelled:
+            self.log_status(f"⏹️ Synchronisation gestoppt: {count} Ereignisse bis dahin übertragen")
+        else:
+            self.log_status(f"✅ Synchronisation abgeschlossen: {count} Ereignisse übertragen")
+
+    def _on_sync_finished(self):
+        """Setzt die Sync-Bedienung zurück, sobald der Worker beendet ist"""
+        self.sync_worker = None
+        self.is_syncing = False
+        self.sync_button.setText('🚀 Synchronisation starten')
+        self.sync_button.setEnabled(True)
+        self.sync_progress_bar.setVisible(False)
 
     def load_events_threaded(self):
         """Lädt Events für manuelle Auswahl"""
@@ -381,79 +509,91 @@ class SimpleCalendarGUI(QMainWindow):
             self.log_error("❌ Bitte Quellkalender auswählen")
             return
         
-        if self.current_worker and self.current_worker.isRunning():
+        if self.manual_task is not None:
             return
         
         self.load_events_button.setEnabled(False)
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)
+        self.manual_progress_bar.setVisible(True)
+        self.manual_progress_bar.setRange(0, 0)
+        
+        self.sync_selected_button.setEnabled(False)
+        self.check_duplicates_button.setEnabled(False)
         
-        self.current_worker = SimpleBackgroundWorker(
-            self.calendar_client.get_events, source, SyncMode.FUTURE
+        # Tabelle leeren; die Blöcke werden eingefügt, sobald sie geladen sind
+        self._pending_chunks.clear()
+        self._stream_done = False
+        self.events_model.set_events([])
+        self.loaded_events = self.events_model.events
+        
+        self._load_progress = self._progress_reporter(self.manual_progress_bar)
+        self._load_progress.start("Events laden")
+        self.load_worker = StreamingWorker(
+            self.store, self.calendar_client.iter_events, source, SyncMode.FUTURE, LIST_FIELDS,
+            progress=self._load_progress
         )
-        self.current_worker.result.connect(self._on_events_loaded)
-        self.current_worker.error.connect(self.log_error)
-        self.current_worker.finished.connect(lambda: [
-            self.load_events_button.setEnabled(True),
-            self.progress_bar.setVisible(False)
-        ])
-        self.current_worker.start()
-
-    def _on_events_loaded(self, events):
-        """Verarbeitet geladene Events"""
-        self.loaded_events = events or []
+        self.manual_task = self.load_worker
+        self._manual_cancel = self.load_worker.cancel
+        self.manual_cancel_button.setEnabled(True)
+        self.load_worker.chunk.connect(self._on_events_chunk)
+        self.load_worker.error.connect(self.log_error)
+        self.load_worker.finished.connect(self._on_events_stream_finished)
+        self.load_worker.start()
+
+    def _on_events_chunk(self, events):
+        """Nimmt einen geladenen Block entgegen - eingefügt wird im Frame-Takt"""
+        self._pending_chunks.append(events)
+        if not self._append_timer.isActive():
+            self._append_timer.start()
+
+    def _on_events_stream_finished(self):
+        self._load_progress.finish(not self.load_worker.cancel.cancelled)
+        self._stream_done = True
+        if not self._append_timer.isActive():
+            self._append_pending_events()
+
+    def _append_pending_events(self):
+        """Fügt wartende Blöcke ein, bis das Zeitbudget dieses Frames verbraucht ist"""
+        deadline = time.perf_counter() + FRAME_BUDGET_MS / 1000
+        while self._pending_chunks and time.perf_counter() < deadline:
+            self.events_model.append_events(self._pending_chunks.popleft())
+        
+        if self._pending_chunks:
+            return
+        self._append_timer.stop()
+        if self._stream_done:
+            self._on_events_loaded()
+
+    def _on_events_loaded(self):
+        """Verarbeitet die vollständig geladenen Events"""
+        self.manual_task = None
+        self.load_worker = None
+        self.load_events_button.setEnabled(True)
+        self.manual_progress_bar.setVisible(False)
+        self.manual_cancel_button.setEnabled(False)
+        cancelled = self._manual_cancel is not None and self._manual_cancel.cancelled
+        self._manual_cancel = None
+        
+        if cancelled:
+            self.log_status(f"⏹️ Laden abgebrochen - {len(self.loaded_events)} Events bis dahin geladen")
         
         if not self.loaded_events:
             self.log_status("ℹ️ Keine zukünftigen Events gefunden")
-            self.events_table.setRowCount(0)
             self.sync_selected_button.setEnabled(False)
             self.check_duplicates_button.setEnabled(False)
             return
         
-        # Fülle Tabelle
-        self.events_table.setRowCount(len(self.loaded_events))
-        
-        for row, event in enumerate(self.loaded_events):
-            # Checkbox
-            checkbox = QCheckBox()
-            checkbox.setChecked(True)
-            self.events_table.setCellWidget(row, 0, checkbox)
-            
-            # Titel
-            title = event.get('summary', 'Kein Titel')
-            self.events_table.setItem(row, 1, QTableWidgetItem(title))
-            
-            # Datum
-            start_date = event.get('start_date')
-            date_str = start_date.strftime('%d.%m.%Y %H:%M') if start_date else 'Unbekannt'
-            self.events_table.setItem(row, 2, QTableWidgetItem(date_str))
-            
-            # Beschreibung
-            desc = event.get('description', '')[:50] + ('...' if len(event.get('description', '')) > 50 else '')
-            self.events_table.setItem(row, 3, QTableWidgetItem(desc))
-            
-            # Status - initial leer
-            status_item = QTableWidgetItem("❓ Ungeprüft")
-            status_item.setBackground(Qt.GlobalColor.lightGray)
-            self.events_table.setItem(row, 4, status_item)
-        
         self.sync_selected_button.setEnabled(True)
         self.check_duplicates_button.setEnabled(True)
-        self.log_status(f"📋 {len(self.loaded_events)} Events geladen")
+        if not cancelled:
+            self.log_status(f"📋 {len(self.loaded_events)} Events geladen")
 
     @pyqtSlot()
     def select_all_events(self):
-        for row in range(self.events_table.rowCount()):
-            checkbox = self.events_table.cellWidget(row, 0)
-            if checkbox:
-                checkbox.setChecked(True)
+        self.events_model.set_all_checked(True)
 
     @pyqtSlot()
     def deselect_all_events(self):
-        for row in range(self.events_table.rowCount()):
-            checkbox = self.events_table.cellWidget(row, 0)
-            if checkbox:
-                checkbox.setChecked(False)
+        self.events_model.set_all_checked(False)
 
     def sync_selected_events(self):
         """Synchronisiert ausgewählte Events"""
@@ -463,30 +603,52 @@ class SimpleCalendarGUI(QMainWindow):
             return
         
         # Sammle ausgewählte Events
-        selected_events = []
-        for row in range(self.events_table.rowCount()):
-            checkbox = self.events_table.cellWidget(row, 0)
-            if checkbox and checkbox.isChecked() and row < len(self.loaded_events):
-                selected_events.append(self.loaded_events[row])
+        selected_events = self.events_model.checked_events()
         
         if not selected_events:
             self.log_error("❌ Keine Events ausgewählt")
             return
         
+        self._start_manual_sync(target, selected_events)
+
+    def _start_manual_sync(self, target, selected_events):
+        """Erstellt die ausgewählten Events im Hintergrund (abbrechbar zwischen zwei Batches)"""
+        if self.manual_task is not None:
+            return
+        
         self.sync_selected_button.setEnabled(False)
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, len(selected_events))
+        self.manual_progress_bar.setVisible(True)
+        self.manual_progress_bar.setRange(0, len(selected_events))
         
-        self.current_worker = SimpleBackgroundWorker(
-            self.calendar_client.create_events_simple, target, selected_events
+        cancel = CancellationToken()
+        self._manual_cancel = cancel
+        self.manual_cancel_button.setEnabled(True)
+        
+        self.manual_task = self.store.submit(
+            self.calendar_client.create_events_simple, target, selected_events, cancel=cancel,
+            progress=self._progress_reporter(self.manual_progress_bar)
         )
-        self.current_worker.result.connect(lambda result: [
-            self.sync_selected_button.setEnabled(True),
-            self.progress_bar.setVisible(False),
-            self.log_status(f"✅ Manuelle Sync: {result[0]}/{len(selected_events)} Events erfolgreich")
-        ])
-        self.current_worker.error.connect(self.log_error)
-        self.current_worker.start()
+        self.future_relay.watch(self.manual_task, lambda result: self._on_manual_sync_finished(
+            f"⏹️ Manuelle Sync abgebrochen: {result[0]}/{len(selected_events)} Events erstellt"
+            if cancel.cancelled else
+            f"✅ Manuelle Sync: {result[0]}/{len(selected_events)} Events erfolgreich"
+        ), lambda error: self._on_manual_sync_finished(f"❌ FEHLER: {error}"))
+
+    def _on_manual_sync_finished(self, message):
+        self.log_status(message)
+        self.manual_task = None
+        self._manual_cancel = None
+        self.manual_cancel_button.setEnabled(False)
+        self.sync_selected_button.setEnabled(True)
+        self.manual_progress_bar.setVisible(False)
+
+    @pyqtSlot()
+    def cancel_manual_operation(self):
+        """Bricht Laden bzw. Erstellen im manuellen Tab nach dem laufenden Block ab"""
+        if self._manual_cancel is not None and not self._manual_cancel.cancelled:
+            self._manual_cancel.cancel()
+            self.manual_cancel_button.setEnabled(False)
+            self.log_status("⏹️ Wird nach dem laufenden Block abgebrochen...")
 
     def check_duplicates_threaded(self):
         """Prüft Events auf Duplikate im Zielkalender"""
@@ -499,63 +661,42 @@ class SimpleCalendarGUI(QMainWindow):
             self.log_error("❌ Keine Events geladen")
             return
         
-        if self.current_worker and self.current_worker.isRunning():
+        if self.manual_task is not None:
             return
         
         self.check_duplicates_button.setEnabled(False)
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)
-        
-        self.current_worker = SimpleBackgroundWorker(
-            self._check_events_for_duplicates, target
+        self.manual_progress_bar.setVisible(True)
+        self.manual_progress_bar.setRange(0, 0)
+        
+        # Ziel-Events über den Executor - eine gleichzeitige Anfrage für denselben
+        # Kalender (z.B. ein zweites Prüfen) wird mit dieser zusammengelegt
+        self.manual_task = self.store.events(target, SyncMode.ALL, DEDUP_FIELDS)
+        self.future_relay.watch(self.manual_task, self._check_events_for_duplicates,
+                                self._on_duplicate_check_failed)
+
+    def _check_events_for_duplicates(self, target_events):
+        """Prüft die geladenen Events gegen die Ziel-Events (im Hintergrund)"""
+        self.manual_task = self.store.submit(
+            self.calendar_client.duplicate_flags, self.loaded_events, target_events, DuplicateCheckMode.MODERATE
         )
-        self.current_worker.result.connect(self._on_duplicates_checked)
-        self.current_worker.error.connect(self.log_error)
-        self.current_worker.finished.connect(lambda: [
-            self.check_duplicates_button.setEnabled(True),
-            self.progress_bar.setVisible(False)
-        ])
-        self.current_worker.start()
-
-    def _check_events_for_duplicates(self, target_calendar):
-        """Prüft Events auf Duplikate (läuft im Hintergrund)"""
-        try:
-            # Lade Ziel-Events
-            target_events = self.calendar_client.get_events(target_calendar, SyncMode.ALL)
-            
-            # Prüfe jedes Event auf Duplikate
-            duplicate_status = []
-            for event in self.loaded_events:
-                is_duplicate = False
-                for target_event in target_events:
-                    if self.calendar_client._is_duplicate_event(event, target_event, DuplicateCheckMode.MODERATE):
-                        is_duplicate = True
-                        break
-                duplicate_status.append(is_duplicate)
-            
-            return duplicate_status
-            
-        except Exception as e:
-            raise Exception(f"Fehler bei Duplikatsprüfung: {e}")
+        self.future_relay.watch(self.manual_task, self._on_duplicates_checked, self._on_duplicate_check_failed)
+
+    def _on_duplicate_check_failed(self, message):
+        self._on_duplicate_check_finished()
+        self.log_error(f"Fehler bei Duplikatsprüfung: {message}")
+
+    def _on_duplicate_check_finished(self):
+        self.manual_task = None
+        self.check_duplicates_button.setEnabled(True)
+        self.manual_progress_bar.setVisible(False)
 
     def _on_duplicates_checked(self, duplicate_status):
         """Verarbeitet Ergebnis der Duplikatsprüfung"""
+        self._on_duplicate_check_finished()
         try:
-            new_count = 0
-            duplicate_count = 0
-            
-            for row, is_duplicate in enumerate(duplicate_status):
-                if row < self.events_table.rowCount():
-                    if is_duplicate:
-                        status_item = QTableWidgetItem("⚠️ Duplikat")
-                        status_item.setBackground(Qt.GlobalColor.yellow)
-                        duplicate_count += 1
-                    else:
-                        status_item = QTableWidgetItem("✅ Neu")
-                        status_item.setBackground(Qt.GlobalColor.green)
-                        new_count += 1
-                    
-                    self.events_table.setItem(row, 4, status_item)
+            self.events_model.set_duplicate_flags(duplicate_status)
+            new_count = self.events_model.count_status(STATUS_NEW)
+            duplicate_count = self.events_model.count_status(STATUS_DUPLICATE)
             
             self.log_status(f"🔍 Duplikatsprüfung abgeschlossen: {new_count} neue Events, {duplicate_count} Duplikate")
             
@@ -573,16 +714,13 @@ class SimpleCalendarGUI(QMainWindow):
         selected_events = []
         selected_duplicates = []
         
-        for row in range(self.events_table.rowCount()):
-            checkbox = self.events_table.cellWidget(row, 0)
-            if checkbox and checkbox.isChecked() and row < len(self.loaded_events):
-                event = self.loaded_events[row]
-                selected_events.append(event)
-                
-                # Prüfe Status
-                status_item = self.events_table.item(row, 4)
-                if status_item and "Duplikat" in status_item.text():
-                    selected_duplicates.append(event)
+        for row in self.events_model.checked_rows():
+            event = self.loaded_events[row]
+            selected_events.append(event)
+            
+            # Prüfe Status
+            if self.events_model.status(row) == STATUS_DUPLICATE:
+                selected_duplicates.append(event)
         
         if not selected_events:
             self.log_error("❌ Keine Events ausgewählt")
@@ -607,31 +745,40 @@ class SimpleCalendarGUI(QMainWindow):
                 return
         
         # Führe normale Synchronisation durch
-        self.sync_selected_button.setEnabled(False)
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, len(selected_events))
-        
-        self.current_worker = SimpleBackgroundWorker(
-            self.calendar_client.create_events_simple, target, selected_events
-        )
-        self.current_worker.result.connect(lambda result: [
-            self.sync_selected_button.setEnabled(True),
-            self.progress_bar.setVisible(False),
-            self.log_status(f"✅ Manuelle Sync: {result[0]}/{len(selected_events)} Events erfolgreich")
-        ])
-        self.current_worker.error.connect(self.log_error)
-        self.current_worker.start()
+        self._start_manual_sync(target, selected_events)
 
     def log_status(self, message):
         """Fügt Status-Nachricht hinzu"""
-        self.status_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
-        scrollbar = self.status_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        self.status_log.append(message)
+
+    def _progress_reporter(self, bar: QProgressBar) -> ProgressReporter:
+        """Reporter für einen Worker - Meldungen landen threadsicher in seinem Fortschrittsbalken"""
+        return ProgressReporter(lambda update: self.progress_relay.update.emit(bar, update))
+
+    def _on_progress(self, bar, update):
+        """Zeigt Phase, Stand, Durchsatz und Restzeit im Fortschrittsbalken des Vorgangs"""
+        show_on_progress_bar(bar, update)
+        if update.finished:
+            # Durchsatz jeder Phase im Log - Regressionen fallen so direkt auf
+            self.log_status(f"⏱️ {update.describe()}")
 
     def log_error(self, message):
         """Fügt Fehler-Nachricht hinzu"""
         self.log_status(f"❌ FEHLER: {message}")
 
+    def closeEvent(self, event):
+        """Bricht laufende Vorgänge ab und wartet nur noch auf deren laufenden Block"""
+        if self.sync_worker:
+            self.sync_worker.stop()
+        if self._manual_cancel is not None:
+            self._manual_cancel.cancel()
+        self.cleanup_tab.wait_for_workers()
+        # Wartende Aufträge verwerfen, laufende bis zum Blockende abwarten
+        self.store.shutdown(wait=True)
+        self.status_log.flush()
+        self.cleanup_tab.status_log.flush()
+        super().closeEvent(event)
+
 def main():
     app = QApplication(sys.argv)
     
@@ -0,0 +1,252 @@
+"""
+Snapshot-Cache für geladene Kalender-Zeiträume
+
+In einer GUI-Sitzung werden dieselben Kalender mehrfach geladen: Liste
+im manuellen Tab, Zielkalender für die Duplikatprüfung, beide Kalender
+im Sync, der Bereinigungs-Tab nach jedem Löschen. Der SnapshotCache hält
+die zuletzt geladenen Zeiträume pro Kalender und beantwortet jede
+Anfrage, deren Zeitraum in einem Snapshot liegt, ohne EventKit.
+
+- Snapshots werden auf ganze Tage erweitert geladen, damit Zeiträume
+  wie "jetzt ± 365 Tage" über die Sitzung hinweg wiedertreffen
+- LRU mit Obergrenze für Snapshots und Events insgesamt, dazu eine TTL
+- Jeder Snapshot trägt den change_token des Backends beim Laden; ändert
+  sich der Speicher (EKEventStoreChangedNotification), ist er ungültig
+- Eigene Schreibvorgänge werden durchgeschrieben (write_through): der
+  Snapshot wird angepasst und auf den neuen change_token gehoben - aber
+  nur, wenn sich der Speicher seit dem Laden sonst nicht geändert hat
+- Datensätze werden vor dem Aufnehmen in einem Durchgang vollständig
+  geladen: geteilt zwischen Threads ändern sie sich nicht mehr und
+  halten keine EKEvent-Referenz
+
+EventKit meldet auch eigene Commits (verzögert) per Notification; solche
+Meldungen verwerfen den Cache wie fremde Änderungen - im Zweifel wird
+neu geladen.
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+try:
+    from src.event_record import CalendarEvent, complete_events, event_timestamp
+except ImportError:
+    from event_record import CalendarEvent, complete_events, event_timestamp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SNAPSHOTS = 8
+DEFAULT_MAX_EVENTS = 250_000
+DEFAULT_TTL = 300.0
+# Gemerkte eigene Schreibvorgänge (für Snapshots, die währenddessen geladen wurden)
+_MAX_TRANSITIONS = 64
+
+
+def aligned_range(lower: float, upper: float) -> Tuple[float, float]:
+    """Erweitert einen Zeitraum auf ganze (lokale) Tage"""
+    start = datetime.fromtimestamp(lower).replace(hour=0, minute=0, second=0, microsecond=0)
+    end = datetime.fromtimestamp(upper).replace(hour=0, minute=0, second=0, microsecond=0)
+    if end.timestamp() < upper:
+        end += timedelta(days=1)
+    return start.timestamp(), end.timestamp()
+
+
+def record_from_data(event_id: str, calendar_name: str, event_data: Dict[str, Any]) -> CalendarEvent:
+    """CalendarEvent für ein soeben geschriebenes Event (ohne Wiederholung)"""
+    start_ts = event_timestamp(event_data, 'start_ts', 'start_date')
+    return CalendarEvent(
+        id=event_id,
+        title=event_data.get('title') or event_data.get('summary') or '',
+        start_ts=start_ts,
+        end_ts=event_timestamp(event_data, 'end_ts', 'end_date', start_ts),
+        location=event_data.get('location') or '',
+        description=event_data.get('description') or '',
+        all_day=bool(event_data.get('all_day') or event_data.get('allday_event')),
+        calendar=calendar_name
+    )
+
+
+def overlaps(event: CalendarEvent, lower: float, upper: float) -> bool:
+    """Wie die Backend-Abfragen: start < upper und (end > lower oder start >= lower)"""
+    return event.start_ts < upper and (event.start_ts >= lower or event.end_ts > lower)
+
+
+class _Snapshot:
+    """Alle Events eines Kalenders in [lower, upper), nach Start sortiert"""
+
+    __slots__ = ('calendar', 'lower', 'upper', 'events', 'starts', 'token', 'loaded_at')
+
+    def __init__(self, calendar: str, lower: float, upper: float, events: List[CalendarEvent], token: int):
+        self.calendar = calendar
+        self.lower = lower
+        self.upper = upper
+        self.events = sorted(events, key=lambda event: event.start_ts)
+        self.starts = [event.start_ts for event in self.events]
+        self.token = token
+        self.loaded_at = time.monotonic()
+
+    def covers(self, lower: float, upper: float) -> bool:
+        return self.lower <= lower and upper <= self.upper
+
+    def insert(self, record: CalendarEvent):
+        """Fügt einen Datensatz sortiert ein"""
+        position = bisect_right(self.starts, record.start_ts)
+        self.starts.insert(position, record.start_ts)
+        self.events.insert(position, record)
+
+    def discard(self, removed_all: set, removed_starts: set):
+        """Entfernt Datensätze per Identifier bzw. (Identifier, Start)"""
+        self.events = [
+            event for event in self.events
+            if event.id not in removed_all and (event.id, int(event.start_ts)) not in removed_starts
+        ]
+        self.starts = [event.start_ts for event in self.events]
+
+
+class SnapshotCache:
+    """
+    LRU-Cache geladener Zeiträume pro Kalender
+
+    Wird von GUI und Sync-Worker gleichzeitig genutzt und ist daher mit
+    einem Lock geschützt. Gelieferte Listen sind Kopien; die Datensätze
+    selbst werden geteilt und dürfen nicht verändert werden.
+    """
+
+    def __init__(self, max_snapshots: int = DEFAULT_MAX_SNAPSHOTS, max_events: int = DEFAULT_MAX_EVENTS,
+                 ttl: float = DEFAULT_TTL):
+        """
+        Args:
+            max_snapshots: Höchstzahl gehaltener Snapshots
+            max_events: Höchstzahl gehaltener Events über alle Snapshots
+            ttl: Lebensdauer eines Snapshots in Sekunden
+        """
+        self.max_snapshots = max(1, max_snapshots)
+        self.max_events = max_events
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._snapshots = OrderedDict()
+        # change_token vor einem eigenen Schreibvorgang → (danach, Kalender)
+        self._transitions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._snapshots)
+
+    def lookup(self, calendar_name: str, lower: float, upper: float, token: int) -> Optional[List[CalendarEvent]]:
+        """
+        Events aus einem Snapshot, der [lower, upper) abdeckt
+
+        Returns:
+            Überlappende Events nach Start sortiert oder None (kein gültiger Snapshot)
+        """
+        with self._lock:
+            self._expire(token)
+            for key, snapshot in reversed(self._snapshots.items()):
+                if snapshot.calendar == calendar_name and snapshot.covers(lower, upper):
+                    self._snapshots.move_to_end(key)
+                    self.hits += 1
+                    return [event for event in snapshot.events if overlaps(event, lower, upper)]
+            self.misses += 1
+            return None
+
+    def store(self, calendar_name: str, lower: float, upper: float, events: List[CalendarEvent], token: int):
+        """
+        Nimmt einen vollständig geladenen Zeitraum auf
+
+        Args:
+            token: change_token vor dem Laden - eigene Schreibvorgänge in
+                   andere Kalender während des Ladens heben ihn mit an
+        """
+        if len(events) > self.max_events:
+            return
+        # Ein Auftrag für den ganzen Zeitraum (über den Store-Executor: ein Umweg)
+        complete_events(events)
+        with self._lock:
+            while token in self._transitions:
+                token_after, written_calendar = self._transitions[token]
+                if written_calendar == calendar_name:
+                    # Eigene Änderung an diesem Kalender fehlt im Snapshot
+                    return
+                token = token_after
+            # Enthaltene (kleinere) Snapshots desselben Kalenders sind überflüssig
+            for key in [key for key, snapshot in self._snapshots.items()
+                        if snapshot.calendar == calendar_name and lower <= snapshot.lower and snapshot.upper <= upper]:
+                del self._snapshots[key]
+            self._snapshots[(calendar_name, lower, upper)] = _Snapshot(calendar_name, lower, upper, events, token)
+            self._evict()
+
+    def invalidate(self, calendar_name: Optional[str] = None):
+        """Verwirft die Snapshots eines Kalenders (ohne Namen: alle)"""
+        with self._lock:
+            if calendar_name is None:
+                self._snapshots.clear()
+                return
+            for key in [key for key, snapshot in self._snapshots.items() if snapshot.calendar == calendar_name]:
+                del self._snapshots[key]
+
+    def write_through(self, calendar_name: str, token_before: int, token_after: int,
+                      added: Iterable[CalendarEvent] = (), removed: Iterable[Tuple[str, Optional[float]]] = (),
+                      updated: Iterable[CalendarEvent] = (), reset: bool = False):
+        """
+        Überträgt eigene Änderungen in die Snapshots
+
+        Snapshots mit token_before bleiben gültig und erhalten token_after,
+        alle anderen sind veraltet und werden verworfen.
+
+        Args:
+            added: Neu angelegte Datensätze
+            removed: (Identifier, Start) entfernter Events - Start None entfernt alle
+                     Datensätze mit dem Identifier (z.B. ganze Serien)
+            updated: Überschriebene Datensätze (ersetzen gleiche Identifier)
+            reset: Änderung nicht abbildbar - Snapshots des Kalenders verwerfen
+        """
+        updated = list(updated)
+        added = list(added) + updated
+        removed_all = {event_id for event_id, start_ts in removed if start_ts is None}
+        removed_starts = {(event_id, int(start_ts)) for event_id, start_ts in removed if start_ts is not None}
+        replaced = {record.id for record in updated}
+        removed_all |= replaced
+
+        with self._lock:
+            if token_after != token_before:
+                self._transitions[token_before] = (token_after, calendar_name)
+                while len(self._transitions) > _MAX_TRANSITIONS:
+                    self._transitions.popitem(last=False)
+
+            for key, snapshot in list(self._snapshots.items()):
+                if snapshot.token != token_before:
+                    del self._snapshots[key]
+                    continue
+                snapshot.token = token_after
+                if snapshot.calendar != calendar_name:
+                    continue
+                if reset or (replaced and any(event.id in replaced and event.recurrence
+                                              for event in snapshot.events)):
+                    # Überschriebene Serien lassen sich nicht Vorkommen für Vorkommen nachbilden
+                    del self._snapshots[key]
+                    continue
+                if removed_all or removed_starts:
+                    snapshot.discard(removed_all, removed_starts)
+                for record in added:
+                    if overlaps(record, snapshot.lower, snapshot.upper):
+                        snapshot.insert(record)
+            self._evict()
+
+    def _expire(self, token: int):
+        """Entfernt abgelaufene und durch Änderungen am Speicher veraltete Snapshots"""
+        now = time.monotonic()
+        for key in [key for key, snapshot in self._snapshots.items()
+                    if snapshot.token != token or now - snapshot.loaded_at > self.ttl]:
+            del self._snapshots[key]
+
+    def _evict(self):
+        """Hält die Obergrenzen ein (älteste zuerst)"""
+        total = sum(len(snapshot.events) for snapshot in self._snapshots.values())
+        while self._snapshots and (len(self._snapshots) > self.max_snapshots or total > self.max_events):
+            _, snapshot = self._snapshots.popitem(last=False)
+            total -= len(snapshot.events)
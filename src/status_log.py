@@ -0,0 +1,118 @@
+"""
+Gepufferte Status-Anzeige mit Log-Datei
+
+Statusmeldungen werden nicht einzeln in das Textfeld geschrieben, sondern
+gesammelt und höchstens alle FLUSH_INTERVAL_MS als ein Block angehängt.
+Das Textfeld (QPlainTextEdit) hält nur die letzten MAX_LINES Zeilen; das
+vollständige Protokoll geht in eine rotierende Log-Datei.
+"""
+
+import logging
+import os
+import sys
+from collections import deque
+from datetime import datetime
+from logging.handlers import MemoryHandler, RotatingFileHandler
+from typing import Optional
+
+from PyQt6.QtCore import QObject, QTimer
+from PyQt6.QtWidgets import QPlainTextEdit
+
+from sync_state import APP_DIRECTORY
+
+logger = logging.getLogger(__name__)
+
+MAX_LINES = 2000
+FLUSH_INTERVAL_MS = 100
+
+LOG_FILENAME = 'status.log'
+LOG_MAX_BYTES = 1_000_000
+LOG_BACKUPS = 3
+# Zeilen, die im Speicher auf den nächsten Flush warten dürfen
+LOG_BUFFER = 1000
+
+
+def default_log_path() -> str:
+    """Pfad der Log-Datei (macOS: ~/Library/Logs)"""
+    if sys.platform == 'darwin':
+        base = os.path.join(os.path.expanduser('~'), 'Library', 'Logs', APP_DIRECTORY)
+    else:
+        base = os.path.join(os.path.expanduser('~'), '.kalender_sync')
+    return os.path.join(base, LOG_FILENAME)
+
+
+def open_log_file(path: Optional[str] = None) -> Optional[logging.Logger]:
+    """
+    Logger für das Status-Protokoll (rotierende Datei)
+
+    Mehrfache Aufrufe liefern denselben Logger. Ohne schreibbares
+    Verzeichnis gibt es kein Protokoll - die Anzeige funktioniert trotzdem.
+    """
+    status_logger = logging.getLogger('kalender_sync.status')
+    if status_logger.handlers:
+        return status_logger
+    path = path or default_log_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        file_handler = RotatingFileHandler(path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS,
+                                           encoding='utf-8')
+    except OSError as e:
+        logger.warning(f"⚠️ Status-Protokoll nicht verfügbar: {e}")
+        return None
+    file_handler.setFormatter(logging.Formatter('%(message)s'))
+    # Zeilen sammeln und mit dem Flush der Anzeige schreiben (Fehler sofort)
+    buffer = MemoryHandler(LOG_BUFFER, flushLevel=logging.ERROR, target=file_handler)
+    status_logger.addHandler(buffer)
+    status_logger.setLevel(logging.INFO)
+    status_logger.propagate = False
+    return status_logger
+
+
+class StatusLog(QObject):
+    """Status-Anzeige mit begrenztem Zeilenpuffer, gebündelten Updates und Log-Datei"""
+
+    def __init__(self, view: QPlainTextEdit, log_file: Optional[logging.Logger] = None,
+                 max_lines: int = MAX_LINES, flush_interval_ms: int = FLUSH_INTERVAL_MS, parent=None):
+        super().__init__(parent or view)
+        self.view = view
+        self.view.setMaximumBlockCount(max_lines)
+        self.log_file = log_file
+        # Mehr als max_lines wartende Zeilen würden ohnehin sofort verdrängt
+        self._pending = deque(maxlen=max_lines)
+        self._dropped = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(flush_interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def append(self, message: str):
+        """Nimmt eine Meldung auf - angezeigt wird sie mit dem nächsten Flush"""
+        line = f"[{datetime.now().strftime('%H:%M:%S')}] {message}"
+        if len(self._pending) == self._pending.maxlen:
+            self._dropped += 1
+        self._pending.append(line)
+        if self.log_file is not None:
+            self.log_file.info(line)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        """Hängt alle wartenden Meldungen als einen Block an"""
+        self._timer.stop()
+        if self.log_file is not None:
+            for handler in self.log_file.handlers:
+                handler.flush()
+        if not self._pending:
+            return
+
+        lines = list(self._pending)
+        self._pending.clear()
+        if self._dropped:
+            lines.insert(0, f"… {self._dropped} weitere Meldungen nur im Protokoll")
+            self._dropped = 0
+
+        scrollbar = self.view.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 2
+        self.view.appendPlainText("\n".join(lines))
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
@@ -0,0 +1,196 @@
+"""
+Zentraler Zugang zum Kalenderspeicher
+
+Statt dass jeder Tab eigene Threads auf denselben EKEventStore loslässt,
+gehört der Speicher einem einzigen Store-Thread:
+
+- Der StoreExecutor ersetzt das Backend des Clients durch einen
+  Stellvertreter (OwnedBackend); jeder Backend-Aufruf - Lesen, Schreiben
+  und das Nachladen einzelner Felder - wird in die Warteschlange des
+  Store-Threads gestellt und dort nacheinander ausgeführt
+- Gleichzeitige identische Lesezugriffe werden zusammengelegt: Kalender-
+  liste bzw. Events für denselben Kalender, Zeitraum und dieselben Felder
+  werden einmal geladen, alle Anfragenden erhalten dasselbe Ergebnis
+- Die Logik der Aufträge (Sync, Laden im manuellen Tab, Duplikatsuche,
+  Bereinigung) läuft in einem kleinen Pool und liefert Futures an die
+  GUI; nur ihre Store-Zugriffe warten auf den Store-Thread
+
+Zusammengelegt wird nur, solange ein Lesezugriff läuft - danach
+beantwortet der Snapshot-Cache Wiederholungen.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Tuple
+
+try:
+    from src.calendar_backend import CalendarBackend
+    from src.event_record import ALL_FIELDS, CalendarEvent
+    from src.sync_engine import SyncMode
+except ImportError:
+    from calendar_backend import CalendarBackend
+    from event_record import ALL_FIELDS, CalendarEvent
+    from sync_engine import SyncMode
+
+logger = logging.getLogger(__name__)
+
+# Parallele Aufträge (z.B. Sync, Laden im manuellen Tab, Duplikatsuche)
+JOB_WORKERS = 4
+
+
+class StoreExecutor:
+    """Store-Thread mit Auftragswarteschlange vor dem Kalender-Client"""
+
+    def __init__(self, client, max_workers: int = JOB_WORKERS):
+        """
+        Args:
+            client: SimpleCalendarClient - sein Backend gehört ab jetzt dem Store-Thread
+            max_workers: Anzahl paralleler Aufträge
+        """
+        self.client = client
+        self.coalesced = 0
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._owner_ident = None
+        self._owner = ThreadPoolExecutor(max_workers=1, thread_name_prefix='store',
+                                         initializer=self._claim_thread)
+        self._jobs = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='store-job')
+        backend = client.backend
+        if isinstance(backend, OwnedBackend):
+            # Neuer Executor für denselben Client übernimmt das eigentliche Backend
+            backend = backend.backend
+        client.backend = OwnedBackend(backend, self)
+
+    def _claim_thread(self):
+        self._owner_ident = threading.get_ident()
+
+    def submit(self, func: Callable[..., Any], *args, **kwargs) -> Future:
+        """Führt einen Auftrag im Pool aus"""
+        return self._jobs.submit(func, *args, **kwargs)
+
+    def read(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Auftrag, zusammengelegt mit einem laufenden Auftrag gleichen Schlüssels
+
+        Das Ergebnis wird mit allen Anfragenden geteilt und darf nicht
+        verändert werden.
+        """
+        return self._coalesce(self._jobs, ('job', key), func, *args, **kwargs)
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Führt einen Store-Zugriff im Store-Thread aus und wartet auf das Ergebnis"""
+        if threading.get_ident() == self._owner_ident:
+            return func(*args, **kwargs)
+        return self._owner.submit(func, *args, **kwargs).result()
+
+    def call_read(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Wie call, gleichzeitige Lesezugriffe mit gleichem Schlüssel werden zusammengelegt"""
+        if threading.get_ident() == self._owner_ident:
+            return func(*args, **kwargs)
+        return self._coalesce(self._owner, ('store', key), func, *args, **kwargs).result()
+
+    def _coalesce(self, pool: ThreadPoolExecutor, key: Hashable, func: Callable[..., Any],
+                  *args, **kwargs) -> Future:
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                logger.debug(f"🔗 Lesezugriff zusammengelegt: {key}")
+                return future
+
+            def run():
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    with self._lock:
+                        self._inflight.pop(key, None)
+
+            future = pool.submit(run)
+            self._inflight[key] = future
+            return future
+
+    def calendars(self, refresh: bool = False) -> Future:
+        """Future mit der Kalenderliste"""
+        return self.read(('calendars', refresh), self.client.list_calendars, refresh=refresh)
+
+    def events(self, calendar_name: str, sync_mode: str = SyncMode.ALL, fields=ALL_FIELDS) -> Future:
+        """Future mit den Events eines Kalenders (wie SimpleCalendarClient.get_events)"""
+        key = ('events', calendar_name, sync_mode, frozenset(fields))
+        return self.read(key, self.client.get_events, calendar_name, sync_mode, fields)
+
+    def pending(self) -> List[Hashable]:
+        """Schlüssel der laufenden Lesezugriffe"""
+        with self._lock:
+            return list(self._inflight)
+
+    def shutdown(self, wait: bool = True):
+        """Nimmt keine Aufträge mehr an; wartende Aufträge werden verworfen"""
+        # Laufende Aufträge brauchen den Store-Thread bis zu ihrem Ende
+        self._jobs.shutdown(wait=wait, cancel_futures=True)
+        self._owner.shutdown(wait=wait)
+
+
+class OwnedBackend(CalendarBackend):
+    """
+    Stellvertreter eines Backends, dessen Aufrufe im Store-Thread laufen
+
+    Das Nachladen von Feldern geht ebenfalls über den Store-Thread: das
+    Backend trägt den Stellvertreter als field_loader in seine Datensätze
+    ein. Ganze Listen werden mit load_event_fields in einem Auftrag
+    vervollständigt (event_record.complete_events), nicht Feld für Feld. iter_events lädt fensterweise über get_events,
+    damit auch jedes Fenster zusammengelegt werden kann.
+    """
+
+    def __init__(self, backend: CalendarBackend, store: StoreExecutor):
+        self.backend = backend
+        self.store = store
+        self.batch_size = backend.batch_size
+        if hasattr(backend, 'field_loader'):
+            backend.field_loader = self
+
+    def is_available(self) -> bool:
+        return self.backend.is_available()
+
+    def change_token(self) -> int:
+        # Nur ein Zähler - ohne Umweg über den Store-Thread
+        return self.backend.change_token()
+
+    def refresh_calendars(self):
+        self.store.call(self.backend.refresh_calendars)
+
+    def list_calendars(self) -> List[str]:
+        return self.store.call_read(('calendars',), self.backend.list_calendars)
+
+    def get_events(self, calendar_name: str, start_date: datetime = None, end_date: datetime = None,
+                   fields=ALL_FIELDS) -> List[CalendarEvent]:
+        key = ('events', calendar_name, start_date, end_date, frozenset(fields))
+        return self.store.call_read(key, self.backend.get_events, calendar_name, start_date, end_date, fields)
+
+    def load_event_field(self, source: Any, field: str) -> Any:
+        return self.store.call(self.backend.load_event_field, source, field)
+
+    def load_event_fields(self, requests: List[Tuple[Any, FrozenSet[str]]]) -> List[Dict[str, Any]]:
+        return self.store.call(self.backend.load_event_fields, requests)
+
+    def save_events(self, calendar_name: str, events: List[Dict[str, Any]],
+                    batch_size: int = None) -> List[Dict[str, Any]]:
+        return self.store.call(self.backend.save_events, calendar_name, events, batch_size)
+
+    def update_events(self, calendar_name: str, updates: List[Tuple[str, Dict[str, Any]]],
+                      batch_size: int = None) -> List[Dict[str, Any]]:
+        return self.store.call(self.backend.update_events, calendar_name, updates, batch_size)
+
+    def delete_events(self, calendar_name: str, events: List[Dict[str, Any]],
+                      batch_size: int = None) -> List[Dict[str, Any]]:
+        return self.store.call(self.backend.delete_events, calendar_name, events, batch_size)
+
+    def remove_occurrences(self, calendar_name: str, occurrences: List[Tuple[str, float]],
+                           batch_size: int = None) -> List[Dict[str, Any]]:
+        return self.store.call(self.backend.remove_occurrences, calendar_name, occurrences, batch_size)
+
+    def create_event(self, calendar_name: str, title: str, start_date: datetime,
+                     end_date: datetime, description: str = "", location: str = "") -> bool:
+        return self.store.call(self.backend.create_event, calendar_name, title, start_date, end_date,
+                               description, location)
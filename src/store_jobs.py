@@ -0,0 +1,76 @@
+"""
+Qt-Anbindung des StoreExecutors
+
+- StoreJob: Hintergrundauftrag mit Signalen, der statt eines eigenen
+  QThread im Pool des StoreExecutors läuft (start/isRunning/wait wie QThread)
+- FutureRelay: liefert das Ergebnis eines Futures im GUI-Thread aus
+"""
+
+from abc import ABCMeta, abstractmethod
+from concurrent.futures import Future, wait
+from typing import Any, Callable, Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from store_executor import StoreExecutor
+
+
+class _JobMeta(type(QObject), ABCMeta):
+    """Metaklasse für QObject-Unterklassen mit abstrakten Methoden"""
+
+
+class StoreJob(QObject, metaclass=_JobMeta):
+    """
+    Auftrag auf dem StoreExecutor
+
+    Unterklassen implementieren run() und melden über eigene Signale;
+    Signale aus dem Pool-Thread kommen als Queued Connection im GUI-Thread an.
+    """
+    finished = pyqtSignal()
+
+    def __init__(self, store: StoreExecutor):
+        super().__init__()
+        self.store = store
+        self._future = None
+
+    def start(self):
+        self._future = self.store.submit(self._execute)
+
+    def _execute(self):
+        try:
+            self.run()
+        finally:
+            self.finished.emit()
+
+    @abstractmethod
+    def run(self):
+        """Eigentliche Arbeit - läuft im Pool des StoreExecutors"""
+
+    def isRunning(self) -> bool:
+        return self._future is not None and not self._future.done()
+
+    def wait(self):
+        if self._future is not None:
+            wait([self._future])
+
+
+class FutureRelay(QObject):
+    """Ruft on_result bzw. on_error im GUI-Thread auf, sobald ein Future fertig ist"""
+    _done = pyqtSignal(object, object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._done.connect(self._deliver)
+
+    def watch(self, future: Future, on_result: Callable[[Any], None],
+              on_error: Optional[Callable[[str], None]] = None):
+        future.add_done_callback(lambda done: self._done.emit(done, on_result, on_error))
+
+    def _deliver(self, future: Future, on_result, on_error):
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is None:
+            on_result(future.result())
+        elif on_error is not None:
+            on_error(str(error))
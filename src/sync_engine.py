@@ -0,0 +1,619 @@
+"""
+Sync-Ablauf Quelle → Ziel
+
+Ein SyncRun verarbeitet die Quell-Events blockweise:
+
+1. Unveränderte Events (gleicher Schlüssel und Fingerprint im
+   Sync-Status) werden übersprungen
+2. Geänderte Events mit bekannter Zuordnung werden im Ziel direkt
+   aktualisiert - geschrieben wird nur, was sich geändert hat
+3. Alle übrigen Events laufen durch die Duplikatprüfung gegen den
+   Zielkalender und werden bei Bedarf neu angelegt
+4. Zuordnungen im Sync-Zeitraum, deren Quell-Event nicht mehr geliefert
+   wurde (Mengendifferenz), werden samt Ziel-Event gelöscht - außer es
+   wäre ein unplausibel großer Anteil
+
+Wiederkehrende Events werden als Serie übertragen: Das erste reguläre
+Vorkommen einer Serie steht für die ganze Serie (Schlüssel 'id@series'),
+im Ziel entsteht ein Event mit vollständiger Regel. Weitere Vorkommen
+kosten nur einen Set-Lookup. Abgelöste Ausnahmen werden einzeln kopiert
+und ihr ursprüngliches Vorkommen in der Ziel-Serie entfernt; Vorkommen,
+die laut Regel im geladenen Bereich liegen, aber nicht geliefert wurden
+(in der Quelle gelöscht), werden auch in der Ziel-Serie entfernt. Als
+vorhandene Ziel-Serie gilt nur eine Serie mit gleicher Regel - liegt im
+Ziel stattdessen ein einzelnes Event, wird die Serie in diesem Lauf
+Vorkommen für Vorkommen abgeglichen. Serien mit nicht abbildbarer Regel
+(oder fester Anzahl, die vor dem Zeitraum beginnen) werden ebenfalls
+Vorkommen für Vorkommen übertragen.
+
+Der Zeitraum ergibt sich aus dem Modus und den Horizonten des Jobs
+(past_days/future_days). Mit Sync-Status merkt sich ein Cursor, bis wann
+der Zeitraum abgeglichen ist; der nächste Lauf lädt erst ab dort (minus
+CURSOR_OVERLAP). Löschungen werden nur im geladenen Bereich erkannt -
+full_scan gleicht wieder den ganzen Zeitraum ab.
+
+Der Zielkalender wird erst geladen, wenn Schritt 3 ihn braucht - und
+nur für die Zeitspanne, die die zu prüfenden Events abdecken.
+
+Ein CancellationToken wird zwischen den Blöcken geprüft. Nach einem
+Abbruch bleiben die geschriebenen Blöcke samt Zuordnungen bestehen; der
+Löschabgleich und der Cursor entfallen, da nicht alle Quell-Events
+gesehen wurden.
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+try:
+    from src.calendar_backend import EVENT_NOT_FOUND
+    from src.cancellation import CancellationToken, OperationCancelled, cancellable, is_cancelled
+    from src.progress import ProgressReporter
+    from src.duplicate_engine import DuplicateIndex, in_series, series_check_fields
+    from src.event_record import (CalendarEvent, SYNC_FIELDS, event_fingerprint, event_timestamp,
+                                  series_fingerprint, series_key, sync_key)
+    from src.recurrence import parse_rule
+except ImportError:
+    from calendar_backend import EVENT_NOT_FOUND
+    from cancellation import CancellationToken, OperationCancelled, cancellable, is_cancelled
+    from progress import ProgressReporter
+    from duplicate_engine import DuplicateIndex, in_series, series_check_fields
+    from event_record import (CalendarEvent, SYNC_FIELDS, event_fingerprint, event_timestamp,
+                              series_fingerprint, series_key, sync_key)
+    from recurrence import parse_rule
+
+logger = logging.getLogger(__name__)
+
+# Sicherheitsgrenze für das Löschen: höchstens dieser Anteil der
+# Zuordnungen im Sync-Zeitraum, bis DELETE_FLOOR Events erlaubt - außer
+# es fehlen alle (z.B. Quelle umbenannt oder kein Zugriff mehr)
+MAX_DELETE_FRACTION = 0.5
+DELETE_FLOOR = 10
+
+# Standard-Horizonte des Sync-Zeitraums (Tage vor/nach heute)
+DEFAULT_PAST_DAYS = 365
+DEFAULT_FUTURE_DAYS = 365
+
+# Überlappung beim Fortsetzen ab dem Cursor (z.B. nachträglich geänderte Events von gestern)
+CURSOR_OVERLAP = timedelta(days=1)
+
+# Rand um die Spanne der zu prüfenden Events beim Laden des Zielkalenders
+# (LOOSE vergleicht Kalendertage)
+TARGET_MARGIN = 86400
+# Mindestgröße eines Nachlade-Schritts (wie die Fenster beim Laden der Quelle)
+TARGET_STEP = 30 * 86400
+
+
+class SyncMode:
+    ALL = "all"
+    FUTURE = "future"
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Teilt ein (auch unendliches) Iterable in Listen der Größe size"""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class SyncStats:
+    """Zähler eines Sync-Durchlaufs"""
+
+    __slots__ = ('source', 'occurrences', 'unchanged', 'created', 'updated', 'deleted', 'duplicates', 'errors',
+                 'target', 'deletion_aborted', 'cancelled')
+
+    def __init__(self):
+        self.source = 0
+        # Vorkommen, die eine bereits behandelte Serie abdeckt
+        self.occurrences = 0
+        self.unchanged = 0
+        self.created = 0
+        self.updated = 0
+        self.deleted = 0
+        self.duplicates = 0
+        self.errors = 0
+        self.target = 0
+        self.deletion_aborted = False
+        self.cancelled = False
+
+    @property
+    def written(self) -> int:
+        """Erstellte plus aktualisierte Events"""
+        return self.created + self.updated
+
+
+class SyncRun:
+    """Ein Sync-Durchlauf zwischen zwei Kalendern"""
+
+    def __init__(self, client, source_calendar: str, target_calendar: str, sync_mode: str, check_mode: str,
+                 delete_removed: bool = True, max_delete_fraction: float = MAX_DELETE_FRACTION,
+                 past_days: int = DEFAULT_PAST_DAYS, future_days: int = DEFAULT_FUTURE_DAYS,
+                 full_scan: bool = False, cancel: Optional[CancellationToken] = None,
+                 progress: Optional[ProgressReporter] = None):
+        """
+        Args:
+            client: SimpleCalendarClient (sync_window, iter_events, save_events,
+                    update_events, delete_events, sync_state)
+            delete_removed: Im Quellkalender gelöschte Events auch im Ziel löschen
+            max_delete_fraction: Sicherheitsgrenze für das Löschen
+            past_days: Horizont in die Vergangenheit (nur SyncMode.ALL)
+            future_days: Horizont in die Zukunft
+            full_scan: Cursor ignorieren und den ganzen Zeitraum abgleichen
+            cancel: Abbruch zwischen zwei Blöcken
+            progress: Fortschritt der Phasen (Abgleich der Quelle, Löschabgleich)
+        """
+        self.client = client
+        self.source_calendar = source_calendar
+        self.target_calendar = target_calendar
+        self.sync_mode = sync_mode
+        self.check_mode = check_mode
+        self.delete_removed = delete_removed
+        self.max_delete_fraction = max_delete_fraction
+        self.past_days = past_days
+        self.future_days = future_days
+        self.full_scan = full_scan
+        self.cancel = cancel
+        self.progress = progress
+        self.state = client.sync_state
+        self.stats = SyncStats()
+        self.mappings = {}
+        self._seen = set()
+        self._lower = 0.0
+        # Serien-Schlüssel → Identifier der Ziel-Serie
+        self._series_targets = {}
+        # Serien-Schlüssel → Start des letzten gelieferten Vorkommens
+        self._series_last = {}
+        # Serien-Schlüssel → (Regel, Serienstart) bzw. ursprüngliche Starts der gelieferten Vorkommen
+        self._series_rules = {}
+        self._series_delivered = {}
+        # Serien, die in diesem Lauf Vorkommen für Vorkommen abgeglichen werden
+        self._per_occurrence = set()
+        # (Serien-Schlüssel, ursprünglicher Start) neu kopierter Ausnahmen
+        self._exceptions = []
+        self._occurrence_targets = None
+        self._target_index = None
+        # Identifier der Serien im Zielkalender → Regel
+        self._target_series = {}
+        # Bereits geladener Bereich des Zielkalenders (Epoch-Sekunden)
+        self._target_range = None
+
+    def run(self) -> SyncStats:
+        if self.state is not None:
+            self.mappings = self.state.load_mappings(self.source_calendar, self.target_calendar)
+            logger.info(f"📒 {len(self.mappings)} bekannte Zuordnungen")
+            self._series_targets = {
+                key: mapping.target_id for key, mapping in self.mappings.items() if key.endswith('@series')
+            }
+
+        # Zeitraum einmal festlegen - Laden und Löschabgleich nutzen denselben
+        started = time.time()
+        window = self.client.sync_window(self.sync_mode, self.past_days, self.future_days)
+        self._lower = window[0].timestamp()
+        cursor = self.state.load_cursor(self.source_calendar, self.target_calendar) \
+            if self.state is not None and not self.full_scan else None
+        date_range = self._scan_range(window, cursor)
+
+        if self.progress is not None:
+            self.progress.start("Quelle abgleichen")
+        source_events = self.client.iter_events(self.source_calendar, self.sync_mode, SYNC_FIELDS,
+                                                date_range=date_range, progress=self.progress)
+        try:
+            # Vor jedem weiteren Event (und damit jedem Ladefenster) wird das Token geprüft
+            for chunk in chunked(cancellable(source_events, self.cancel), self.client.batch_size):
+                self._process_chunk(chunk)
+        except OperationCancelled:
+            self.stats.cancelled = True
+            logger.info(f"⏹️ Sync nach {self.stats.source} Quell-Events abgebrochen")
+        if self.progress is not None:
+            self.progress.finish(not self.stats.cancelled)
+
+        # Geschriebene Ausnahmen und Serien gehören auch bei Abbruch zum Sync-Status
+        if self._exceptions:
+            self._remove_replaced_occurrences()
+        if self.delete_removed and not self.stats.cancelled:
+            self._remove_deleted_occurrences(date_range[0], date_range[1])
+        if self.state is not None:
+            self._store_series_positions()
+        if self.delete_removed and self.state is not None and not self.stats.cancelled:
+            self._propagate_deletions(date_range[0].timestamp(), date_range[1].timestamp())
+
+        if self.state is not None and not self.stats.errors and not self.stats.deletion_aborted \
+                and not self.stats.cancelled:
+            # Abgeglichen ist der Zeitraum bis zum Start dieses Laufs
+            reconciled_from = self._lower
+            if cursor is not None and date_range[0] > window[0]:
+                reconciled_from = min(cursor[0], self._lower)
+            self.state.save_cursor(self.source_calendar, self.target_calendar, reconciled_from,
+                                   min(started, window[1].timestamp()))
+
+        if self._target_index is not None:
+            self.stats.target = len(self._target_index)
+        return self.stats
+
+    def _scan_range(self, window: Tuple[datetime, datetime],
+                    cursor: Optional[Tuple[float, float]]) -> Tuple[datetime, datetime]:
+        """
+        Zu ladender Bereich: ab dem Cursor (minus Überlappung), sonst der ganze Zeitraum
+
+        Der Cursor gilt nur, wenn er den Beginn des Zeitraums abdeckt -
+        nach einer Vergrößerung des Horizonts wird wieder alles geladen.
+        """
+        if cursor is None:
+            return window
+        reconciled_from, reconciled_until = cursor
+        resume = datetime.fromtimestamp(reconciled_until) - CURSOR_OVERLAP
+        if reconciled_from > window[0].timestamp() or resume <= window[0] or resume >= window[1]:
+            return window
+        logger.info(f"⏩ Abgeglichen bis {datetime.fromtimestamp(reconciled_until):%d.%m.%Y %H:%M} - "
+                    f"lade ab {resume:%d.%m.%Y %H:%M}")
+        return resume, window[1]
+
+    def _process_chunk(self, chunk: List[Any]):
+        self.stats.source += len(chunk)
+        candidates = []
+        updates = []
+        state_rows = []
+
+        for event in chunk:
+            if self._writes_series(event):
+                key = series_key(event)
+                self._series_delivered.setdefault(key, set()).add(int(event.occurrence_ts))
+                if not event.detached and self._process_series(event, key, candidates, updates):
+                    continue
+
+            key = fingerprint = None
+            if self.state is not None:
+                key = sync_key(event)
+                fingerprint = event_fingerprint(event)
+                self._seen.add(key)
+                mapping = self.mappings.get(key)
+                if mapping is not None:
+                    if mapping.fingerprint == fingerprint:
+                        self.stats.unchanged += 1
+                    else:
+                        updates.append((mapping.target_id, event, key, fingerprint))
+                    continue
+            candidates.append((event, key, fingerprint))
+
+        if updates:
+            candidates.extend(self._apply_updates(updates, state_rows))
+        if candidates:
+            self._create_new(candidates, state_rows)
+
+        if state_rows and self.state is not None:
+            self.state.upsert_mappings(self.source_calendar, self.target_calendar, state_rows)
+
+    def _writes_series(self, event: Any) -> bool:
+        """Wird die Serie dieses Vorkommens als eine wiederkehrende Serie geschrieben?"""
+        if not isinstance(event, CalendarEvent) or not event.recurrence:
+            return False
+        rule = parse_rule(event.recurrence)
+        if rule is None or not rule.portable:
+            return False
+        if self._per_occurrence and series_key(event) in self._per_occurrence:
+            return False
+        # Mit fester Anzahl nur, wenn die Serie im Sync-Zeitraum beginnt
+        return rule.count is None or event.series_start_ts >= self._lower
+
+    def _process_series(self, event: CalendarEvent, key: str, candidates: List[Tuple],
+                        updates: List[Tuple]) -> bool:
+        """
+        Behandelt das erste reguläre Vorkommen einer Serie für die ganze Serie
+
+        Returns:
+            False, wenn die Serie stattdessen Vorkommen für Vorkommen
+            abgeglichen wird (das Vorkommen läuft dann normal weiter)
+        """
+        self._series_last[key] = event.start_ts
+        if key in self._seen:
+            self.stats.occurrences += 1
+            return True
+
+        fingerprint = series_fingerprint(event)
+        mapping = self.mappings.get(key)
+        if mapping is None:
+            if self._has_single_copy(event):
+                logger.info(f"🔂 '{event.title}' liegt im Ziel nicht als Serie vor - "
+                            f"Abgleich Vorkommen für Vorkommen")
+                self._per_occurrence.add(key)
+                del self._series_last[key]
+                del self._series_delivered[key]
+                return False
+            candidates.append((self._series_data(event), key, fingerprint))
+        elif mapping.fingerprint != fingerprint:
+            updates.append((mapping.target_id, self._series_data(event), key, fingerprint))
+        else:
+            self.stats.unchanged += 1
+
+        self._seen.add(key)
+        self._series_rules[key] = (event.recurrence, event.series_start_ts)
+        if mapping is not None:
+            self._series_targets[key] = mapping.target_id
+        return True
+
+    def _has_single_copy(self, event: CalendarEvent) -> bool:
+        """
+        Liegt am Vorkommen im Ziel ein Event, das keine Serie mit gleicher Regel ist?
+
+        Ausgenommen sind Einzelkopien früherer Syncs (mit Zuordnung) - sie
+        werden durch die Serie ersetzt.
+        """
+        start_ts = event.start_ts
+        match = self._target(start_ts - TARGET_MARGIN, start_ts + TARGET_MARGIN + 1).match(event)
+        if not match or self._target_series.get(match) == event.recurrence:
+            return False
+        return not self._is_replaced_copy(match)
+
+    def _series_data(self, event: CalendarEvent) -> Dict[str, Any]:
+        """
+        Event-Daten der Ziel-Serie
+
+        Die Serie beginnt wie im Quellkalender - liegt der Serienstart vor
+        dem Sync-Zeitraum, beim ersten Vorkommen im Zeitraum.
+        """
+        series_start = event.series_start_ts
+        start_ts = series_start if series_start >= self._lower else event.start_ts
+        end_ts = start_ts + event.end_ts - event.start_ts
+        return {
+            'id': event.id,
+            'title': event.title,
+            'start_date': datetime.fromtimestamp(start_ts),
+            'end_date': datetime.fromtimestamp(end_ts),
+            'location': event.location,
+            'description': event.description,
+            'all_day': event.all_day,
+            'recurrence': event.recurrence,
+            'recurrence_rule': event.recurrence,
+        }
+
+    def _store_series_positions(self):
+        """
+        Merkt sich pro Serie das letzte gelieferte Vorkommen (für den Löschabgleich)
+
+        Eine Serie wird so erwartet, solange sie in den geladenen Bereich
+        reicht - auch wenn der Cursor ihn auf die letzten Tage verkleinert.
+        """
+        positions = []
+        for key, start_ts in self._series_last.items():
+            mapping = self.mappings.get(key)
+            if mapping is None or mapping.source_start_ts != start_ts:
+                positions.append((key, start_ts))
+        self.state.update_positions(self.source_calendar, self.target_calendar, positions)
+
+    def _remove_deleted_occurrences(self, lower: datetime, upper: datetime):
+        """
+        Entfernt in den Ziel-Serien die Vorkommen, die in der Quelle gelöscht wurden
+
+        Erwartet werden die Starts der Regel im geladenen Bereich; fehlt
+        mehr als max_delete_fraction davon, bleibt die Serie unangetastet.
+        """
+        occurrences = []
+        for key, (recurrence, series_start_ts) in self._series_rules.items():
+            target_id = self._series_targets.get(key)
+            if not target_id:
+                continue
+            expected = [
+                start.timestamp() for start in
+                parse_rule(recurrence).between(datetime.fromtimestamp(series_start_ts), lower, upper)
+            ]
+            delivered = self._series_delivered[key]
+            missing = [start_ts for start_ts in expected if int(start_ts) not in delivered]
+            if not missing:
+                continue
+            if len(missing) > self.max_delete_fraction * len(expected):
+                self.stats.deletion_aborted = True
+                logger.warning(f"⚠️ {len(missing)} von {len(expected)} Vorkommen der Serie {key} fehlen - "
+                               f"Ziel-Serie bleibt unverändert")
+                continue
+            occurrences.extend((target_id, start_ts) for start_ts in missing)
+        if not occurrences:
+            return
+
+        results = self.client.remove_occurrences(self.target_calendar, occurrences)
+        removed = 0
+        for result in results:
+            if result['success']:
+                removed += 1
+            elif result['error'] != EVENT_NOT_FOUND:
+                self.stats.errors += 1
+                logger.warning(f"Vorkommen von {result['id']} nicht entfernt: {result['error']}")
+        if removed:
+            self.stats.deleted += removed
+            logger.info(f"🗑️ {removed} in der Quelle gelöschte Vorkommen aus Ziel-Serien entfernt")
+
+    def _is_exception(self, event: Any) -> bool:
+        """Abgelöste Ausnahme einer Serie, die als Serie geschrieben wird"""
+        return isinstance(event, CalendarEvent) and event.detached and self._writes_series(event)
+
+    def _remove_replaced_occurrences(self):
+        """Entfernt in den Ziel-Serien die Vorkommen, die neu kopierte Ausnahmen ersetzen"""
+        occurrences = [
+            (self._series_targets[key], start_ts) for key, start_ts in self._exceptions
+            if self._series_targets.get(key)
+        ]
+        if not occurrences:
+            return
+        results = self.client.remove_occurrences(self.target_calendar, occurrences)
+        for result in results:
+            if not result['success'] and result['error'] != EVENT_NOT_FOUND:
+                self.stats.errors += 1
+                logger.warning(f"Vorkommen von {result['id']} nicht entfernt: {result['error']}")
+
+    def _is_replaced_copy(self, target_id: str) -> bool:
+        """Ziel-Event ist die Einzelkopie eines Vorkommens (aus Syncs vor der Serien-Übertragung)"""
+        if self._occurrence_targets is None:
+            self._occurrence_targets = {
+                mapping.target_id for key, mapping in self.mappings.items()
+                if '@' in key and not key.endswith('@series')
+            }
+        return target_id in self._occurrence_targets
+
+    def _apply_updates(self, updates: List[Tuple[str, Any, str, bytes]],
+                       state_rows: List[Tuple]) -> List[Tuple[Any, str, bytes]]:
+        """
+        Überschreibt die zugeordneten Ziel-Events mit den geänderten Quell-Events
+
+        Returns:
+            Events, deren Ziel-Event nicht mehr existiert (werden neu angelegt)
+        """
+        results = self.client.update_events(
+            self.target_calendar, [(target_id, event) for target_id, event, _, _ in updates]
+        )
+        missing = []
+        for (target_id, event, key, fingerprint), result in zip(updates, results):
+            if result['success']:
+                self.stats.updated += 1
+                state_rows.append((key, target_id, fingerprint, event_timestamp(event, 'start_ts', 'start_date')))
+            elif result['error'] == EVENT_NOT_FOUND:
+                missing.append((event, key, fingerprint))
+            else:
+                self.stats.errors += 1
+                logger.warning(f"Event '{result['title']}' nicht aktualisiert: {result['error']}")
+        return missing
+
+    def _create_new(self, candidates: List[Tuple[Any, Optional[str], Optional[bytes]]], state_rows: List[Tuple]):
+        """Prüft Events gegen den Zielkalender und legt die neuen an"""
+        starts = [event_timestamp(event, 'start_ts', 'start_date', 0.0) for event, _, _ in candidates]
+        target_index = self._target(min(starts) - TARGET_MARGIN, max(starts) + TARGET_MARGIN + 1)
+        new_events = []
+        for event, key, fingerprint in candidates:
+            series = 'recurrence_rule' in event
+            match = target_index.match(event)
+            if match and series and self._target_series.get(match) != event['recurrence_rule']:
+                # Keine Serie mit gleicher Regel (z.B. eine alte Einzelkopie, die
+                # gelöscht wird) - die Serie wird neu angelegt
+                match = None
+            elif match and self._is_exception(event) and match == self._series_targets.get(series_key(event)):
+                # Das (noch vorhandene) ursprüngliche Vorkommen der Ziel-Serie
+                match = None
+            if match is None:
+                new_events.append((event, key, fingerprint))
+                continue
+            self.stats.duplicates += 1
+            if match and series:
+                self._series_targets[key] = match
+            if match and key:
+                # Bereits vorhandenes Ziel-Event übernehmen
+                state_rows.append((key, match, fingerprint, event_timestamp(event, 'start_ts', 'start_date')))
+
+        if not new_events:
+            return
+
+        results = self.client.save_events(self.target_calendar, [event for event, _, _ in new_events])
+        for (event, key, fingerprint), result in zip(new_events, results):
+            if result['success']:
+                self.stats.created += 1
+                target_id = result.get('target_id')
+                if 'recurrence_rule' in event:
+                    self._series_targets[key] = target_id
+                elif self._is_exception(event):
+                    self._exceptions.append((series_key(event), event.occurrence_ts))
+                if key and target_id:
+                    state_rows.append((key, target_id, fingerprint, event_timestamp(event, 'start_ts', 'start_date')))
+            else:
+                self.stats.errors += 1
+                logger.warning(f"Event '{result['title']}' übersprungen: {result['error']}")
+
+        logger.info(f"📊 Fortschritt: {self.stats.source} Quell-Events geprüft, {self.stats.created} erstellt")
+
+    def _propagate_deletions(self, lower: float, upper: float):
+        """Löscht Ziel-Events, deren Quell-Event im Sync-Zeitraum nicht mehr existiert"""
+        expected = [key for key, mapping in self.mappings.items() if lower <= mapping.source_start_ts < upper]
+        removed = set(expected).difference(self._seen)
+        # Einzelkopien von Vorkommen, deren Serie jetzt als Ganzes übertragen wird
+        replaced = {key for key in removed if f"{key.rpartition('@')[0]}@series" in self._seen}
+        if not removed:
+            return
+        if not self.stats.source:
+            # Eine leere Quelle ist eher ein Ladefehler als ein geleerter Kalender
+            self.stats.deletion_aborted = True
+            logger.warning(f"⚠️ Löschabgleich abgebrochen: '{self.source_calendar}' lieferte keine Events, "
+                           f"{len(expected)} Zuordnungen bleiben bestehen")
+            return
+
+        missing, synced = len(removed) - len(replaced), len(expected) - len(replaced)
+        limit = self.max_delete_fraction * synced
+        if missing < synced:
+            limit = max(DELETE_FLOOR, limit)
+        if missing > limit:
+            self.stats.deletion_aborted = True
+            logger.warning(f"⚠️ Löschabgleich abgebrochen: {missing} von {synced} synchronisierten Events fehlen in "
+                           f"'{self.source_calendar}' (Grenze {int(limit)})")
+            removed = replaced
+            if not removed:
+                return
+
+        keys = list(removed)
+        if replaced:
+            logger.info(f"🔁 {len(replaced)} Einzelkopien durch Serien ersetzt")
+        logger.info(f"🗑️ {len(keys) - len(replaced)} Events wurden in der Quelle gelöscht")
+        forgotten = []
+        if self.progress is not None:
+            self.progress.start("Löschabgleich", len(keys))
+        for chunk in chunked(keys, self.client.batch_size):
+            if is_cancelled(self.cancel):
+                self.stats.cancelled = True
+                logger.info(f"⏹️ Löschabgleich nach {self.stats.deleted} gelöschten Events abgebrochen")
+                break
+            results = self.client.delete_events(
+                self.target_calendar,
+                [{'id': self.mappings[key].target_id, 'whole_series': key.endswith('@series')} for key in chunk]
+            )
+            for key, result in zip(chunk, results):
+                if result['success']:
+                    self.stats.deleted += 1
+                    forgotten.append(key)
+                elif result['error'] == EVENT_NOT_FOUND:
+                    # Ziel-Event existiert schon nicht mehr
+                    forgotten.append(key)
+                else:
+                    self.stats.errors += 1
+                    logger.warning(f"Ziel-Event {result['id']} nicht gelöscht: {result['error']}")
+            if self.progress is not None:
+                self.progress.advance(len(chunk))
+        if self.progress is not None:
+            self.progress.finish(not self.stats.cancelled)
+        self.state.delete_mappings(self.source_calendar, self.target_calendar, forgotten)
+
+    def _target(self, lower: float, upper: float) -> DuplicateIndex:
+        """
+        Duplikat-Index über den Zielkalender für Starts in [lower, upper)
+
+        Erst bei Bedarf geladen; spätere Blöcke laden nur die noch
+        fehlenden Ränder nach (der geladene Bereich bleibt zusammenhängend).
+        Nach vorne wird mindestens TARGET_STEP geladen, damit nicht jeder
+        Block eine eigene Abfrage kostet.
+        """
+        if self._target_index is None:
+            self._target_index = DuplicateIndex((), self.check_mode)
+            upper = max(upper, lower + TARGET_STEP)
+            missing = [(lower, upper)]
+        else:
+            loaded_lower, loaded_upper = self._target_range
+            missing = []
+            if lower < loaded_lower:
+                missing.append((lower, loaded_lower))
+            if upper > loaded_upper:
+                upper = max(upper, loaded_upper + TARGET_STEP)
+                missing.append((loaded_upper, upper))
+            lower, upper = min(lower, loaded_lower), max(upper, loaded_upper)
+        self._target_range = (lower, upper)
+
+        for range_lower, range_upper in missing:
+            start_date, end_date = datetime.fromtimestamp(range_lower), datetime.fromtimestamp(range_upper)
+            logger.info(f"🔍 Lade Ziel-Events {start_date:%d.%m.%Y} - {end_date:%d.%m.%Y}...")
+            events = self.client.iter_events(self.target_calendar, fields=series_check_fields(self.check_mode),
+                                             date_range=(start_date, end_date))
+            for event in events:
+                # Events, die vor dem Bereich beginnen, liegen bereits im Index (oder außerhalb)
+                if event.start_ts >= range_lower:
+                    self._target_index.add(event)
+                    if in_series(event):
+                        self._target_series[event.id] = event.recurrence
+        return self._target_index
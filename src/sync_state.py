@@ -0,0 +1,203 @@
+"""
+Persistenter Sync-Status (SQLite)
+
+Speichert pro Kalenderpaar (Quelle → Ziel), welches Ziel-Event zu
+welchem Quell-Event angelegt wurde, samt Inhalts-Fingerprint. Ein
+erneuter Sync überspringt unveränderte Events per Schlüssel-Lookup und
+muss den Zielkalender nur noch laden, wenn es tatsächlich neue oder
+geänderte Events gibt.
+
+Zusätzlich merkt sich ein Cursor pro Kalenderpaar, bis wann der
+Zeitraum vollständig abgeglichen ist - geplante Syncs laden danach nur
+noch den Rest (siehe sync_engine.SyncRun).
+
+Die Datenbank läuft im WAL-Modus; Zuordnungen werden pro Batch mit
+einem executemany in einer Transaktion geschrieben.
+"""
+
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import List, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+APP_DIRECTORY = 'Kalender Sync Ultra'
+STATE_FILENAME = 'sync_state.db'
+
+_SCHEMA = ("""
+CREATE TABLE IF NOT EXISTS event_mapping (
+    source_calendar TEXT NOT NULL,
+    target_calendar TEXT NOT NULL,
+    source_key TEXT NOT NULL,
+    target_id TEXT NOT NULL,
+    fingerprint BLOB NOT NULL,
+    source_start_ts REAL NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (source_calendar, target_calendar, source_key)
+) WITHOUT ROWID
+""", """
+CREATE TABLE IF NOT EXISTS sync_cursor (
+    source_calendar TEXT NOT NULL,
+    target_calendar TEXT NOT NULL,
+    reconciled_from REAL NOT NULL,
+    reconciled_until REAL NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (source_calendar, target_calendar)
+) WITHOUT ROWID
+""")
+
+_UPSERT = """
+INSERT INTO event_mapping
+    (source_calendar, target_calendar, source_key, target_id, fingerprint, source_start_ts, synced_at)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (source_calendar, target_calendar, source_key) DO UPDATE SET
+    target_id = excluded.target_id,
+    fingerprint = excluded.fingerprint,
+    source_start_ts = excluded.source_start_ts,
+    synced_at = excluded.synced_at
+"""
+
+
+def default_state_path() -> str:
+    """Pfad der Datenbank im Anwendungsverzeichnis des Benutzers"""
+    if sys.platform == 'darwin':
+        base = os.path.join(os.path.expanduser('~'), 'Library', 'Application Support', APP_DIRECTORY)
+    else:
+        base = os.path.join(os.path.expanduser('~'), '.kalender_sync')
+    return os.path.join(base, STATE_FILENAME)
+
+
+class SyncMapping:
+    """Eine gespeicherte Zuordnung Quell-Event → Ziel-Event"""
+
+    __slots__ = ('target_id', 'fingerprint', 'source_start_ts')
+
+    def __init__(self, target_id: str, fingerprint: bytes, source_start_ts: float):
+        self.target_id = target_id
+        self.fingerprint = fingerprint
+        self.source_start_ts = source_start_ts
+
+
+class SyncStateStore:
+    """
+    Zuordnungstabelle Quell-Event → Ziel-Event pro Kalenderpaar
+
+    Die Verbindung wird von mehreren Threads (GUI, Sync-Worker) genutzt
+    und ist daher mit einem Lock geschützt.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: Datenbankdatei (Standard: default_state_path(), ':memory:' für Tests)
+        """
+        self.path = path or default_state_path()
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            for statement in _SCHEMA:
+                self._connection.execute(statement)
+        logger.info(f"📒 Sync-Status: {self.path}")
+
+    def load_mappings(self, source_calendar: str, target_calendar: str) -> Dict[str, SyncMapping]:
+        """Alle Zuordnungen eines Kalenderpaars (ein Index-Bereichsscan)"""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT source_key, target_id, fingerprint, source_start_ts FROM event_mapping "
+                "WHERE source_calendar = ? AND target_calendar = ?",
+                (source_calendar, target_calendar)
+            ).fetchall()
+        return {key: SyncMapping(target_id, fingerprint, start_ts) for key, target_id, fingerprint, start_ts in rows}
+
+    def upsert_mappings(self, source_calendar: str, target_calendar: str,
+                        rows: Iterable[Tuple[str, str, bytes, float]]):
+        """
+        Speichert Zuordnungen in einer Transaktion
+
+        Args:
+            rows: (source_key, target_id, fingerprint, source_start_ts)
+        """
+        now = time.time()
+        parameters = [
+            (source_calendar, target_calendar, key, target_id, fingerprint, start_ts, now)
+            for key, target_id, fingerprint, start_ts in rows
+        ]
+        if not parameters:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany(_UPSERT, parameters)
+
+    def delete_mappings(self, source_calendar: str, target_calendar: str, source_keys: List[str]):
+        """Entfernt Zuordnungen, z.B. nachdem das Ziel-Event gelöscht wurde"""
+        if not source_keys:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM event_mapping WHERE source_calendar = ? AND target_calendar = ? AND source_key = ?",
+                [(source_calendar, target_calendar, key) for key in source_keys]
+            )
+
+    def update_positions(self, source_calendar: str, target_calendar: str, positions: Iterable[Tuple[str, float]]):
+        """
+        Aktualisiert nur die gemerkten Startzeiten bestehender Zuordnungen
+
+        Args:
+            positions: (source_key, source_start_ts)
+        """
+        parameters = [(start_ts, source_calendar, target_calendar, key) for key, start_ts in positions]
+        if not parameters:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "UPDATE event_mapping SET source_start_ts = ? "
+                "WHERE source_calendar = ? AND target_calendar = ? AND source_key = ?",
+                parameters
+            )
+
+    def load_cursor(self, source_calendar: str, target_calendar: str) -> Optional[Tuple[float, float]]:
+        """
+        Bereits abgeglichener Zeitraum eines Kalenderpaars
+
+        Returns:
+            (reconciled_from, reconciled_until) in Epoch-Sekunden oder None
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT reconciled_from, reconciled_until FROM sync_cursor "
+                "WHERE source_calendar = ? AND target_calendar = ?",
+                (source_calendar, target_calendar)
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def save_cursor(self, source_calendar: str, target_calendar: str, reconciled_from: float,
+                    reconciled_until: float):
+        """Merkt sich den abgeglichenen Zeitraum nach einem erfolgreichen Sync"""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sync_cursor "
+                "(source_calendar, target_calendar, reconciled_from, reconciled_until, synced_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (source_calendar, target_calendar, reconciled_from, reconciled_until, time.time())
+            )
+
+    def clear(self, source_calendar: str, target_calendar: str):
+        """Vergisst alle Zuordnungen und den Cursor eines Kalenderpaars"""
+        with self._lock, self._connection:
+            for table in ('event_mapping', 'sync_cursor'):
+                self._connection.execute(
+                    f"DELETE FROM {table} WHERE source_calendar = ? AND target_calendar = ?",
+                    (source_calendar, target_calendar)
+                )
+
+    def close(self):
+        with self._lock:
+            self._connection.close()